@@ -3,15 +3,34 @@ Methods for abstract circuits independent of nodes, edges and contractions
 """
 # pylint: disable=invalid-name
 
-from typing import Any, Callable, Dict, List, Optional, Sequence, Union, Tuple
-from functools import reduce
-from operator import add
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    Tuple,
+)
+from collections import Counter
+from functools import lru_cache
 import json
 import logging
+import sys
 
 import numpy as np
 import tensornetwork as tn
 
+try:
+    import orjson
+
+    orjson_installed = True
+except ImportError:
+    orjson_installed = False
+
 from . import gates
 from .cons import backend, dtypestr
 from .vis import qir2tex
@@ -61,14 +80,248 @@ gate_aliases = [
     ["sd", "sdg"],
     ["td", "tdg"],
 ]
+_ALIAS_MAP = {g2: g1 for g1, g2 in gate_aliases}
+_KNOWN_GATES = frozenset(sgates) | frozenset(vgates) | frozenset(mpogates)
+
+
+def _json_loads(s: str) -> Any:
+    if orjson_installed:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+_HALF_PI = np.pi / 2
+_QUARTER_PI = np.pi / 4
+
+
+def _qsim_token(x: str) -> Union[str, int, float]:
+    if x.lstrip("-").isdigit():
+        return int(x)
+    try:
+        return float(x)
+    except ValueError:
+        return x.lower()
+
+
+def _qsim_fsim(c: Any, gate: Sequence[Any]) -> None:
+    i, j, theta, phi = gate[2:]
+    getattr(c, "ISWAP")(i, j, theta=-theta)
+    getattr(c, "CPHASE")(i, j, theta=-phi)
+
+
+# qsim gate token -> function applying the gate line on the circuit
+_QSIM_DISPATCH: Dict[str, Callable[[Any, Sequence[Any]], None]] = {
+    "h": lambda c, g: getattr(c, "H")(g[2]),
+    "x": lambda c, g: getattr(c, "X")(g[2]),
+    "y": lambda c, g: getattr(c, "Y")(g[2]),
+    "z": lambda c, g: getattr(c, "Z")(g[2]),
+    "s": lambda c, g: getattr(c, "PHASE")(g[2], theta=_HALF_PI),
+    "t": lambda c, g: getattr(c, "PHASE")(g[2], theta=_QUARTER_PI),
+    "x_1_2": lambda c, g: getattr(c, "RX")(g[2], theta=_HALF_PI),
+    "y_1_2": lambda c, g: getattr(c, "RY")(g[2], theta=_HALF_PI),
+    "z_1_2": lambda c, g: getattr(c, "RZ")(g[2], theta=_HALF_PI),
+    "w_1_2": lambda c, g: getattr(c, "U")(
+        g[2], theta=_HALF_PI, phi=-_QUARTER_PI, lbd=_QUARTER_PI
+    ),
+    "hz_1_2": lambda c, g: getattr(c, "WROOT")(g[2]),
+    "cnot": lambda c, g: getattr(c, "CNOT")(g[2], g[3]),
+    "cx": lambda c, g: getattr(c, "CX")(g[2], g[3]),
+    "cy": lambda c, g: getattr(c, "CY")(g[2], g[3]),
+    "cz": lambda c, g: getattr(c, "CZ")(g[2], g[3]),
+    "is": lambda c, g: getattr(c, "ISWAP")(g[2], g[3]),
+    "iswap": lambda c, g: getattr(c, "ISWAP")(g[2], g[3]),
+    "rx": lambda c, g: getattr(c, "RX")(g[2], theta=g[3]),
+    "ry": lambda c, g: getattr(c, "RY")(g[2], theta=g[3]),
+    "rz": lambda c, g: getattr(c, "RZ")(g[2], theta=g[3]),
+    "fs": _qsim_fsim,
+    "fsim": _qsim_fsim,
+}
+
+
+@lru_cache()
+def _sgate_doc(g: str) -> str:
+    """
+    Render the docstring (with the LaTeX matrix) of static gate ``g``,
+    cached so that every circuit class registering the gate shares one rendering.
+    """
+    matrix = gates.matrix_for_gate(getattr(gates, g)())
+    matrix = gates.bmatrix(matrix)
+    doc = """
+    Apply **%s** gate on the circuit.
+    See :py:meth:`tensorcircuit.gates.%s_gate`.
+
+
+    :param index: Qubit number that the gate applies on.
+        The matrix for the gate is
+
+        .. math::
+
+              %s
+
+    :type index: int.
+    """ % (
+        g.upper(),
+        g,
+        matrix,
+    )
+    return doc
+
+
+class QIRStore(Sequence[Dict[str, Any]]):
+    """
+    Columnar storage for the quantum intermediate representation of a circuit.
+    Gate metadata is kept in parallel lists (one entry per gate) instead of one dict per gate,
+    the familiar gate dict is only materialized when the store is indexed or iterated.
+
+    :Example:
+
+    >>> c = tc.Circuit(2)
+    >>> c.H(0)
+    >>> c.rx(1, theta=0.2)
+    >>> qir = c.to_qir()
+    >>> qir.names
+    ['h', 'rx']
+    >>> qir[1]["parameters"]
+    {'theta': 0.2}
+    """
+
+    _keys = frozenset(["gatef", "gate", "index", "name", "split", "mpo", "parameters"])
+
+    def __init__(self, qir: Optional[Iterable[Dict[str, Any]]] = None) -> None:
+        self.names: List[str] = []
+        self.gatefs: List[Optional[Callable[..., Any]]] = []
+        self.gates: List[Any] = []
+        self.indices: List[Tuple[int, ...]] = []
+        self.params: List[Optional[Dict[str, Any]]] = []
+        self.mpo = bytearray()
+        self.splits: List[Optional[Dict[str, Any]]] = []
+        # keys beyond the standard ones above, None for almost all gates
+        self.extras: List[Optional[Dict[str, Any]]] = []
+        # running gate count by name, kept in sync with ``names``
+        self.name_counter: Counter[str] = Counter()
+        # largest qubit index seen so far (0 for an empty store)
+        self.max_index = 0
+        # results derived from the whole qir (e.g. translations), tagged with
+        # the store length they were computed at, the store is append only
+        self.cache: Dict[Any, Tuple[int, Any]] = {}
+        self._index_pool: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
+        if qir is not None:
+            self.extend(qir)
+
+    def add(
+        self,
+        gate: Any,
+        index: Tuple[int, ...],
+        name: str,
+        split: Optional[Dict[str, Any]] = None,
+        mpo: bool = False,
+        ir_dict: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Record one gate application, ``gatef``, ``parameters`` and any other keys
+        are taken from ``ir_dict`` if provided.
+        """
+        name = sys.intern(name)
+        self.names.append(name)
+        self.name_counter[name] += 1
+        self.gates.append(gate)
+        index = tuple(index)
+        # circuits reuse few distinct qubit tuples, share one object per tuple
+        index = self._index_pool.setdefault(index, index)
+        self.indices.append(index)
+        if index:
+            self.max_index = max(self.max_index, *index)
+        self.splits.append(split)
+        self.mpo.append(1 if mpo else 0)
+        if ir_dict is None:
+            self.gatefs.append(None)
+            self.params.append(None)
+            self.extras.append(None)
+        else:
+            self.gatefs.append(ir_dict.get("gatef", None))
+            self.params.append(ir_dict.get("parameters", None))
+            if self._keys.issuperset(ir_dict):
+                self.extras.append(None)
+            else:
+                self.extras.append(
+                    {k: v for k, v in ir_dict.items() if k not in self._keys}
+                )
+
+    def append(self, d: Dict[str, Any]) -> None:
+        self.add(
+            d.get("gate", None),
+            d["index"],
+            d["name"],
+            split=d.get("split", None),
+            mpo=d.get("mpo", False),
+            ir_dict=d,
+        )
+
+    def extend(self, qir: Iterable[Dict[str, Any]]) -> None:
+        for d in qir:
+            self.append(d)
+
+    def _materialize(self, i: int) -> Dict[str, Any]:
+        d: Dict[str, Any] = {}
+        gatef = self.gatefs[i]
+        if gatef is not None:
+            d["gatef"] = gatef
+        gate = self.gates[i]
+        if gate is not None:
+            d["gate"] = gate
+        d["index"] = self.indices[i]
+        d["name"] = self.names[i]
+        d["split"] = self.splits[i]
+        d["mpo"] = bool(self.mpo[i])
+        params = self.params[i]
+        if params is not None:
+            d["parameters"] = params
+        extra = self.extras[i]
+        if extra:
+            d.update(extra)
+        return d
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self._materialize(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("qir index out of range")
+        return self._materialize(i)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(len(self)):
+            yield self._materialize(i)
+
+    def __reversed__(self) -> Iterator[Dict[str, Any]]:
+        for i in reversed(range(len(self))):
+            yield self._materialize(i)
+
+    def __add__(self, other: Iterable[Dict[str, Any]]) -> "QIRStore":
+        new = QIRStore(self)
+        new.extend(other)
+        return new
+
+    def __radd__(self, other: Iterable[Dict[str, Any]]) -> "QIRStore":
+        new = QIRStore(other)
+        new.extend(self)
+        return new
+
+    def __repr__(self) -> str:
+        return repr(list(self))
 
 
 class AbstractCircuit:
     _nqubits: int
-    _qir: List[Dict[str, Any]]
+    _qir: QIRStore
     inputs: Tensor
     circuit_param: Dict[str, Any]
     is_mps: bool
+    _meta_applied: bool
 
     sgates = sgates
     vgates = vgates
@@ -85,7 +338,7 @@ class AbstractCircuit:
         ir_dict: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
-        An implementation of this method should also append gate directionary to self._qir
+        An implementation of this method should also record the gate in self._qir
         """
         raise NotImplementedError
 
@@ -99,14 +352,8 @@ class AbstractCircuit:
             name = getattr(gatef, "n")
 
         def apply(self: "AbstractCircuit", *index: int, **vars: Any) -> None:
-            split = None
-            localname = name
-            if "name" in vars:
-                localname = vars["name"]
-                del vars["name"]
-            if "split" in vars:
-                split = vars["split"]
-                del vars["split"]
+            localname = vars.pop("name", name)
+            split = vars.pop("split", None)
             gate_dict = {
                 "gatef": gatef,
                 "index": index,
@@ -172,43 +419,17 @@ class AbstractCircuit:
         """
         The registration of gate methods on circuit class using reflection mechanism
         """
+        if cls.__dict__.get("_meta_applied", False):
+            return
+        gate_impls = {g: getattr(gates, g) for g in sgates + vgates + mpogates}
         for g in sgates:
-            setattr(
-                cls, g, cls.apply_general_gate_delayed(gatef=getattr(gates, g), name=g)
-            )
+            setattr(cls, g, cls.apply_general_gate_delayed(gatef=gate_impls[g], name=g))
             setattr(
                 cls,
                 g.upper(),
-                cls.apply_general_gate_delayed(gatef=getattr(gates, g), name=g),
+                cls.apply_general_gate_delayed(gatef=gate_impls[g], name=g),
             )
-            matrix = gates.matrix_for_gate(getattr(gates, g)())
-            matrix = gates.bmatrix(matrix)
-            doc = """
-            Apply **%s** gate on the circuit.
-            See :py:meth:`tensorcircuit.gates.%s_gate`.
-
-
-            :param index: Qubit number that the gate applies on.
-                The matrix for the gate is
-
-                .. math::
-
-                      %s
-
-            :type index: int.
-            """ % (
-                g.upper(),
-                g,
-                matrix,
-            )
-            # docs = """
-            # Apply **%s** gate on the circuit.
-
-            # :param index: Qubit number that the gate applies on.
-            # :type index: int.
-            # """ % (
-            #     g.upper()
-            # )
+            doc = _sgate_doc(g)
             getattr(cls, g).__doc__ = doc
             getattr(cls, g.upper()).__doc__ = doc
 
@@ -216,16 +437,12 @@ class AbstractCircuit:
             setattr(
                 cls,
                 g,
-                cls.apply_general_variable_gate_delayed(
-                    gatef=getattr(gates, g), name=g
-                ),
+                cls.apply_general_variable_gate_delayed(gatef=gate_impls[g], name=g),
             )
             setattr(
                 cls,
                 g.upper(),
-                cls.apply_general_variable_gate_delayed(
-                    gatef=getattr(gates, g), name=g
-                ),
+                cls.apply_general_variable_gate_delayed(gatef=gate_impls[g], name=g),
             )
             doc = """
             Apply **%s** gate with parameters on the circuit.
@@ -248,14 +465,14 @@ class AbstractCircuit:
                 cls,
                 g,
                 cls.apply_general_variable_gate_delayed(
-                    gatef=getattr(gates, g), name=g, mpo=True
+                    gatef=gate_impls[g], name=g, mpo=True
                 ),
             )
             setattr(
                 cls,
                 g.upper(),
                 cls.apply_general_variable_gate_delayed(
-                    gatef=getattr(gates, g), name=g, mpo=True
+                    gatef=gate_impls[g], name=g, mpo=True
                 ),
             )
             doc = """
@@ -278,7 +495,9 @@ class AbstractCircuit:
             for alias_gate in gate_alias[1:]:
                 setattr(cls, alias_gate, getattr(cls, present_gate))
 
-    def to_qir(self) -> List[Dict[str, Any]]:
+        cls._meta_applied = True
+
+    def to_qir(self) -> QIRStore:
         """
         Return the quantum intermediate representation of the circuit.
 
@@ -311,14 +530,17 @@ class AbstractCircuit:
                     Edge('cnot'[3] -> 'qb-2'[0] )
                 ]), 'index': (0, 1), 'name': 'cnot', 'split': None, 'mpo': False}]
 
-        :return: The quantum intermediate representation of the circuit.
-        :rtype: List[Dict[str, Any]]
+        :return: The quantum intermediate representation of the circuit,
+            a sequence of gate dicts backed by columnar storage.
+        :rtype: QIRStore
         """
         return self._qir
 
     @classmethod
     def from_qir(
-        cls, qir: List[Dict[str, Any]], circuit_params: Optional[Dict[str, Any]] = None
+        cls,
+        qir: Sequence[Dict[str, Any]],
+        circuit_params: Optional[Dict[str, Any]] = None,
     ) -> "AbstractCircuit":
         """
         Restore the circuit from the quantum intermediate representation.
@@ -342,7 +564,7 @@ class AbstractCircuit:
         array(0.764842+0.j, dtype=complex64)
 
         :param qir: The quantum intermediate representation of a circuit.
-        :type qir: List[Dict[str, Any]]
+        :type qir: Sequence[Dict[str, Any]]
         :param circuit_params: Extra circuit parameters.
         :type circuit_params: Optional[Dict[str, Any]]
         :return: The circuit have same gates in the qir.
@@ -351,12 +573,11 @@ class AbstractCircuit:
         if circuit_params is None:
             circuit_params = {}
         if "nqubits" not in circuit_params:
-            nqubits = 0
-            for d in qir:
-                if max(d["index"]) > nqubits:
-                    nqubits = max(d["index"])
-            nqubits += 1
-            circuit_params["nqubits"] = nqubits
+            if isinstance(qir, QIRStore):
+                nqubits = qir.max_index
+            else:
+                nqubits = max((i for d in qir for i in d["index"]), default=0)
+            circuit_params["nqubits"] = max(nqubits, 0) + 1
 
         c = cls(**circuit_params)
         c = cls._apply_qir(c, qir)
@@ -364,17 +585,24 @@ class AbstractCircuit:
 
     @staticmethod
     def _apply_qir(
-        c: "AbstractCircuit", qir: List[Dict[str, Any]]
+        c: "AbstractCircuit", qir: Iterable[Dict[str, Any]]
     ) -> "AbstractCircuit":
         for d in qir:
-            if "parameters" not in d:
-                c.apply_general_gate_delayed(d["gatef"], d["name"], mpo=d["mpo"])(
-                    c, *d["index"], split=d["split"]
-                )
+            # apply directly instead of building a throwaway delayed closure per gate,
+            # ``d`` already carries ``gatef`` and ``parameters`` needed for the new record
+            params = d.get("parameters", None)
+            if params is None:
+                gate = d["gatef"]()
             else:
-                c.apply_general_variable_gate_delayed(
-                    d["gatef"], d["name"], mpo=d["mpo"]
-                )(c, *d["index"], **d["parameters"], split=d["split"])
+                gate = d["gatef"](**params)
+            c.apply_general_gate(
+                gate,
+                *d["index"],
+                name=d["name"],
+                split=d["split"],
+                mpo=d["mpo"],
+                ir_dict=d,
+            )
         return c
 
     def inverse(
@@ -401,19 +629,31 @@ class AbstractCircuit:
             circuit_params["nqubits"] = self._nqubits
 
         c = type(self)(**circuit_params)
-        for d in reversed(self._qir):
-            if "parameters" not in d:
-                self.apply_general_gate_delayed(
-                    d["gatef"].adjoint(), d["name"], mpo=d["mpo"]
-                )(c, *d["index"], split=d["split"])
+        qir = self._qir
+        # circuits are usually built from a handful of distinct gate functions
+        adjoints: Dict[Any, Any] = {}
+        for gatef, name, index, params, mpo, split in zip(
+            reversed(qir.gatefs),
+            reversed(qir.names),
+            reversed(qir.indices),
+            reversed(qir.params),
+            reversed(qir.mpo),
+            reversed(qir.splits),
+        ):
+            if gatef not in adjoints:
+                adjoints[gatef] = gatef.adjoint()  # type: ignore
+            if params is None:
+                self.apply_general_gate_delayed(adjoints[gatef], name, mpo=bool(mpo))(
+                    c, *index, split=split
+                )
             else:
                 self.apply_general_variable_gate_delayed(
-                    d["gatef"].adjoint(), d["name"], mpo=d["mpo"]
-                )(c, *d["index"], **d["parameters"], split=d["split"])
+                    adjoints[gatef], name, mpo=bool(mpo)
+                )(c, *index, **params, split=split)
 
         return c
 
-    def append_from_qir(self, qir: List[Dict[str, Any]]) -> None:
+    def append_from_qir(self, qir: Sequence[Dict[str, Any]]) -> None:
         """
         Apply the ciurict in form of quantum intermediate representation after the current cirucit.
 
@@ -433,7 +673,7 @@ class AbstractCircuit:
          {'gatef': cnot, 'gate': Gate(...), 'index': (0, 1), 'name': 'cnot', 'split': None, 'mpo': False}]
 
         :param qir: The quantum intermediate representation.
-        :type qir: List[Dict[str, Any]]
+        :type qir: Sequence[Dict[str, Any]]
         """
         self._apply_qir(self, qir)
 
@@ -448,11 +688,8 @@ class AbstractCircuit:
         :rtype: str
         """
         name = name.lower()
-        for g1, g2 in gate_aliases:
-            if name == g2:
-                name = g1
-                break
-        if name not in sgates + vgates + mpogates:
+        name = _ALIAS_MAP.get(name, name)
+        if name not in _KNOWN_GATES:
             logger.warning("gate name not in the common gate set that tc supported")
         return name
 
@@ -479,12 +716,9 @@ class AbstractCircuit:
         if gate_list is None:
             return len(self._qir)
         else:
-            gate_list = [self.standardize_gate(g) for g in gate_list]
-            c = 0
-            for d in self._qir:
-                if d["name"] in gate_list:
-                    c += 1
-            return c
+            gate_set = frozenset([self.standardize_gate(g) for g in gate_list])
+            counter = self._qir.name_counter
+            return sum(counter[g] for g in gate_set)
 
     def gate_summary(self) -> Dict[str, int]:
         """
@@ -493,10 +727,7 @@ class AbstractCircuit:
         :return: the gate count dict by gate type
         :rtype: Dict[str, int]
         """
-        summary: Dict[str, int] = {}
-        for d in self._qir:
-            summary[d["name"]] = summary.get(d["name"], 0) + 1
-        return summary
+        return dict(self._qir.name_counter)
 
     def to_qiskit(self) -> Any:
         """
@@ -509,6 +740,23 @@ class AbstractCircuit:
         qir = self.to_qir()
         return qir2qiskit(qir, n=self._nqubits)
 
+    def _qir_cached(self, key: Any, f: Callable[[], Any]) -> Any:
+        """
+        Return ``f()``, reusing the result computed for the same ``key``
+        as long as no gate has been added to the circuit since then.
+        """
+        cache = self._qir.cache
+        version = len(self._qir)
+        if key in cache and cache[key][0] == version:
+            return cache[key][1]
+        r = f()
+        cache[key] = (version, r)
+        return r
+
+    def _to_qiskit_cached(self) -> Any:
+        # internal read-only usage, ``to_qiskit`` still returns a fresh object
+        return self._qir_cached("qiskit", self.to_qiskit)
+
     def to_openqasm(self, **kws: Any) -> str:
         """
         transform circuit to openqasm via qiskit circuit,
@@ -518,7 +766,7 @@ class AbstractCircuit:
         :return: circuit representation in openqasm format
         :rtype: str
         """
-        return self.to_qiskit().qasm(**kws)  # type: ignore
+        return self._to_qiskit_cached().qasm(**kws)  # type: ignore
 
     @classmethod
     def from_openqasm(
@@ -559,7 +807,7 @@ class AbstractCircuit:
         q_2: ┤ X ├─────
              └───┘
         """
-        return self.to_qiskit().draw(**kws)
+        return self._to_qiskit_cached().draw(**kws)
 
     @classmethod
     def from_qiskit(
@@ -611,7 +859,10 @@ class AbstractCircuit:
         else:
             okws = {"init": None}  # type: ignore
         okws.update(kws)
-        return qir2tex(self._qir, self._nqubits, **okws)  # type: ignore
+        return self._qir_cached(  # type: ignore
+            ("tex", repr(sorted(okws.items()))),
+            lambda: qir2tex(self._qir, self._nqubits, **okws),  # type: ignore
+        )
 
     tex = vis_tex
 
@@ -630,93 +881,156 @@ class AbstractCircuit:
         from .translation import qir2json
 
         tcqasm = qir2json(self.to_qir(), simplified=simplified)
+        # serialize only once, shared by the file and the returned str
+        if orjson_installed:
+            jsonstr = orjson.dumps(tcqasm, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        else:
+            jsonstr = json.dumps(tcqasm)
         if file is not None:
             with open(file, "w") as f:
-                json.dump(tcqasm, f)
-        return json.dumps(tcqasm)
+                f.write(jsonstr)
+        return jsonstr
+
+    def to_json_soa(self, file: Optional[str] = None) -> str:
+        """
+        circuit dumps to json in the columnar layout of :py:class:`QIRStore`,
+        the gate columns are dumped as they are without building one dict per gate,
+        only gate parameters are converted to json compatible real and imaginary lists.
+
+        :Example:
+
+        >>> c = tc.Circuit(2)
+        >>> c.H(0)
+        >>> c.rx(1, theta=0.2)
+        >>> s = c.to_json_soa()
+        >>> c2 = tc.Circuit.from_json_soa(s)
+
+        :param file: file str to dump the json to, defaults to None, return the json str
+        :type file: Optional[str], optional
+        :raises ValueError: The circuit contains a gate not available in ``tc.gates``.
+        :return: the json str
+        :rtype: str
+        """
+        from .translation import tensor_to_json
+
+        qir = self._qir
+        gatefs = []
+        for f, name in zip(qir.gatefs, qir.names):
+            fn = getattr(f, "n", None)
+            if fn is None or getattr(gates, fn, None) is None:
+                raise ValueError(
+                    "Gate '%s' can not be dumped to json, it is not in `tc.gates`"
+                    % name
+                )
+            gatefs.append(fn)
+        tcqasm = {
+            "version": 1,
+            "nqubits": self._nqubits,
+            "gatefs": gatefs,
+            "names": qir.names,
+            "indices": qir.indices,
+            "params": [
+                None if p is None else {k: tensor_to_json(v) for k, v in p.items()}
+                for p in qir.params
+            ],
+            "mpo": list(qir.mpo),
+            "splits": qir.splits,
+        }
+        if orjson_installed:
+            jsonstr = orjson.dumps(tcqasm, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        else:
+            jsonstr = json.dumps(tcqasm)
+        if file is not None:
+            with open(file, "w") as f:
+                f.write(jsonstr)
+        return jsonstr
 
     @classmethod
-    def from_qsim_file(
-        cls, file: str, circuit_params: Optional[Dict[str, Any]] = None
+    def from_json_soa(
+        cls, jsonstr: Any, circuit_params: Optional[Dict[str, Any]] = None
     ) -> "AbstractCircuit":
-        with open(file, "r") as f:
-            lines = f.readlines()
+        """
+        load the columnar json str dumped by :py:meth:`to_json_soa` as a circuit
+
+        :param jsonstr: json str or the already loaded dict
+        :type jsonstr: Any
+        :param circuit_params: Extra circuit parameters in the format of ``__init__``,
+            defaults to None
+        :type circuit_params: Optional[Dict[str, Any]], optional
+        :raises ValueError: The json refers to a gate not available in ``tc.gates``.
+        :return: the restored circuit
+        :rtype: AbstractCircuit
+        """
+        from .translation import json_to_tensor
+
+        if isinstance(jsonstr, str):
+            jsonstr = _json_loads(jsonstr)
         if circuit_params is None:
             circuit_params = {}
         if "nqubits" not in circuit_params:
-            circuit_params["nqubits"] = int(lines[0])
-
+            circuit_params["nqubits"] = jsonstr["nqubits"]
         c = cls(**circuit_params)
-        c = cls._apply_qsim(c, lines)
+
+        def qir() -> Iterator[Dict[str, Any]]:
+            for fn, name, index, params, mpo, split in zip(
+                jsonstr["gatefs"],
+                jsonstr["names"],
+                jsonstr["indices"],
+                jsonstr["params"],
+                jsonstr["mpo"],
+                jsonstr["splits"],
+            ):
+                gatef = getattr(gates, fn, None)
+                if gatef is None:
+                    raise ValueError("Unknown gate '%s' in json" % fn)
+                d = {
+                    "gatef": gatef,
+                    "index": tuple(index),
+                    "name": name,
+                    "split": split,
+                    "mpo": bool(mpo),
+                }
+                if params is not None:
+                    d["parameters"] = {k: json_to_tensor(v) for k, v in params.items()}
+                yield d
+
+        return cls._apply_qir(c, qir())
+
+    @classmethod
+    def from_qsim_file(
+        cls, file: str, circuit_params: Optional[Dict[str, Any]] = None
+    ) -> "AbstractCircuit":
+        with open(file, "r") as f:
+            header = f.readline()
+            if circuit_params is None:
+                circuit_params = {}
+            if "nqubits" not in circuit_params:
+                circuit_params["nqubits"] = int(header)
+
+            c = cls(**circuit_params)
+            c = cls._apply_qsim(c, f)
         return c
 
     @staticmethod
-    def _apply_qsim(c: "AbstractCircuit", qsim_str: List[str]) -> "AbstractCircuit":
-        def _convert_ints_and_floats(x: str) -> Union[str, int, float]:
-            try:
-                return int(x)
-            except ValueError:
-                pass
-
-            try:
-                return float(x)
-            except ValueError:
-                pass
-
-            return x.lower()
-
-        qsim_gates = [
-            tuple(map(_convert_ints_and_floats, line.strip().split(" ")))
-            for line in qsim_str[1:]
-            if line
-        ]
+    def _apply_qsim(
+        c: "AbstractCircuit", qsim_lines: Iterable[str]
+    ) -> "AbstractCircuit":
+        """
+        Apply qsim gate lines (the header line with the qubit number excluded) on ``c``,
+        lines are parsed and applied one at a time so that a file object can be streamed.
+        """
         # https://github.com/quantumlib/qsim/blob/master/docs/input_format.md
         # https://github.com/jcmgray/quimb/blob/master/quimb/tensor/circuit.py#L241
-        for gate in qsim_gates:
-            if gate[1] == "h":
-                getattr(c, "H")(gate[2])
-            elif gate[1] == "x":
-                getattr(c, "X")(gate[2])
-            elif gate[1] == "y":
-                getattr(c, "Y")(gate[2])
-            elif gate[1] == "z":
-                getattr(c, "Z")(gate[2])
-            elif gate[1] == "s":
-                getattr(c, "PHASE")(gate[2], theta=np.pi / 2)
-            elif gate[1] == "t":
-                getattr(c, "PHASE")(gate[2], theta=np.pi / 4)
-            elif gate[1] == "x_1_2":
-                getattr(c, "RX")(gate[2], theta=np.pi / 2)
-            elif gate[1] == "y_1_2":
-                getattr(c, "RY")(gate[2], theta=np.pi / 2)
-            elif gate[1] == "z_1_2":
-                getattr(c, "RZ")(gate[2], theta=np.pi / 2)
-            elif gate[1] == "w_1_2":
-                getattr(c, "U")(gate[2], theta=np.pi / 2, phi=-np.pi / 4, lbd=np.pi / 4)
-            elif gate[1] == "hz_1_2":
-                getattr(c, "WROOT")(gate[2])
-            elif gate[1] == "cnot":
-                getattr(c, "CNOT")(gate[2], gate[3])
-            elif gate[1] == "cx":
-                getattr(c, "CX")(gate[2], gate[3])
-            elif gate[1] == "cy":
-                getattr(c, "CY")(gate[2], gate[3])
-            elif gate[1] == "cz":
-                getattr(c, "CZ")(gate[2], gate[3])
-            elif gate[1] == "is" or gate[1] == "iswap":
-                getattr(c, "ISWAP")(gate[2], gate[3])
-            elif gate[1] == "rx":
-                getattr(c, "RX")(gate[2], theta=gate[3])
-            elif gate[1] == "ry":
-                getattr(c, "RY")(gate[2], theta=gate[3])
-            elif gate[1] == "rz":
-                getattr(c, "RZ")(gate[2], theta=gate[3])
-            elif gate[1] == "fs" or gate[1] == "fsim":
-                i, j, theta, phi = gate[2:]
-                getattr(c, "ISWAP")(i, j, theta=-theta)  # type: ignore
-                getattr(c, "CPHASE")(i, j, theta=-phi)  # type: ignore
-            else:
+        for line in qsim_lines:
+            tokens = line.split()
+            if not tokens:
+                continue
+            handler = _QSIM_DISPATCH.get(tokens[1].lower())
+            if handler is None:
                 raise NotImplementedError
+            gate = [int(tokens[0]), tokens[1].lower()]
+            gate.extend([_qsim_token(t) for t in tokens[2:]])
+            handler(c, gate)
         return c
 
     @classmethod
@@ -737,7 +1051,7 @@ class AbstractCircuit:
         from .translation import json2qir
 
         if isinstance(jsonstr, str):
-            jsonstr = json.loads(jsonstr)
+            jsonstr = _json_loads(jsonstr)
         qir = json2qir(jsonstr)  # type: ignore
         return cls.from_qir(qir, circuit_params)
 
@@ -756,7 +1070,7 @@ class AbstractCircuit:
         :rtype: AbstractCircuit
         """
         with open(file, "r") as f:
-            jsonstr = json.load(f)
+            jsonstr = _json_loads(f.read())
         return cls.from_json(jsonstr, circuit_params)
 
     def select_gate(self, which: Tensor, kraus: Sequence[Gate], *index: int) -> None:
@@ -775,7 +1089,8 @@ class AbstractCircuit:
         l = len(kraus)
         r = backend.onehot(which, l)
         r = backend.cast(r, dtype=dtypestr)
-        tensor = reduce(add, [r[i] * kraus[i] for i in range(l)])
+        # contract the one-hot selector with the stacked candidates in one backend op
+        tensor = backend.tensordot(r, backend.stack(kraus), axes=1)
         self.any(*index, unitary=tensor)  # type: ignore
 
     conditional_gate = select_gate
@@ -825,15 +1140,15 @@ class AbstractCircuit:
         :return: The composed circuit
         :rtype: BaseCircuit
         """
-        qir1 = self.to_qir()
-        qir0 = c.to_qir()
-        newc = type(self).from_qir(qir0 + qir1, self.circuit_param)
+        newc = type(self)(**self.circuit_param)
+        self._apply_qir(newc, c.to_qir())
+        self._apply_qir(newc, self.to_qir())
         self.__dict__.update(newc.__dict__)
         return self
 
     def append(self, c: "AbstractCircuit") -> "AbstractCircuit":
         """
-        append circuit ``c`` before
+        append circuit ``c`` after
 
         :example:
 
@@ -856,10 +1171,9 @@ class AbstractCircuit:
         :return: The composed circuit
         :rtype: BaseCircuit
         """
-        qir1 = self.to_qir()
-        qir2 = c.to_qir()
-        newc = type(self).from_qir(qir1 + qir2, self.circuit_param)
-        self.__dict__.update(newc.__dict__)
+        # only the gates of ``c`` are applied on top of the existing state,
+        # iterating a ``QIRStore`` is bounded by its length at the start, so ``c`` can be ``self``
+        self._apply_qir(self, c.to_qir())
         return self
 
     def expectation(
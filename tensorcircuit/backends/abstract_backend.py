@@ -1189,8 +1189,10 @@ class ExtendedBackend:
         :return: SparseTensor in backend format
         :rtype: Tensor
         """
+        # int32 indices whenever they fit, halving the index memory
+        index_dtype = np.int32 if max(a.shape) < 2**31 else np.int64
         return self.coo_sparse_matrix(
-            indices=np.array([a.row, a.col]).T,
+            indices=np.stack([a.row, a.col], axis=1).astype(index_dtype, copy=False),
             values=a.data,
             shape=a.shape,
         )
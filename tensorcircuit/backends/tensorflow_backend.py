@@ -7,6 +7,7 @@ from functools import reduce, partial
 from operator import mul
 from typing import Any, Callable, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from scipy.sparse import coo_matrix
 import tensornetwork
 from tensornetwork.backends.tensorflow import tensorflow_backend
@@ -523,6 +524,14 @@ class TensorFlowBackend(tensorflow_backend.TensorFlowBackend, ExtendedBackend):
     ) -> Tensor:
         return tf.SparseTensor(indices=indices, values=values, dense_shape=shape)
 
+    def coo_sparse_matrix_from_numpy(self, a: Tensor) -> Tensor:
+        # tf.SparseTensor only takes int64 indices, build them directly
+        return self.coo_sparse_matrix(
+            indices=np.stack([a.row, a.col], axis=1).astype(np.int64, copy=False),
+            values=a.data,
+            shape=a.shape,
+        )
+
     def sparse_dense_matmul(
         self,
         sp_a: Tensor,
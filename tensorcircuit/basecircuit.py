@@ -21,7 +21,7 @@ from .quantum import (
     sample_bin2int,
     sample2all,
 )
-from .abstractcircuit import AbstractCircuit
+from .abstractcircuit import AbstractCircuit, QIRStore
 from .cons import npdtype, backend, dtypestr, contractor, rdtypestr
 from .simplify import _split_two_qubit_gate
 from .utils import arg_alias
@@ -124,18 +124,7 @@ class BaseCircuit(AbstractCircuit):
     ) -> None:
         if name is None:
             name = ""
-        gate_dict = {
-            "gate": gate,
-            "index": index,
-            "name": name,
-            "split": split,
-            "mpo": mpo,
-        }
-        if ir_dict is not None:
-            ir_dict.update(gate_dict)
-        else:
-            ir_dict = gate_dict
-        self._qir.append(ir_dict)
+        self._qir.add(gate, index, name, split=split, mpo=mpo, ir_dict=ir_dict)
         assert len(index) == len(set(index))
         index = tuple([i if i >= 0 else self._nqubits + i for i in index])
         noe = len(index)
@@ -314,7 +303,7 @@ class BaseCircuit(AbstractCircuit):
                 newdang[j] ^ newdang[j + nq]
         return nodes
 
-    def to_qir(self) -> List[Dict[str, Any]]:
+    def to_qir(self) -> QIRStore:
         """
         Return the quantum intermediate representation of the circuit.
 
@@ -347,8 +336,9 @@ class BaseCircuit(AbstractCircuit):
                     Edge('cnot'[3] -> 'qb-2'[0] )
                 ]), 'index': (0, 1), 'name': 'cnot', 'split': None, 'mpo': False}]
 
-        :return: The quantum intermediate representation of the circuit.
-        :rtype: List[Dict[str, Any]]
+        :return: The quantum intermediate representation of the circuit,
+            a sequence of gate dicts backed by columnar storage.
+        :rtype: QIRStore
         """
         return self._qir
 
@@ -15,6 +15,7 @@ from . import channels
 from .cons import backend, contractor, dtypestr, npdtype
 from .quantum import QuOperator, identity
 from .simplify import _full_light_cone_cancel
+from .abstractcircuit import QIRStore
 from .basecircuit import BaseCircuit
 
 Gate = gates.Gate
@@ -108,7 +109,7 @@ class Circuit(BaseCircuit):
 
         # self._qcode = ""  # deprecated
         # self._qcode += str(self._nqubits) + "\n"
-        self._qir: List[Dict[str, Any]] = []
+        self._qir = QIRStore()
 
     def replace_mps_inputs(self, mps_inputs: QuOperator) -> None:
         """
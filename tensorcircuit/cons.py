@@ -8,7 +8,17 @@ import sys
 from contextlib import contextmanager
 from functools import partial, reduce, wraps
 from operator import mul
-from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import numpy as np
 import opt_einsum
@@ -419,6 +429,71 @@ def tn_greedy_contractor(
     return final_node
 
 
+def linegraph_path(
+    input_sets: Sequence[Any],
+    output_set: Any,
+    size_dict: Dict[Any, int],
+    memory_limit: Optional[int] = None,
+) -> List[Tuple[int, int]]:
+    """
+    Contraction path from a tree decomposition of the line graph of the network
+    (vertices are the indices, two of them are adjacent if they meet on a tensor).
+    The indices are eliminated in a min-fill order and the tensors sharing
+    each eliminated index are contracted together, so that for networks of small
+    treewidth the path cost is bounded by the width of the decomposition.
+    It follows the ``opt_einsum`` path function signature and can be used as
+    ``set_contractor("linegraph")`` or as the optimizer of ``set_contractor("custom")``.
+
+    :param input_sets: The indices of each tensor.
+    :type input_sets: Sequence[Any]
+    :param output_set: The open indices.
+    :type output_set: Any
+    :param size_dict: The dimension of each index, not used by the min-fill heuristic.
+    :type size_dict: Dict[Any, int]
+    :param memory_limit: Not used, only for a consistent interface.
+    :type memory_limit: Optional[int], optional
+    :return: The contraction path in ``opt_einsum`` format.
+    :rtype: List[Tuple[int, int]]
+    """
+    operands = [set(s) for s in input_sets]
+    adj: Dict[Any, Set[Any]] = {}
+    for s in operands:
+        inner = [i for i in s if i not in output_set]
+        for i in inner:
+            adj.setdefault(i, set()).update(j for j in inner if j != i)
+
+    def fill_in(v: Any) -> int:
+        nb = list(adj[v])
+        return sum(1 for k, a in enumerate(nb) for b in nb[k + 1 :] if b not in adj[a])
+
+    order = []
+    while adj:
+        v = min(adj, key=fill_in)
+        nb = adj.pop(v)
+        for a in nb:
+            adj[a].discard(v)
+            adj[a].update(nb - {a})
+        order.append(v)
+
+    path = []
+
+    def merge(a: int, b: int) -> None:
+        new = operands[a] | operands[b]
+        rest = [s for k, s in enumerate(operands) if k not in (a, b)]
+        new = {i for i in new if i in output_set or any(i in s for s in rest)}
+        operands[:] = rest + [new]
+        path.append((a, b))
+
+    for v in order:
+        idx = [k for k, s in enumerate(operands) if v in s]
+        while len(idx) > 1:
+            merge(idx[0], idx[1])
+            idx = [k for k, s in enumerate(operands) if v in s]
+    while len(operands) > 1:  # disconnected components
+        merge(0, 1)
+    return path
+
+
 # base = tn.contractors.opt_einsum_paths.path_contractors.base
 # utils = tn.contractors.opt_einsum_paths.utils
 
@@ -722,7 +797,8 @@ def set_contractor(
     To set runtime contractor of the tensornetwork for a better contraction path.
     For more information on the usage of contractor, please refer to independent tutorial.
 
-    :param method: "auto", "greedy", "branch", "plain", "tng", "custom", "custom_stateful". defaults to None ("auto")
+    :param method: "auto", "greedy", "branch", "plain", "tng", "linegraph", "custom", "custom_stateful".
+        defaults to None ("auto")
     :type method: Optional[str], optional
     :param optimizer: Valid for "custom" or "custom_stateful" as method, defaults to None
     :type optimizer: Optional[Any], optional
@@ -738,6 +814,9 @@ def set_contractor(
         method = "greedy"
         # auto for small size fallbacks to dp, which has bug for now
         # see: https://github.com/dgasmith/opt_einsum/issues/172
+    if method == "linegraph":
+        method = "custom"
+        optimizer = linegraph_path
     if method == "plain":
         cf = plain_contractor
     elif method == "plain-experimental":
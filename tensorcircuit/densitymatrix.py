@@ -15,6 +15,7 @@ from . import channels
 from .channels import kraus_to_super_gate
 from .circuit import Circuit
 from .cons import backend, contractor, dtypestr
+from .abstractcircuit import QIRStore
 from .basecircuit import BaseCircuit
 from .quantum import QuOperator
 
@@ -127,7 +128,7 @@ class DMCircuit(BaseCircuit):
             "split": split,
         }
 
-        self._qir: List[Dict[str, Any]] = []
+        self._qir = QIRStore()
 
     def _double_nodes_front(self) -> None:
         lnodes, lfront = self.copy(self._nodes, self._front, conj=True)
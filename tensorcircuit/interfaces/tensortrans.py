@@ -81,6 +81,19 @@ def general_args_to_numpy(args: Any) -> Any:
     return backend.tree_map(tensor_to_numpy, args)
 
 
+def _tree_convert(
+    convert: Callable[[Any], Tensor], args: Any, dtype: Any, target_backend: Any
+) -> Any:
+    # conversion and cast of each leaf in one tree walk
+    if dtype is None:
+        return backend.tree_map(convert, args)
+    if isinstance(dtype, str):
+        return backend.tree_map(lambda a: target_backend.cast(convert(a), dtype), args)
+    return backend.tree_map(
+        lambda a, d: target_backend.cast(convert(a), d), args, dtype
+    )
+
+
 def numpy_args_to_backend(
     args: Any, dtype: Any = None, target_backend: Any = None
 ) -> Any:
@@ -103,40 +116,25 @@ def numpy_args_to_backend(
     elif isinstance(target_backend, str):
         target_backend = get_backend(target_backend)
 
-    if dtype is None:
-        return backend.tree_map(partial(numpy_to_tensor, backend=target_backend), args)
-    else:
-        if isinstance(dtype, str):
-            leaves, treedef = backend.tree_flatten(args)
-            dtype = [dtype for _ in range(len(leaves))]
-            dtype = backend.tree_unflatten(treedef, dtype)
-        t = backend.tree_map(partial(numpy_to_tensor, backend=target_backend), args)
-        t = backend.tree_map(target_backend.cast, t, dtype)
-        return t
+    return _tree_convert(
+        partial(numpy_to_tensor, backend=target_backend), args, dtype, target_backend
+    )
 
 
 def general_args_to_backend(
     args: Any, dtype: Any = None, target_backend: Any = None, enable_dlpack: bool = True
 ) -> Any:
-    if not enable_dlpack:
-        args = general_args_to_numpy(args)
-        args = numpy_args_to_backend(args, dtype, target_backend)
-        return args
-
-    caps = backend.tree_map(tensor_to_dlpack, args)
     if target_backend is None:
         target_backend = backend
     elif isinstance(target_backend, str):
         target_backend = get_backend(target_backend)
-    if dtype is None:
-        return backend.tree_map(target_backend.from_dlpack, caps)
-    if isinstance(dtype, str):
-        leaves, treedef = backend.tree_flatten(args)
-        dtype = [dtype for _ in range(len(leaves))]
-        dtype = backend.tree_unflatten(treedef, dtype)
-    t = backend.tree_map(target_backend.from_dlpack, caps)
-    t = backend.tree_map(target_backend.cast, t, dtype)
-    return t
+
+    def convert(a: Tensor) -> Tensor:
+        if not enable_dlpack:
+            return numpy_to_tensor(tensor_to_numpy(a), target_backend)
+        return target_backend.from_dlpack(tensor_to_dlpack(a))
+
+    return _tree_convert(convert, args, dtype, target_backend)
 
 
 def gate_to_matrix(t: Gate, is_reshapem: bool = True) -> Tensor:
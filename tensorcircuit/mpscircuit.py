@@ -14,7 +14,7 @@ from tensorcircuit.quantum import QuOperator, QuVector
 from . import gates
 from .cons import backend, npdtype, contractor, rdtypestr, dtypestr
 from .mps_base import FiniteMPS
-from .abstractcircuit import AbstractCircuit
+from .abstractcircuit import AbstractCircuit, QIRStore
 
 Gate = gates.Gate
 Tensor = Any
@@ -138,7 +138,7 @@ class MPSCircuit(AbstractCircuit):
 
         self._nqubits = nqubits
         self._fidelity = 1.0
-        self._qir: List[Dict[str, Any]] = []
+        self._qir = QIRStore()
 
     # `MPSCircuit` does not has `replace_inputs` like `Circuit`
     # because the gates are immediately absorted into the MPS when applied,
@@ -558,18 +558,7 @@ class MPSCircuit(AbstractCircuit):
             split = self.split
         if name is None:
             name = ""
-        gate_dict = {
-            "gate": gate,
-            "index": index,
-            "name": name,
-            "split": split,
-            "mpo": mpo,
-        }
-        if ir_dict is not None:
-            ir_dict.update(gate_dict)
-        else:
-            ir_dict = gate_dict
-        self._qir.append(ir_dict)
+        self._qir.add(gate, index, name, split=split, mpo=mpo, ir_dict=ir_dict)
         assert len(index) == len(set(index))
         assert mpo is False, "MPO not implemented for MPS"
         assert isinstance(gate, tn.Node)
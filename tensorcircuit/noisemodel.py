@@ -95,7 +95,7 @@ class NoiseConf:
 
 def apply_qir_with_noise(
     c: Any,
-    qir: List[Dict[str, Any]],
+    qir: Sequence[Dict[str, Any]],
     noise_conf: NoiseConf,
     status: Optional[Tensor] = None,
 ) -> Any:
@@ -104,7 +104,7 @@ def apply_qir_with_noise(
     :param c: A newly defined circuit
     :type c: AbstractCircuit
     :param qir: The qir of the clean circuit
-    :type qir: List[Dict[str, Any]]
+    :type qir: Sequence[Dict[str, Any]]
     :param noise_conf: Noise Configuration
     :type noise_conf: NoiseConf
     :param status: The status for Monte Carlo sampling, defaults to None
@@ -9,9 +9,11 @@ Quantum state and operator class backend by tensornetwork
 """
 # pylint: disable=invalid-name
 
-from functools import reduce, partial
+from collections import deque
+from functools import lru_cache, reduce, partial
+from itertools import chain
 import logging
-from operator import or_, mul, matmul
+from operator import matmul
 from typing import (
     Any,
     Callable,
@@ -26,17 +28,26 @@ from typing import (
 )
 
 import numpy as np
+import opt_einsum
 from tensornetwork.network_components import AbstractNode, Node, Edge, connect
 from tensornetwork.network_components import CopyNode
+from tensornetwork.network_components import contract_between
 from tensornetwork.network_operations import get_all_nodes, copy, reachable
-from tensornetwork.network_operations import get_subgraph_dangling, remove_node
+from tensornetwork.network_operations import get_all_edges, contract_trace_edges
+from tensornetwork.network_operations import get_subgraph_dangling
 
 try:
     import tensorflow as tf
 except ImportError:
     pass
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 from .cons import backend, contractor, dtypestr, npdtype, rdtypestr
+from .cons import custom as _custom_contractor
 from .backends import get_backend
 from .utils import is_m1mac, arg_alias
 
@@ -172,7 +183,7 @@ def identity(
     nodes = [CopyNode(2, d, dtype=dtype) for d in space]
     out_edges = [n[0] for n in nodes]
     in_edges = [n[1] for n in nodes]
-    return quantum_constructor(out_edges, in_edges)
+    return _IdentityQuOperator(out_edges, in_edges)
 
 
 def check_spaces(edges_1: Sequence[Edge], edges_2: Sequence[Edge]) -> None:
@@ -195,14 +206,48 @@ def check_spaces(edges_1: Sequence[Edge], edges_2: Sequence[Edge]) -> None:
             "with {} subsystems.".format(len(edges_1), len(edges_2))
         )
 
-    for (i, (e1, e2)) in enumerate(zip(edges_1, edges_2)):
-        if e1.dimension != e2.dimension:
-            raise ValueError(
-                "Hilbert-space mismatch on subsystems {}: Input "
-                "dimension {} != output dimension {}.".format(
-                    i, e1.dimension, e2.dimension
-                )
-            )
+    n = len(edges_1)
+    dims_1 = np.fromiter((e.dimension for e in edges_1), dtype=np.int64, count=n)
+    dims_2 = np.fromiter((e.dimension for e in edges_2), dtype=np.int64, count=n)
+    if not np.array_equal(dims_1, dims_2):
+        i = int(np.flatnonzero(dims_1 != dims_2)[0])
+        raise ValueError(
+            "Hilbert-space mismatch on subsystems {}: Input "
+            "dimension {} != output dimension {}.".format(i, dims_1[i], dims_2[i])
+        )
+
+
+_CHECK = True
+
+
+def set_check_network(enabled: bool = True) -> None:
+    """
+    Globally enable or disable the network consistency check done when a ``QuOperator``
+    is constructed. Disabling it saves the Python overhead of rebuilding operators
+    whose topology is known to be valid, e.g. in the inner loop of an optimization.
+
+    :param enabled: Whether to check the network on construction, defaults to True
+    :type enabled: bool, optional
+    """
+    global _CHECK
+    _CHECK = enabled
+
+
+_MATMUL_COPY = True
+
+
+def set_matmul_copy(enabled: bool = True) -> None:
+    """
+    Globally set whether ``QuOperator.__matmul__`` copies the networks of its operands.
+    When disabled, the networks of operands that share no nodes are connected directly,
+    which saves the copies but consumes the operands: they must not be used afterwards.
+    Operands sharing nodes (e.g. ``A @ A``) are always copied.
+
+    :param enabled: Whether to always copy the operands, defaults to True
+    :type enabled: bool, optional
+    """
+    global _MATMUL_COPY
+    _MATMUL_COPY = enabled
 
 
 def eliminate_identities(nodes: Collection[AbstractNode]) -> Tuple[dict, dict]:  # type: ignore
@@ -217,27 +262,41 @@ def eliminate_identities(nodes: Collection[AbstractNode]) -> Tuple[dict, dict]:
         replacements.
     :rtype: Dict[Union[CopyNode, AbstractNode], Union[Node, AbstractNode]], Dict[Edge, Edge]
     """
+    nodes = list(nodes)
+    if not any(type(n) is CopyNode for n in nodes):
+        return {n: n for n in nodes}, {
+            e: e for n in nodes for e in n.get_all_dangling()
+        }
     nodes_dict = {}
     dangling_edges_dict = {}
     for n in nodes:
         if (
-            isinstance(n, CopyNode)
+            type(n) is CopyNode
             and n.get_rank() == 2
             and not (n[0].is_dangling() and n[1].is_dangling())
         ):
-            old_edges = [n[0], n[1]]
-            _, new_edges = remove_node(n)
-            if 0 in new_edges and 1 in new_edges:
-                e = connect(new_edges[0], new_edges[1])
-            elif 0 in new_edges:  # 1 was dangling
-                dangling_edges_dict[old_edges[1]] = new_edges[0]
-            elif 1 in new_edges:  # 0 was dangling
-                dangling_edges_dict[old_edges[0]] = new_edges[1]
-            else:
+            # splice the neighbours directly instead of ``remove_node`` + ``connect``
+            e0, e1 = n[0], n[1]
+            if e0 is e1:
                 # Trace of identity, so replace with a scalar node!
                 d = n.get_dimension(0)
                 # NOTE: Assume CopyNodes have numpy dtypes.
                 nodes_dict[n] = Node(np.array(d, dtype=n.dtype))
+                continue
+            m0, a0 = (e0.node2, e0.axis2) if e0.node1 is n else (e0.node1, e0.axis1)
+            m1, a1 = (e1.node2, e1.axis2) if e1.node1 is n else (e1.node1, e1.axis1)
+            if m1 is None:  # 1 was dangling
+                e = Edge(node1=m0, axis1=a0)
+                m0.add_edge(e, a0, override=True)
+                dangling_edges_dict[e1] = e
+            elif m0 is None:  # 0 was dangling
+                e = Edge(node1=m1, axis1=a1)
+                m1.add_edge(e, a1, override=True)
+                dangling_edges_dict[e0] = e
+            else:
+                e = Edge(node1=m0, axis1=a0, node2=m1, axis2=a1)
+                m0.add_edge(e, a0, override=True)
+                m1.add_edge(e, a1, override=True)
         else:
             for e in n.get_all_dangling():
                 dangling_edges_dict[e] = e
@@ -246,6 +305,250 @@ def eliminate_identities(nodes: Collection[AbstractNode]) -> Tuple[dict, dict]:
     return nodes_dict, dangling_edges_dict
 
 
+# contraction paths found by the optimizer, keyed by (contractor, network topology),
+# at most ``_PATH_CACHE_SIZE`` topologies are kept, the oldest one is evicted first
+_PATH_CACHE: Dict[Any, List[Tuple[int, int]]] = {}
+_PATH_CACHE_SIZE = 256
+
+
+def _canonical_order(
+    nodes: Collection[AbstractNode], edges: Sequence[Edge]
+) -> List[AbstractNode]:
+    """
+    Enumerate the nodes of a network in a canonical order.
+    The walk is breadth-first, seeded by the nodes of ``edges`` and then by the
+    remaining nodes sorted by their dimensions.
+
+    :param nodes: Collection of nodes of the network.
+    :type nodes: Collection[AbstractNode]
+    :param edges: The dangling edges seeding the enumeration.
+    :type edges: Sequence[Edge]
+    :return: The ordered list of nodes.
+    :rtype: List[AbstractNode]
+    """
+    order: Dict[AbstractNode, int] = {}
+    ordered = []
+    seeds = [e.node1 for e in edges] + sorted(
+        nodes, key=lambda n: [e.dimension for e in n.edges]
+    )
+    for s in seeds:
+        if s in order:
+            continue
+        order[s] = len(ordered)
+        ordered.append(s)
+        queue = deque([s])
+        while queue:
+            n = queue.popleft()
+            for e in n.edges:
+                for m in (e.node1, e.node2):
+                    if m is not None and m not in order:
+                        order[m] = len(ordered)
+                        ordered.append(m)
+                        queue.append(m)
+    return ordered
+
+
+def _topology_key(ordered: Sequence[AbstractNode]) -> Tuple[Any, ...]:
+    """
+    A hashable signature of the topology (dimensions and wiring, independent of tensor values)
+    of a network whose nodes are given in canonical order.
+
+    :param ordered: The nodes as returned by :py:func:`_canonical_order`.
+    :type ordered: Sequence[AbstractNode]
+    :return: The topology signature.
+    :rtype: Tuple[Any, ...]
+    """
+    order = {n: i for i, n in enumerate(ordered)}
+    return tuple(
+        tuple(
+            (e.dimension, order[e.node1], e.axis1, order.get(e.node2), e.axis2)
+            for e in n.edges
+        )
+        for n in ordered
+    )
+
+
+# jitted contraction cores for ``QuOperator.contract(jit=True)``, keyed by (backend, equation, shapes)
+_JIT_CORE_CACHE: Dict[Tuple[Any, ...], Callable[..., Tensor]] = {}
+_EINSUM_SYMBOLS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def _einsum_equation(
+    nodes: Sequence[AbstractNode], output_edges: Sequence[Edge]
+) -> Optional[str]:
+    """
+    The einsum equation of the network with edges labelled by their order of appearance,
+    None if the network has more edges than available einsum symbols.
+    """
+    labels: Dict[Edge, str] = {}
+    for n in nodes:
+        for e in n.edges:
+            if e not in labels:
+                if len(labels) == len(_EINSUM_SYMBOLS):
+                    return None
+                labels[e] = _EINSUM_SYMBOLS[len(labels)]
+    inputs = ",".join("".join(labels[e] for e in n.edges) for n in nodes)
+    return inputs + "->" + "".join(labels[e] for e in output_edges)
+
+
+def tensordot_pair(
+    a: Tensor, b: Tensor, a_axes: Sequence[int], b_axes: Sequence[int]
+) -> Tensor:
+    """
+    Contract ``a_axes`` of ``a`` with ``b_axes`` of ``b`` by transpose, reshape and a single matmul.
+    The axes of the result are the free axes of ``a`` followed by the free axes of ``b``.
+
+    :param a: The first tensor.
+    :type a: Tensor
+    :param b: The second tensor.
+    :type b: Tensor
+    :param a_axes: Axes of ``a`` to be contracted.
+    :type a_axes: Sequence[int]
+    :param b_axes: Axes of ``b`` to be contracted, in the order matching ``a_axes``.
+    :type b_axes: Sequence[int]
+    :return: The contracted tensor.
+    :rtype: Tensor
+    """
+    free_a = [i for i in range(len(a.shape)) if i not in a_axes]
+    free_b = [i for i in range(len(b.shape)) if i not in b_axes]
+    free_a_shape = [int(a.shape[i]) for i in free_a]
+    free_b_shape = [int(b.shape[i]) for i in free_b]
+    m, k, n = 1, 1, 1
+    for d in free_a_shape:
+        m *= d
+    for i in a_axes:
+        k *= int(a.shape[i])
+    for d in free_b_shape:
+        n *= d
+    a = backend.reshape(backend.transpose(a, free_a + list(a_axes)), [m, k])
+    b = backend.reshape(backend.transpose(b, list(b_axes) + free_b), [k, n])
+    return backend.reshape(backend.matmul(a, b), free_a_shape + free_b_shape)
+
+
+def _contraction_program(
+    equation: str, shapes: Sequence[Sequence[int]]
+) -> Optional[Tuple[Any, ...]]:
+    """
+    Lower the einsum equation to pairwise ``tensordot_pair`` steps along a greedy path
+    and a final transposition, None if some operand has a trace (repeated label).
+    """
+    inputs, output = equation.split("->")
+    operands = inputs.split(",")
+    if any(len(set(o)) != len(o) for o in operands):
+        return None
+    size_dict = {l: d for o, shape in zip(operands, shapes) for l, d in zip(o, shape)}
+    path = opt_einsum.paths.greedy([set(o) for o in operands], set(output), size_dict)
+    steps = []
+    for ab in path:
+        if len(ab) < 2:
+            continue
+        i, j = ab
+        a, b = operands[i], operands[j]
+        shared = [l for l in a if l in b]
+        steps.append(
+            (i, j, tuple(a.index(l) for l in shared), tuple(b.index(l) for l in shared))
+        )
+        new = "".join(l for l in a if l not in shared) + "".join(
+            l for l in b if l not in shared
+        )
+        operands = [o for r, o in enumerate(operands) if r not in (i, j)] + [new]
+    return tuple(steps), tuple(operands[0].index(l) for l in output)
+
+
+def _contract_core(program: Tuple[Any, ...], *tensors: Tensor) -> Tensor:
+    steps, perm = program
+    tensors = list(tensors)  # type: ignore
+    for i, j, axes_i, axes_j in steps:
+        t = tensordot_pair(tensors[i], tensors[j], axes_i, axes_j)
+        tensors = [t0 for r, t0 in enumerate(tensors) if r not in (i, j)] + [t]  # type: ignore
+    return backend.transpose(tensors[0], perm)
+
+
+def _einsum_core(equation: str, *tensors: Tensor) -> Tensor:
+    return backend.einsum(equation, *tensors)
+
+
+# generated functions of ``QuOperator.specialize``, keyed by (backend, equation, shapes)
+_SPECIALIZED_CACHE: Dict[Tuple[Any, ...], Callable[..., Tensor]] = {}
+
+
+def _transpose_src(name: str, perm: Sequence[int]) -> str:
+    if list(perm) == sorted(perm):
+        return name
+    return "backend.transpose(%s, %s)" % (name, tuple(perm))
+
+
+def _codegen_contraction(
+    equation: str, shapes: Sequence[Sequence[int]]
+) -> Callable[..., Tensor]:
+    """
+    Generate a straight-line function contracting tensors of the given shapes as ``equation``,
+    with every transpose, reshape and matmul of the contraction program hardcoded.
+    """
+    ntensors = len(shapes)
+    names = ["t%s" % i for i in range(ntensors)]
+    lines = ["def _fn(%s):" % ", ".join(names)]
+    program = _contraction_program(equation, shapes)
+    if program is None:
+        lines.append("    return backend.einsum(%r, %s)" % (equation, ", ".join(names)))
+    else:
+        steps, perm = program
+        shapes = [list(shape) for shape in shapes]
+        for step, (i, j, axes_i, axes_j) in enumerate(steps):
+            shape_i, shape_j = shapes[i], shapes[j]
+            free_i = [r for r in range(len(shape_i)) if r not in axes_i]
+            free_j = [r for r in range(len(shape_j)) if r not in axes_j]
+            m, k, n = 1, 1, 1
+            for r in free_i:
+                m *= shape_i[r]
+            for r in axes_i:
+                k *= shape_i[r]
+            for r in free_j:
+                n *= shape_j[r]
+            new_shape = [shape_i[r] for r in free_i] + [shape_j[r] for r in free_j]
+            new_name = "t%s" % (ntensors + step)
+            lines.append(
+                "    %s = backend.reshape(backend.matmul(backend.reshape(%s, %s), "
+                "backend.reshape(%s, %s)), %s)"
+                % (
+                    new_name,
+                    _transpose_src(names[i], free_i + list(axes_i)),
+                    (m, k),
+                    _transpose_src(names[j], list(axes_j) + free_j),
+                    (k, n),
+                    tuple(new_shape),
+                )
+            )
+            names = [x for r, x in enumerate(names) if r not in (i, j)] + [new_name]
+            shapes = [x for r, x in enumerate(shapes) if r not in (i, j)] + [new_shape]
+        lines.append("    return %s" % _transpose_src(names[0], perm))
+    src = "\n".join(lines)
+    logger.debug("specialized contraction:\n%s" % src)
+    namespace: Dict[str, Any] = {"backend": backend}
+    code = compile(src, "<specialized QuOperator>", "exec")
+    exec(code, namespace)  # pylint: disable=exec-used
+    return namespace["_fn"]  # type: ignore
+
+
+def _identity_dicts(
+    op: "QuOperator",
+) -> Tuple[Dict[AbstractNode, AbstractNode], Dict[Edge, Edge]]:
+    """The node and edge dicts of ``copy`` mapping the network of ``op`` onto itself."""
+    edges = chain(op.out_edges, op.in_edges, op.ignore_edges)
+    return {n: n for n in op.nodes}, {e: e for e in edges}
+
+
+def _path_recorder(
+    optimizer: Callable[..., Any], paths: List[Any]
+) -> Callable[..., Any]:
+    def record(*args: Any, **kws: Any) -> Any:
+        path = optimizer(*args, **kws)
+        paths.append(path)
+        return path
+
+    return record
+
+
 class QuOperator:
     """
     Represents a linear operator via a tensor network.
@@ -300,7 +603,11 @@ class QuOperator:
         self.in_edges = list(in_edges)
         self.ignore_edges = set(ignore_edges) if ignore_edges else set()
         self.ref_nodes = set(ref_nodes) if ref_nodes else set()
-        self.check_network()
+        self._nodes_cache: Optional[Set[AbstractNode]] = None
+        self._in_space: Optional[Tuple[int, ...]] = None
+        self._out_space: Optional[Tuple[int, ...]] = None
+        if _CHECK:
+            self.check_network()
 
     @classmethod
     def from_tensor(
@@ -359,6 +666,38 @@ class QuOperator:
         in_edges = [n[i] for i in in_axes]  # type: ignore
         return cls(out_edges, in_edges)
 
+    @classmethod
+    def from_tensor_lazy(
+        cls,
+        tensor: Tensor,
+        out_axes: Optional[Sequence[int]] = None,
+        in_axes: Optional[Sequence[int]] = None,
+    ) -> "QuOperator":
+        """
+        Construct a `QuOperator` from a single tensor as :py:meth:`QuOperator.from_tensor`,
+        but defer wrapping the tensor in a `Node` until the edges or nodes are first accessed.
+        Spaces, ``is_scalar`` and the like and ``copy`` are answered from the tensor shape,
+        so operators which are only inspected or copied never build a network.
+
+        :param tensor: The tensor.
+        :type tensor: Tensor
+        :param out_axes: The axis indices of `tensor` to use as `out_edges`.
+        :type out_axes: Optional[Sequence[int]], optional
+        :param in_axes: The axis indices of `tensor` to use as `in_edges`.
+        :type in_axes: Optional[Sequence[int]], optional
+        :return: The new operator.
+        :rtype: QuOperator
+        """
+        nlegs = len(tensor.shape)
+        if (out_axes is None) and (in_axes is None):
+            out_axes = [i for i in range(int(nlegs / 2))]
+            in_axes = [i for i in range(int(nlegs / 2), nlegs)]
+        elif out_axes is None:
+            out_axes = [i for i in range(nlegs) if i not in in_axes]  # type: ignore
+        elif in_axes is None:
+            in_axes = [i for i in range(nlegs) if i not in out_axes]
+        return _LazyQuOperator(tensor, out_axes, in_axes)  # type: ignore
+
     @classmethod
     def from_local_tensor(
         cls,
@@ -390,16 +729,28 @@ class QuOperator:
 
     @property
     def nodes(self) -> Set[AbstractNode]:
-        """All tensor-network nodes involved in the operator."""
+        """
+        All tensor-network nodes involved in the operator.
+        The graph traversal is cached until the network is modified by ``contract``.
+        """
+        if self._nodes_cache is None:
+            self._nodes_cache = self._recompute_nodes()
+        return self._nodes_cache
+
+    def _recompute_nodes(self) -> Set[AbstractNode]:
         return reachable(get_all_nodes(self.out_edges + self.in_edges) | self.ref_nodes)  # type: ignore
 
     @property
-    def in_space(self) -> List[int]:
-        return [e.dimension for e in self.in_edges]
+    def in_space(self) -> Tuple[int, ...]:
+        if self._in_space is None:
+            self._in_space = tuple(e.dimension for e in self.in_edges)
+        return self._in_space
 
     @property
-    def out_space(self) -> List[int]:
-        return [e.dimension for e in self.out_edges]
+    def out_space(self) -> Tuple[int, ...]:
+        if self._out_space is None:
+            self._out_space = tuple(e.dimension for e in self.out_edges)
+        return self._out_space
 
     def is_scalar(self) -> bool:
         """
@@ -441,9 +792,12 @@ class QuOperator:
                     "ignore_edges contains non-dangling edge: {}".format(str(e))
                 )
 
-        known_edges = set(self.in_edges) | set(self.out_edges) | self.ignore_edges
         all_dangling_edges = get_subgraph_dangling(self.nodes)
-        if known_edges != all_dangling_edges:
+        n_known = len(self.out_edges) + len(self.in_edges) + len(self.ignore_edges)
+        # too few known edges to cover all dangling ones, no need to build the set
+        if n_known < len(all_dangling_edges) or all_dangling_edges != set(
+            self.in_edges
+        ).union(self.out_edges, self.ignore_edges):
             raise ValueError(
                 "The network includes unexpected dangling edges (that "
                 "are not members of ignore_edges)."
@@ -519,7 +873,7 @@ class QuOperator:
         in_edges_trace = set(in_edges_trace)  # type: ignore
         out_edges = [edge_dict[e] for e in self.out_edges if e not in out_edges_trace]
         in_edges = [edge_dict[e] for e in self.in_edges if e not in in_edges_trace]
-        ref_nodes = [n for _, n in nodes_dict.items()]
+        ref_nodes = list(nodes_dict.values())
         ignore_edges = [edge_dict[e] for e in self.ignore_edges]
 
         return quantum_constructor(out_edges, in_edges, ref_nodes, ignore_edges)
@@ -532,16 +886,32 @@ class QuOperator:
         Under the hood, this produces copies of the tensor networks defining `A`
         and `B` and then connects the copies by hooking up the `in_edges` of
         `A.copy()` to the `out_edges` of `B.copy()`.
+        See :py:func:`set_matmul_copy` to skip the copies for operators which are not reused.
         """
-        if not isinstance(other, QuOperator):
+        if isinstance(other, _IdentityQuOperator):
+            if self.in_space != other.out_space:
+                check_spaces(self.in_edges, other.out_edges)
+            return self.copy()
+        # a tensor is wrapped into a fresh operator, which needs no copy
+        copy_other = isinstance(other, QuOperator)
+        if not copy_other:
             other = self.from_tensor(other)
-        check_spaces(self.in_edges, other.out_edges)
+        if self.in_space != other.out_space:  # cached tuples, detailed error below
+            check_spaces(self.in_edges, other.out_edges)
+        copy_self = _MATMUL_COPY or self._shares_nodes(other)
+        copy_other = copy_other and copy_self
 
         # Copy all nodes involved in the two operators.
         # We must do this separately for self and other, in case self and other
         # are defined via the same network components (e.g. if self === other).
-        nodes_dict1, edges_dict1 = copy(self.nodes, False)
-        nodes_dict2, edges_dict2 = copy(other.nodes, False)
+        if copy_self:
+            nodes_dict1, edges_dict1 = copy(self.nodes, False)
+        else:
+            nodes_dict1, edges_dict1 = _identity_dicts(self)
+        if copy_other:
+            nodes_dict2, edges_dict2 = copy(other.nodes, False)
+        else:
+            nodes_dict2, edges_dict2 = _identity_dicts(other)
 
         # connect edges to create network for the result
         for (e1, e2) in zip(self.in_edges, other.out_edges):
@@ -549,15 +919,16 @@ class QuOperator:
 
         in_edges = [edges_dict2[e] for e in other.in_edges]
         out_edges = [edges_dict1[e] for e in self.out_edges]
-        ref_nodes = [n for _, n in nodes_dict1.items()] + [
-            n for _, n in nodes_dict2.items()
-        ]
+        ref_nodes = list(chain(nodes_dict1.values(), nodes_dict2.values()))
         ignore_edges = [edges_dict1[e] for e in self.ignore_edges] + [
             edges_dict2[e] for e in other.ignore_edges
         ]
 
         return quantum_constructor(out_edges, in_edges, ref_nodes, ignore_edges)
 
+    def _shares_nodes(self, other: "QuOperator") -> bool:
+        return not self.nodes.isdisjoint(other.nodes)
+
     def __rmatmul__(self, other: Union["QuOperator", Tensor]) -> "QuOperator":
         return self.__matmul__(other)
 
@@ -626,21 +997,38 @@ class QuOperator:
         :return: The result (`AB`).
         :rtype: QuOperator
         """
-        nodes_dict1, edges_dict1 = copy(self.nodes, False)
-        nodes_dict2, edges_dict2 = copy(other.nodes, False)
+        return self.tensor_product_many([self, other])
 
-        in_edges = [edges_dict1[e] for e in self.in_edges] + [
-            edges_dict2[e] for e in other.in_edges
-        ]
-        out_edges = [edges_dict1[e] for e in self.out_edges] + [
-            edges_dict2[e] for e in other.out_edges
-        ]
-        ref_nodes = [n for _, n in nodes_dict1.items()] + [
-            n for _, n in nodes_dict2.items()
-        ]
-        ignore_edges = [edges_dict1[e] for e in self.ignore_edges] + [
-            edges_dict2[e] for e in other.ignore_edges
-        ]
+    @staticmethod
+    def tensor_product_many(ops: Sequence["QuOperator"]) -> "QuOperator":
+        """
+        Tensor product of a sequence of operators, equivalent to ``ops[0] | ops[1] | ...``
+        but each operator is copied only once instead of copying the growing intermediate
+        products. The operators may share network components (e.g. the same operator
+        may appear several times), each of them gets its own copy.
+
+        :Example:
+
+        >>> psi = qu.QuVector.from_tensor(np.random.rand(2, 2))
+        >>> psi3 = qu.QuOperator.tensor_product_many([psi, psi, psi])
+        >>> len(psi3.subsystem_edges)
+        6
+
+        :param ops: The operators.
+        :type ops: Sequence[QuOperator]
+        :return: The tensor product of all the operators.
+        :rtype: QuOperator
+        """
+        out_edges: List[Edge] = []
+        in_edges: List[Edge] = []
+        ref_nodes: List[AbstractNode] = []
+        ignore_edges: List[Edge] = []
+        for op in ops:
+            nodes_dict, edges_dict = copy(op.nodes, False)
+            out_edges += [edges_dict[e] for e in op.out_edges]
+            in_edges += [edges_dict[e] for e in op.in_edges]
+            ref_nodes += nodes_dict.values()
+            ignore_edges += [edges_dict[e] for e in op.ignore_edges]
 
         return quantum_constructor(out_edges, in_edges, ref_nodes, ignore_edges)
 
@@ -655,6 +1043,8 @@ class QuOperator:
     def contract(
         self,
         final_edge_order: Optional[Sequence[Edge]] = None,
+        jit: bool = False,
+        path: Optional[Sequence[Tuple[int, int]]] = None,
     ) -> "QuOperator":
         """
         Contract the tensor network in place.
@@ -663,27 +1053,179 @@ class QuOperator:
 
         :param final_edge_order: Manually specify the axis ordering of the final tensor.
         :type final_edge_order: Optional[Sequence[Edge]], optional
+        :param jit: If True, the graph rewriting is kept in Python while the contraction itself
+            is done by a jitted function (pairwise ``tensordot_pair`` steps along a greedy path),
+            which is cached and reused for networks of the same topology.
+            The contractor is bypassed in this case, defaults to False.
+            Networks with more than 52 edges fall back to the contractor.
+        :type jit: bool, optional
+        :param path: A precomputed contraction path, bypassing the contractor and its path finding.
+            The path is in ``opt_einsum`` format: each pair of positions is contracted,
+            removed from the list and the result is appended at the end.
+            The initial positions refer to the nodes after identity elimination,
+            in the order of the nodes returned by :py:meth:`QuOperator.specialize`
+            (breadth-first from the out and in edges). Defaults to None.
+        :type path: Optional[Sequence[Tuple[int, int]]], optional
         :return: The present object.
         :rtype: QuOperator
         """
         nodes_dict, dangling_edges_dict = eliminate_identities(self.nodes)
+        self._nodes_cache = None
+        self._in_space = self._out_space = None
         self.in_edges = [dangling_edges_dict[e] for e in self.in_edges]
         self.out_edges = [dangling_edges_dict[e] for e in self.out_edges]
-        self.ignore_edges = set(dangling_edges_dict[e] for e in self.ignore_edges)
-        self.ref_nodes = set(nodes_dict[n] for n in self.ref_nodes if n in nodes_dict)
+        self.ignore_edges = {dangling_edges_dict[e] for e in self.ignore_edges}
+        self.ref_nodes = {nodes_dict[n] for n in self.ref_nodes if n in nodes_dict}
         self.check_network()
+        kws: Dict[str, Any] = {}
         if final_edge_order:
-            final_edge_order = [dangling_edges_dict[e] for e in final_edge_order]
-            self.ref_nodes = set(
-                [contractor(self.nodes, output_edge_order=final_edge_order)]
-            )
+            kws["output_edge_order"] = [
+                dangling_edges_dict[e] for e in final_edge_order
+            ]
         else:
-            self.ref_nodes = set([contractor(self.nodes, ignore_edge_order=True)])
+            kws["ignore_edge_order"] = True
+        nodes = _canonical_order(self.nodes, self.out_edges + self.in_edges)
+        if path is not None:
+            return self._contract_path(nodes, path, kws.get("output_edge_order"))
+        if jit:
+            output_edges = kws.get("output_edge_order") or (
+                list(self.ignore_edges) + self.out_edges + self.in_edges
+            )
+            equation = _einsum_equation(nodes, output_edges)
+            if equation is not None:
+                return self._contract_jit(nodes, output_edges, equation)
+        paths: List[List[Tuple[int, int]]] = []
+        if (
+            isinstance(contractor, partial)
+            and contractor.func is _custom_contractor
+            and not isinstance(contractor.keywords.get("optimizer"), list)
+        ):
+            # the path is only reused for a network with identical topology enumerated
+            # in the same order, any path still gives the correct result anyway
+            key = (contractor, _topology_key(nodes))
+            if key in _PATH_CACHE:
+                kws["optimizer"] = _PATH_CACHE[key]
+            else:
+                kws["optimizer"] = _path_recorder(
+                    contractor.keywords["optimizer"], paths
+                )
+        self.ref_nodes = {contractor(nodes, **kws)}
+        self._nodes_cache = None
+        if paths:
+            if len(_PATH_CACHE) >= _PATH_CACHE_SIZE:
+                del _PATH_CACHE[next(iter(_PATH_CACHE))]
+            _PATH_CACHE[key] = [tuple(ab) for ab in paths[0]]  # type: ignore
         return self
 
+    def _contract_path(
+        self,
+        nodes: Sequence[AbstractNode],
+        path: Sequence[Tuple[int, int]],
+        output_edge_order: Optional[Sequence[Edge]],
+    ) -> "QuOperator":
+        nodes = [
+            contract_trace_edges(n) if any(e.is_trace() for e in n.edges) else n
+            for n in nodes
+        ]
+        for a, b in path:
+            node = contract_between(nodes[a], nodes[b], allow_outer_product=True)
+            nodes = [n for r, n in enumerate(nodes) if r not in (a, b)] + [node]
+        if len(nodes) != 1:
+            raise ValueError(
+                "Node count '{}' > 1 after contraction along the path!".format(
+                    len(nodes)
+                )
+            )
+        if output_edge_order is not None:
+            nodes[0].reorder_edges(output_edge_order)
+        self.ref_nodes = {nodes[0]}
+        self._nodes_cache = None
+        return self
+
+    def _contract_jit(
+        self,
+        nodes: Sequence[AbstractNode],
+        output_edges: Sequence[Edge],
+        equation: str,
+    ) -> "QuOperator":
+        tensors = [n.tensor for n in nodes]
+        shapes = tuple(tuple(int(d) for d in t.shape) for t in tensors)
+        key = (backend.name, equation, shapes)
+        if key not in _JIT_CORE_CACHE:
+            program = _contraction_program(equation, shapes)
+            if program is None:
+                core = partial(_einsum_core, equation)
+            else:
+                core = partial(_contract_core, program)
+            _JIT_CORE_CACHE[key] = backend.jit(core)
+        node = Node(_JIT_CORE_CACHE[key](*tensors))
+        edges_dict = {e: node[i] for i, e in enumerate(output_edges)}
+        self.in_edges = [edges_dict[e] for e in self.in_edges]
+        self.out_edges = [edges_dict[e] for e in self.out_edges]
+        self.ignore_edges = {edges_dict[e] for e in self.ignore_edges}
+        self.ref_nodes = {node}
+        self._nodes_cache = None
+        return self
+
+    def specialize(
+        self, final_edge_order: Optional[Sequence[Edge]] = None
+    ) -> Tuple[Callable[..., Tensor], List[AbstractNode]]:
+        """
+        Generate a straight-line function evaluating operators with the topology of this one,
+        so that the graph work (identity elimination, path finding, edge bookkeeping)
+        is done only once for, e.g., the same circuit layout evaluated with new parameters.
+        The generated function is cached and shared among operators of the same topology.
+        The present network is not modified.
+
+        :Example:
+
+        >>> op = qu.QuOperator.from_tensor(np.random.rand(2, 2)) @ qu.QuVector.from_tensor(np.random.rand(2))
+        >>> f, nodes = op.specialize()
+        >>> np.allclose(f(*[n.tensor for n in nodes]), op.eval())
+        True
+
+        :param final_edge_order: Manually specify the axis ordering of the final tensor,
+            the ordering of ``eval`` is used by default.
+        :type final_edge_order: Optional[Sequence[Edge]], optional
+        :raises ValueError: The network has too many edges to be specialized.
+        :return: The function taking the tensors of the nodes as positional arguments,
+            and the list of nodes (of a copy of the network) in the argument order.
+        :rtype: Tuple[Callable[..., Tensor], List[AbstractNode]]
+        """
+        if not final_edge_order:
+            final_edge_order = list(self.ignore_edges) + self.out_edges + self.in_edges
+        nodes_dict, edge_dict = copy(self.nodes, False)
+        nodes_dict, dangling_edges_dict = eliminate_identities(nodes_dict.values())
+        output_edges = [dangling_edges_dict[edge_dict[e]] for e in final_edge_order]
+        nodes = _canonical_order(
+            set(nodes_dict.values()),
+            [dangling_edges_dict[edge_dict[e]] for e in self.out_edges + self.in_edges],
+        )
+        equation = _einsum_equation(nodes, output_edges)
+        if equation is None:
+            raise ValueError(
+                "The network has too many edges to be specialized: %s"
+                % len(get_all_edges(nodes))
+            )
+        shapes = tuple(tuple(int(d) for d in n.tensor.shape) for n in nodes)
+        key = (backend.name, equation, shapes)
+        if key not in _SPECIALIZED_CACHE:
+            _SPECIALIZED_CACHE[key] = _codegen_contraction(equation, shapes)
+        return _SPECIALIZED_CACHE[key], nodes
+
+    @staticmethod
+    def clear_path_cache() -> None:
+        """
+        Clear the cache of contraction paths shared by all ``QuOperator.contract`` calls.
+        """
+        _PATH_CACHE.clear()
+
     def eval(
         self,
         final_edge_order: Optional[Sequence[Edge]] = None,
+        jit: bool = False,
+        path: Optional[Sequence[Tuple[int, int]]] = None,
+        dtype: Optional[str] = None,
     ) -> Tensor:
         """
         Contracts the tensor network in place and returns the final tensor.
@@ -696,13 +1238,27 @@ class QuOperator:
         :param final_edge_order: Manually specify the axis ordering of the final tensor.
             The default ordering is determined by `out_edges` and `in_edges` (see above).
         :type final_edge_order: Optional[Sequence[Edge]], optional
+        :param jit: Whether to contract with the cached jitted contraction core,
+            see :py:meth:`QuOperator.contract`, defaults to False.
+        :type jit: bool, optional
+        :param path: A precomputed contraction path, see :py:meth:`QuOperator.contract`,
+            defaults to None.
+        :type path: Optional[Sequence[Tuple[int, int]]], optional
+        :param dtype: If given, e.g. ``"complex64"``, all tensors are cast to this dtype before
+            the contraction, which halves the memory traffic of the pairwise contractions
+            when going down from ``complex128``. Expect relative errors of order 1e-6 to 1e-4
+            on the result at single precision, defaults to None (no cast).
+        :type dtype: Optional[str], optional
         :raises ValueError: Node count '{}' > 1 after contraction!
         :return: The final tensor representing the operator.
         :rtype: Tensor
         """
         if not final_edge_order:
             final_edge_order = list(self.ignore_edges) + self.out_edges + self.in_edges
-        self.contract(final_edge_order)
+        if dtype is not None:
+            for n in self.nodes:
+                n.tensor = backend.cast(n.tensor, dtype)
+        self.contract(final_edge_order, jit=jit, path=path)
         nodes = self.nodes
         if len(nodes) != 1:
             raise ValueError(
@@ -725,11 +1281,102 @@ class QuOperator:
         :rtype: Tensor
         """
         t = self.eval(final_edge_order)
-        shape1 = reduce(mul, [e.dimension for e in self.out_edges] + [1])
-        shape2 = reduce(mul, [e.dimension for e in self.in_edges] + [1])
+        shape1 = 1
+        for e in self.out_edges:
+            shape1 *= e.dimension
+        shape2 = 1
+        for e in self.in_edges:
+            shape2 *= e.dimension
         return backend.reshape(t, [shape1, shape2])
 
 
+class _IdentityQuOperator(QuOperator):
+    """
+    The identity operator returned by :py:func:`identity`.
+    Composition with another operator by ``@`` directly gives a copy of the other operator,
+    without connecting (and later eliminating) the ``CopyNode`` s of the identity.
+    """
+
+    def __matmul__(self, other: Union["QuOperator", Tensor]) -> "QuOperator":
+        if isinstance(other, QuOperator):
+            if self.in_space != other.out_space:
+                check_spaces(self.in_edges, other.out_edges)
+            return other.copy()
+        return super().__matmul__(other)
+
+
+class _LazyQuOperator(QuOperator):
+    """
+    The operator returned by :py:meth:`QuOperator.from_tensor_lazy`.
+    The `Node` of the tensor is only created on the first access to the edges.
+    """
+
+    def __init__(
+        self, tensor: Tensor, out_axes: Sequence[int], in_axes: Sequence[int]
+    ) -> None:
+        if len(out_axes) == 0 and len(in_axes) == 0:
+            raise ValueError(
+                "At least one reference node is required to specify a "
+                "scalar. None provided!"
+            )
+        if _CHECK and sorted(chain(out_axes, in_axes)) != list(
+            range(len(tensor.shape))
+        ):
+            raise ValueError(
+                "The network includes unexpected dangling edges (that "
+                "are not members of ignore_edges)."
+            )
+        self._tensor = tensor
+        self._out_axes = list(out_axes)
+        self._in_axes = list(in_axes)
+        self._out_edges: Optional[List[Edge]] = None
+        self._in_edges: Optional[List[Edge]] = None
+        self.ignore_edges = set()
+        self.ref_nodes = set()
+        self._nodes_cache = None
+        self._in_space = tuple(int(tensor.shape[i]) for i in in_axes)
+        self._out_space = tuple(int(tensor.shape[i]) for i in out_axes)
+
+    def _materialize(self) -> None:
+        n = Node(self._tensor)
+        self._out_edges = [n[i] for i in self._out_axes]
+        self._in_edges = [n[i] for i in self._in_axes]
+
+    @property  # type: ignore
+    def out_edges(self) -> List[Edge]:  # type: ignore
+        if self._out_edges is None:
+            self._materialize()
+        return self._out_edges  # type: ignore
+
+    @out_edges.setter
+    def out_edges(self, edges: List[Edge]) -> None:
+        self._out_edges = edges
+
+    @property  # type: ignore
+    def in_edges(self) -> List[Edge]:  # type: ignore
+        if self._in_edges is None:
+            self._materialize()
+        return self._in_edges  # type: ignore
+
+    @in_edges.setter
+    def in_edges(self, edges: List[Edge]) -> None:
+        self._in_edges = edges
+
+    def is_scalar(self) -> bool:
+        return False
+
+    def is_vector(self) -> bool:
+        return len(self._out_axes) > 0 and len(self._in_axes) == 0
+
+    def is_adjoint_vector(self) -> bool:
+        return len(self._out_axes) == 0 and len(self._in_axes) > 0
+
+    def copy(self) -> "QuOperator":
+        if self._out_edges is None:
+            return _LazyQuOperator(self._tensor, self._out_axes, self._in_axes)
+        return super().copy()
+
+
 class QuVector(QuOperator):
     """Represents a (column) vector via a tensor network."""
 
@@ -808,7 +1455,7 @@ class QuVector(QuOperator):
         return self.out_edges
 
     @property
-    def space(self) -> List[int]:
+    def space(self) -> Tuple[int, ...]:
         return self.out_space
 
     def projector(self) -> "QuOperator":
@@ -833,10 +1480,10 @@ class QuVector(QuOperator):
 
             \\mathrm{Tr}_{subsystems}(A A^\\dagger)
 
-        Firstly, take the projector of the operator, then trace out the subsystems
-        to trace out are supplied as indices, so that dangling edges are connected
-        to each other as:
-        `out_edges[i] ^ in_edges[i] for i in subsystems_to_trace_out`
+        The network is built in one pass: the vector and its complex conjugate are copied
+        once and the edges of the subsystems to trace out are directly connected
+        to their conjugate copies, i.e. the same network as ``projector()`` followed by
+        ``partial_trace`` without the intermediate copies.
         This does not modify the original network. The original ordering of the
         remaining subsystems is maintained.
 
@@ -845,8 +1492,22 @@ class QuVector(QuOperator):
         :return: The QuOperator of the reduced density of the operator with given subsystems.
         :rtype: QuOperator
         """
-        rho = self.projector()
-        return rho.partial_trace(subsystems_to_trace_out)
+        traced = set(subsystems_to_trace_out)
+        nodes = self.nodes
+        nodes_dict, edge_dict = copy(nodes, False)
+        nodes_dict_conj, edge_dict_conj = copy(nodes, True)
+        for i in traced:
+            e = self.out_edges[i]
+            _ = edge_dict[e] ^ edge_dict_conj[e]
+
+        kept = [e for i, e in enumerate(self.out_edges) if i not in traced]
+        out_edges = [edge_dict[e] for e in kept]
+        in_edges = [edge_dict_conj[e] for e in kept]
+        ref_nodes = list(nodes_dict.values()) + list(nodes_dict_conj.values())
+        ignore_edges = [edge_dict[e] for e in self.ignore_edges] + [
+            edge_dict_conj[e] for e in self.ignore_edges
+        ]
+        return quantum_constructor(out_edges, in_edges, ref_nodes, ignore_edges)
 
 
 class QuAdjointVector(QuOperator):
@@ -927,7 +1588,7 @@ class QuAdjointVector(QuOperator):
         return self.in_edges
 
     @property
-    def space(self) -> List[int]:
+    def space(self) -> Tuple[int, ...]:
         return self.in_space
 
     def projector(self) -> "QuOperator":
@@ -1021,6 +1682,14 @@ class QuScalar(QuOperator):
         return cls(set([n]))
 
 
+@lru_cache(maxsize=64)
+def _local_qop(
+    data: bytes, shape: Tuple[int, ...], dtype: str, dtypestr: str, backend_name: str
+) -> QuOperator:
+    h = np.frombuffer(data, dtype=dtype).reshape(shape)
+    return QuOperator.from_tensor(backend.cast(h, dtype=dtypestr))
+
+
 def generate_local_hamiltonian(
     *hlist: Sequence[Tensor], matrix_form: bool = True
 ) -> Union[QuOperator, Tensor]:
@@ -1036,9 +1705,17 @@ def generate_local_hamiltonian(
     :return: The Hamiltonian operator in form of QuOperator or matrix.
     :rtype: Union[QuOperator, Tensor]
     """
-    hlist = [backend.cast(h, dtype=dtypestr) for h in hlist]  # type: ignore
-    hop_list = [QuOperator.from_tensor(h) for h in hlist]
-    hop = reduce(or_, hop_list)
+    hop_list = []
+    for h in hlist:
+        if isinstance(h, np.ndarray) and h.size <= 64:
+            # small local terms (Paulis and their products) are wrapped only once
+            hop_list.append(
+                _local_qop(h.tobytes(), h.shape, h.dtype.str, dtypestr, backend.name)
+            )
+        else:
+            hop_list.append(QuOperator.from_tensor(backend.cast(h, dtype=dtypestr)))
+    # tensor_product_many copies the networks, the cached operators stay intact
+    hop = QuOperator.tensor_product_many(hop_list)
     if matrix_form:
         tensor = hop.eval_matrix()
         return tensor
@@ -1104,196 +1781,271 @@ def quimb2qop(qb_mpo: Any) -> QuOperator:
     return qop
 
 
-try:
+def _popcount(x: Tensor) -> Tensor:
+    """
+    Number of set bits of each element of a non-negative integer numpy array (SWAR popcount).
+    """
+    if hasattr(np, "bitwise_count"):  # numpy>=2.0
+        return np.bitwise_count(x)
+    x = x.astype(np.uint64)
+    x = x - ((x >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + (
+        (x >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (x * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+_ps_batch_numba: Optional[Callable[..., None]] = None
+# below this many nonzeros, the numba compilation on first call is not worth it
+_NUMBA_MIN_SIZE = 2**16
+
+if njit is not None:
+
+    @njit(parallel=True, cache=False)  # type: ignore
+    def _ps_batch_numba(flip, signmask, coeff, s, row, col, data):  # type: ignore
+        for t in prange(len(flip)):  # pylint: disable=not-an-iterable
+            for k in range(s):
+                j = t * s + k
+                row[j] = k
+                col[j] = k ^ flip[t]
+                x = k & signmask[t]
+                parity = 0
+                while x:
+                    x &= x - 1
+                    parity ^= 1
+                data[j] = -coeff[t] if parity else coeff[t]
+
+
+def _pauli_string_batch_to_coo(ls: Tensor, weight: Tensor) -> Tensor:
+    """
+    Build the scipy coo matrix of a Pauli string sum in one vectorized numpy pass,
+    or in a parallel numba kernel for large sums if numba is installed.
+
+    :param ls: 2D array of shape ``(nterms, n)``, each row is for a Pauli string,
+        e.g. [1, 0, 0, 3, 2] is for :math:`X_0Z_3Y_4`
+    :type ls: Tensor
+    :param weight: 1D array of shape ``(nterms,)``, the weight for each Pauli string
+    :type weight: Tensor
+    :return: the scipy coo sparse matrix with duplicates summed up
+    :rtype: Tensor
+    """
+    from scipy.sparse import coo_matrix
+
+    nterms, n = ls.shape
+    s = 0b1 << n
+    masks = np.left_shift(np.uint64(1), np.arange(n - 1, -1, -1, dtype=np.uint64))
+    idx_x = ((ls == 1) * masks).sum(axis=1, dtype=np.uint64)
+    idx_y = ((ls == 2) * masks).sum(axis=1, dtype=np.uint64)
+    idx_z = ((ls == 3) * masks).sum(axis=1, dtype=np.uint64)
+    # phase (-i)^ny and sign of each row per term
+    ny = _popcount(idx_y) % np.uint64(4)
+    coeff = np.array([1, -1j, -1, 1j], dtype=weight.dtype)[ny.astype(np.int64)] * weight
+    if _ps_batch_numba is not None and nterms * s >= _NUMBA_MIN_SIZE:
+        row = np.empty([nterms * s], dtype=np.int64)
+        col = np.empty([nterms * s], dtype=np.int64)
+        data = np.empty([nterms * s], dtype=coeff.dtype)
+        _ps_batch_numba(
+            (idx_x ^ idx_y).astype(np.int64),
+            (idx_y | idx_z).astype(np.int64),
+            coeff,
+            s,
+            row,
+            col,
+            data,
+        )
+    else:
+        row = np.tile(np.arange(s, dtype=np.uint64), nterms)
+        col = row ^ np.repeat(idx_x ^ idx_y, s)
+        e = _popcount(row & np.repeat(idx_y | idx_z, s)) & np.uint64(1)
+        data = (1 - 2 * e.astype(np.int8)) * np.repeat(coeff, s)
+        row, col = row.astype(np.int64), col.astype(np.int64)
+    r = coo_matrix((data, (row, col)), shape=(s, s))
+    r.sum_duplicates()
+    r.eliminate_zeros()
+    return r
+
+
+def _heisenberg_pauli_list(
+    g: Graph,
+    hzz: float,
+    hxx: float,
+    hyy: float,
+    hz: float,
+    hx: float,
+    hy: float,
+) -> Tuple[Tensor, Tensor]:
+    """
+    Numpy Pauli string list ``(ls, weight)`` of the Heisenberg Hamiltonian on ``g``,
+    in the 0, 1, 2, 3 -> I, X, Y, Z encoding used by ``PauliStringSum2COO``.
+    """
+    n = len(g.nodes)
+    edges = np.array(list(g.edges), dtype=np.int64).reshape([-1, 2])
+    nodes = np.array(list(g.nodes), dtype=np.int64)
+    ls_blocks = []
+    weight_blocks = []
+    for sites, terms in [
+        (edges, [(hzz, 3), (hxx, 1), (hyy, 2)]),
+        (nodes[:, None], [(hz, 3), (hx, 1), (hy, 2)]),
+    ]:
+        rows = np.arange(len(sites))[:, None]
+        for h, code in terms:
+            if h != 0:
+                block = np.zeros([len(sites), n], dtype=np.int8)
+                block[rows, sites] = code
+                ls_blocks.append(block)
+                weight_blocks.append(np.full([len(sites)], h))
+    return np.concatenate(ls_blocks), np.concatenate(weight_blocks)
+
+
+def heisenberg_hamiltonian(
+    g: Graph,
+    hzz: float = 1.0,
+    hxx: float = 1.0,
+    hyy: float = 1.0,
+    hz: float = 0.0,
+    hx: float = 0.0,
+    hy: float = 0.0,
+    sparse: bool = True,
+    numpy: bool = False,
+) -> Tensor:
+    """
+    Generate Heisenberg Hamiltonian with possible external fields.
 
-    def _id(x: Any) -> Any:
-        return x
+    :Example:
 
-    if is_m1mac():
-        compiled_jit = _id
-    else:
-        compiled_jit = partial(get_backend("tensorflow").jit, jit_compile=True)
+    >>> g = tc.templates.graphs.Line1D(6)
+    >>> h = qu.heisenberg_hamiltonian(g, sparse=False)
+    >>> tc.backend.eigh(h)[0][:10]
+    array([-11.2111025,  -8.4721365,  -8.472136 ,  -8.472136 ,  -6.       ,
+            -5.123106 ,  -5.123106 ,  -5.1231055,  -5.1231055,  -5.1231055],
+        dtype=float32)
+
+    :param g: input circuit graph
+    :type g: Graph
+    :param hzz: zz coupling, default is 1.0
+    :type hzz: float
+    :param hxx: xx coupling, default is 1.0
+    :type hxx: float
+    :param hyy: yy coupling, default is 1.0
+    :type hyy: float
+    :param hz: External field on z direction, default is 0.0
+    :type hz: float
+    :param hx: External field on y direction, default is 0.0
+    :type hx: float
+    :param hy: External field on x direction, default is 0.0
+    :type hy: float
+    :param sparse: Whether to return sparse Hamiltonian operator, default is True.
+    :type sparse: bool, defalts True
+    :param numpy: whether return the matrix in numpy or tensorflow form
+    :type numpy: bool, defaults False,
+
+    :return: Hamiltonian measurements
+    :rtype: Tensor
+    """
+    ls, weight = _heisenberg_pauli_list(g, hzz, hxx, hyy, hz, hx, hy)
+    weight = weight.astype(getattr(np, dtypestr))
+    if sparse:
+        r = PauliStringSum2COO_numpy(ls, weight)
+        if numpy:
+            return r
+        return backend.coo_sparse_matrix_from_numpy(r)
+    return PauliStringSum2Dense(ls, weight, numpy=numpy)
 
-    def heisenberg_hamiltonian(
-        g: Graph,
-        hzz: float = 1.0,
-        hxx: float = 1.0,
-        hyy: float = 1.0,
-        hz: float = 0.0,
-        hx: float = 0.0,
-        hy: float = 0.0,
-        sparse: bool = True,
-        numpy: bool = False,
-    ) -> Tensor:
-        """
-        Generate Heisenberg Hamiltonian with possible external fields.
 
-        :Example:
+def PauliStringSum2Dense(
+    ls: Sequence[Sequence[int]],
+    weight: Optional[Sequence[float]] = None,
+    numpy: bool = False,
+) -> Tensor:
+    """
+    Generate dense matrix from Pauli string sum
+
+    :param ls: 2D Tensor, each row is for a Pauli string,
+        e.g. [1, 0, 0, 3, 2] is for :math:`X_0Z_3Y_4`
+    :type ls: Sequence[Sequence[int]]
+    :param weight: 1D Tensor, each element corresponds the weight for each Pauli string
+        defaults to None (all Pauli strings weight 1.0)
+    :type weight: Optional[Sequence[float]], optional
+    :param numpy: default False. If True, return numpy coo
+        else return backend compatible sparse tensor
+    :type numpy: bool
+    :return: the tensorflow dense matrix
+    :rtype: Tensor
+    """
+    sparsem = PauliStringSum2COO_numpy(ls, weight)
+    if numpy:
+        return sparsem.todense()
+    sparsem = backend.coo_sparse_matrix_from_numpy(sparsem)
+    densem = backend.to_dense(sparsem)
+    return densem
+
+
+# already implemented as backend method
+#
+# def _tf2numpy_sparse(a: Tensor) -> Tensor:
+#     return get_backend("numpy").coo_sparse_matrix(
+#         indices=a.indices,
+#         values=a.values,
+#         shape=a.get_shape(),
+#     )
+
+# def _numpy2tf_sparse(a: Tensor) -> Tensor:
+#     return get_backend("tensorflow").coo_sparse_matrix(
+#         indices=np.array([a.row, a.col]).T,
+#         values=a.data,
+#         shape=a.shape,
+#     )
+
+
+def PauliStringSum2COO(
+    ls: Sequence[Sequence[int]],
+    weight: Optional[Sequence[float]] = None,
+    numpy: bool = False,
+) -> Tensor:
+    """
+    Generate sparse tensor from Pauli string sum
+
+    :param ls: 2D Tensor, each row is for a Pauli string,
+        e.g. [1, 0, 0, 3, 2] is for :math:`X_0Z_3Y_4`
+    :type ls: Sequence[Sequence[int]]
+    :param weight: 1D Tensor, each element corresponds the weight for each Pauli string
+        defaults to None (all Pauli strings weight 1.0)
+    :type weight: Optional[Sequence[float]], optional
+    :param numpy: default False. If True, return numpy coo
+        else return backend compatible sparse tensor
+    :type numpy: bool
+    :return: the scipy coo sparse matrix
+    :rtype: Tensor
+    """
+    # numpy version is 3* faster!
+
+    ls = np.asarray(ls)
+    nterms = ls.shape[0]
+    if weight is None:
+        weight = [1.0 for _ in range(nterms)]
+    weight = np.asarray(weight).astype(getattr(np, dtypestr))
+    nonzero = weight != 0
+    if not nonzero.all():
+        ls, weight = ls[nonzero], weight[nonzero]
+    rsparse = _pauli_string_batch_to_coo(ls, weight)
+    if numpy:
+        return rsparse
+    return backend.coo_sparse_matrix_from_numpy(rsparse)
 
-        >>> g = tc.templates.graphs.Line1D(6)
-        >>> h = qu.heisenberg_hamiltonian(g, sparse=False)
-        >>> tc.backend.eigh(h)[0][:10]
-        array([-11.2111025,  -8.4721365,  -8.472136 ,  -8.472136 ,  -6.       ,
-                -5.123106 ,  -5.123106 ,  -5.1231055,  -5.1231055,  -5.1231055],
-            dtype=float32)
-
-        :param g: input circuit graph
-        :type g: Graph
-        :param hzz: zz coupling, default is 1.0
-        :type hzz: float
-        :param hxx: xx coupling, default is 1.0
-        :type hxx: float
-        :param hyy: yy coupling, default is 1.0
-        :type hyy: float
-        :param hz: External field on z direction, default is 0.0
-        :type hz: float
-        :param hx: External field on y direction, default is 0.0
-        :type hx: float
-        :param hy: External field on x direction, default is 0.0
-        :type hy: float
-        :param sparse: Whether to return sparse Hamiltonian operator, default is True.
-        :type sparse: bool, defalts True
-        :param numpy: whether return the matrix in numpy or tensorflow form
-        :type numpy: bool, defaults False,
-
-        :return: Hamiltonian measurements
-        :rtype: Tensor
-        """
-        n = len(g.nodes)
-        ls = []
-        weight = []
-        for e in g.edges:
-            if hzz != 0:
-                r = [0 for _ in range(n)]
-                r[e[0]] = 3
-                r[e[1]] = 3
-                ls.append(r)
-                weight.append(hzz)
-            if hxx != 0:
-                r = [0 for _ in range(n)]
-                r[e[0]] = 1
-                r[e[1]] = 1
-                ls.append(r)
-                weight.append(hxx)
-            if hyy != 0:
-                r = [0 for _ in range(n)]
-                r[e[0]] = 2
-                r[e[1]] = 2
-                ls.append(r)
-                weight.append(hyy)
-        for node in g.nodes:
-            if hz != 0:
-                r = [0 for _ in range(n)]
-                r[node] = 3
-                ls.append(r)
-                weight.append(hz)
-            if hx != 0:
-                r = [0 for _ in range(n)]
-                r[node] = 1
-                ls.append(r)
-                weight.append(hx)
-            if hy != 0:
-                r = [0 for _ in range(n)]
-                r[node] = 2
-                ls.append(r)
-                weight.append(hy)
-        ls = tf.constant(ls)
-        weight = tf.constant(weight)
-        ls = get_backend("tensorflow").cast(ls, dtypestr)
-        weight = get_backend("tensorflow").cast(weight, dtypestr)
-        if sparse:
-            r = PauliStringSum2COO_numpy(ls, weight)
-            if numpy:
-                return r
-            return backend.coo_sparse_matrix_from_numpy(r)
-        return PauliStringSum2Dense(ls, weight, numpy=numpy)
-
-    def PauliStringSum2Dense(
-        ls: Sequence[Sequence[int]],
-        weight: Optional[Sequence[float]] = None,
-        numpy: bool = False,
-    ) -> Tensor:
-        """
-        Generate dense matrix from Pauli string sum
 
-        :param ls: 2D Tensor, each row is for a Pauli string,
-            e.g. [1, 0, 0, 3, 2] is for :math:`X_0Z_3Y_4`
-        :type ls: Sequence[Sequence[int]]
-        :param weight: 1D Tensor, each element corresponds the weight for each Pauli string
-            defaults to None (all Pauli strings weight 1.0)
-        :type weight: Optional[Sequence[float]], optional
-        :param numpy: default False. If True, return numpy coo
-            else return backend compatible sparse tensor
-        :type numpy: bool
-        :return: the tensorflow dense matrix
-        :rtype: Tensor
-        """
-        sparsem = PauliStringSum2COO_numpy(ls, weight)
-        if numpy:
-            return sparsem.todense()
-        sparsem = backend.coo_sparse_matrix_from_numpy(sparsem)
-        densem = backend.to_dense(sparsem)
-        return densem
-
-    # already implemented as backend method
-    #
-    # def _tf2numpy_sparse(a: Tensor) -> Tensor:
-    #     return get_backend("numpy").coo_sparse_matrix(
-    #         indices=a.indices,
-    #         values=a.values,
-    #         shape=a.get_shape(),
-    #     )
-
-    # def _numpy2tf_sparse(a: Tensor) -> Tensor:
-    #     return get_backend("tensorflow").coo_sparse_matrix(
-    #         indices=np.array([a.row, a.col]).T,
-    #         values=a.data,
-    #         shape=a.shape,
-    #     )
-
-    def PauliStringSum2COO(
-        ls: Sequence[Sequence[int]],
-        weight: Optional[Sequence[float]] = None,
-        numpy: bool = False,
-    ) -> Tensor:
-        """
-        Generate sparse tensor from Pauli string sum
+PauliStringSum2COO_numpy = partial(PauliStringSum2COO, numpy=True)
 
-        :param ls: 2D Tensor, each row is for a Pauli string,
-            e.g. [1, 0, 0, 3, 2] is for :math:`X_0Z_3Y_4`
-        :type ls: Sequence[Sequence[int]]
-        :param weight: 1D Tensor, each element corresponds the weight for each Pauli string
-            defaults to None (all Pauli strings weight 1.0)
-        :type weight: Optional[Sequence[float]], optional
-        :param numpy: default False. If True, return numpy coo
-            else return backend compatible sparse tensor
-        :type numpy: bool
-        :return: the scipy coo sparse matrix
-        :rtype: Tensor
-        """
-        # numpy version is 3* faster!
 
-        nterms = len(ls)
-        n = len(ls[0])
-        s = 0b1 << n
-        if weight is None:
-            weight = [1.0 for _ in range(nterms)]
-        if not (isinstance(weight, tf.Tensor) or isinstance(weight, tf.Variable)):
-            weight = tf.constant(weight, dtype=getattr(tf, dtypestr))
-        rsparse = get_backend("numpy").coo_sparse_matrix(
-            indices=np.array([[0, 0]], dtype=np.int64),
-            values=np.array([0.0], dtype=getattr(np, dtypestr)),
-            shape=(s, s),
-        )
-        for i in range(nterms):
-            rsparse += get_backend("tensorflow").numpy(PauliString2COO(ls[i], weight[i]))  # type: ignore
-            # auto transformed into csr format!!
-        rsparse = rsparse.tocoo()
-        if numpy:
-            return rsparse
-        return backend.coo_sparse_matrix_from_numpy(rsparse)
+try:
+
+    def _id(x: Any) -> Any:
+        return x
 
-    PauliStringSum2COO_numpy = partial(PauliStringSum2COO, numpy=True)
+    if is_m1mac():
+        compiled_jit = _id
+    else:
+        compiled_jit = partial(get_backend("tensorflow").jit, jit_compile=True)
 
     def PauliStringSum2COO_tf(
         ls: Sequence[Sequence[int]], weight: Optional[Sequence[float]] = None
@@ -1317,15 +2069,16 @@ try:
             weight = [1.0 for _ in range(nterms)]
         if not (isinstance(weight, tf.Tensor) or isinstance(weight, tf.Variable)):
             weight = tf.constant(weight, dtype=getattr(tf, dtypestr))
-        rsparse = tf.SparseTensor(
-            indices=tf.constant([[0, 0]], dtype=tf.int64),
-            values=tf.constant([0.0], dtype=weight.dtype),  # type: ignore
-            dense_shape=(s, s),
+        # gather all terms and coalesce once instead of nterms slow tf.sparse.add
+        terms = [PauliString2COO(ls[i], weight[i]) for i in range(nterms)]  # type: ignore
+        indices = tf.concat([t.indices for t in terms], 0)
+        values = tf.concat([t.values for t in terms], 0)
+        lin, pos = tf.unique(indices[:, 0] * s + indices[:, 1], out_idx=tf.int64)
+        values = tf.math.unsorted_segment_sum(values, pos, tf.size(lin, tf.int64))
+        indices = tf.stack([lin // s, lin % s], axis=1)
+        return tf.sparse.reorder(
+            tf.SparseTensor(indices=indices, values=values, dense_shape=(s, s))
         )
-        for i in range(nterms):
-            rsparse = tf.sparse.add(rsparse, PauliString2COO(ls[i], weight[i]))  # type: ignore
-            # very slow sparse.add?
-        return rsparse
 
     @compiled_jit
     def PauliString2COO(l: Sequence[int], weight: Optional[float] = None) -> Tensor:
@@ -1371,13 +2124,9 @@ try:
         idx2 = (idx1 ^ idx_x) ^ (idx_y)
         indices = tf.transpose(tf.stack([idx1, idx2]))
         tmp = idx1 & (idx_y | idx_z)
-        e = idx1 * 0
-        ny = 0
-        for i in range(nqubits):
-            # if tmp[i] is power of 2 (non zero), then e[i] = 1
-            e ^= tf.bitwise.right_shift(tmp, i) & 0b1
-            # how many 1 contained in idx_y
-            ny += tf.bitwise.right_shift(idx_y, i) & 0b1
+        # parity of the set bits of tmp gives the sign, popcount of idx_y the phase
+        e = tf.cast(tf.raw_ops.PopulationCount(x=tmp) & 0b1, tf.int64)
+        ny = tf.cast(tf.raw_ops.PopulationCount(x=idx_y), tf.int64)
         ny = tf.math.mod(ny, 4)
         values = (
             tf.cast((1 - 2 * e), dtype)
@@ -1459,6 +2208,31 @@ def entropy(rho: Union[Tensor, QuOperator], eps: float = 1e-12) -> Tensor:
     :return: Entropy on the given density matrix.
     :rtype: Tensor
     """
+    return _jitted_quantity(_entropy_core)(rho, eps)
+
+
+# jitted numerical cores of the quantum quantities, keyed by (backend, core)
+_QUANTITY_JIT_CACHE: Dict[Tuple[str, Callable[..., Tensor]], Callable[..., Tensor]] = {}
+
+
+def _jitted_quantity(
+    core: Callable[..., Tensor], static_argnums: Optional[int] = None
+) -> Callable[..., Tensor]:
+    """
+    ``core`` compiled as one fused (XLA) graph on tensorflow and jax backends,
+    ``core`` itself on backends without jit.
+    """
+    if backend.name not in ("tensorflow", "jax"):
+        return core
+    key = (backend.name, core)
+    if key not in _QUANTITY_JIT_CACHE:
+        _QUANTITY_JIT_CACHE[key] = backend.jit(
+            core, static_argnums=static_argnums, jit_compile=True
+        )
+    return _QUANTITY_JIT_CACHE[key]
+
+
+def _entropy_core(rho: Tensor, eps: float) -> Tensor:
     lbd = backend.real(backend.eigh(rho)[0])
     lbd = backend.relu(lbd)
     # we need the matrix anyway for AD.
@@ -1466,6 +2240,14 @@ def entropy(rho: Union[Tensor, QuOperator], eps: float = 1e-12) -> Tensor:
     return backend.real(entropy)
 
 
+def _trace_product_core(*o: Tensor) -> Tensor:
+    return backend.trace(reduce(matmul, o))
+
+
+def _renyi_entropy_core(rho: Tensor, k: int) -> Tensor:
+    return 1 / (1 - k) * backend.real(backend.log(_trace_product_core(*[rho] * k)))
+
+
 def trace_product(*o: Union[Tensor, QuOperator]) -> Tensor:
     """
     Compute the trace of several inputs ``o`` as tensor or ``QuOperator``.
@@ -1492,10 +2274,9 @@ def trace_product(*o: Union[Tensor, QuOperator]) -> Tensor:
     :return: The trace of several inputs.
     :rtype: Tensor
     """
-    prod = reduce(matmul, o)
-    if isinstance(prod, QuOperator):
-        return prod.trace().eval_matrix()
-    return backend.trace(prod)
+    if any(isinstance(oi, QuOperator) for oi in o):
+        return reduce(matmul, o).trace().eval_matrix()
+    return _jitted_quantity(_trace_product_core)(*o)
 
 
 def reduced_density_matrix(
@@ -1531,29 +2312,56 @@ def reduced_density_matrix(
         freedomexp = backend.sizen(state)
         # traceout = sorted(traceout)[::-1]
         freedom = int(np.log2(freedomexp) / 2)
-        # traceout2 = [i + freedom for i in traceout]
-        left = traceout + [i for i in range(freedom) if i not in traceout]
-        right = [i + freedom for i in left]
-        rho = backend.reshape(state, [2 for _ in range(2 * freedom)])
-        rho = backend.transpose(rho, perm=left + right)
-        rho = backend.reshape(
-            rho,
-            [
-                2 ** len(traceout),
-                2 ** (freedom - len(traceout)),
-                2 ** len(traceout),
-                2 ** (freedom - len(traceout)),
-            ],
-        )
-        if p is None:
-            # for i, (tr, tr2) in enumerate(zip(traceout, traceout2)):
-            #     rho = backend.trace(rho, axis1=tr, axis2=tr2 - i)
-            # correct but tf trace fail to support so much dimension with tf.einsum
-
-            rho = backend.trace(rho, axis1=0, axis2=2)
+        # group the qubits into contiguous runs of traced out / kept ones
+        runs: List[List[int]] = []
+        for i in range(freedom):
+            if runs and (i in traceout) == (runs[-1][0] in traceout):
+                runs[-1].append(i)
+            else:
+                runs.append([i])
+        if backend.name != "tensorflow" or len(runs) <= 3:
+            # a single einsum: traced out runs share the label of the row and column
+            # (tf einsum only supports repeated indices up to rank 6)
+            dims = [2 ** len(r) for r in runs]
+            traced = [j for j, r in enumerate(runs) if r[0] in traceout]
+            kept = [j for j, r in enumerate(runs) if r[0] not in traceout]
+            left = _EINSUM_SYMBOLS[: len(runs)]
+            right = "".join(
+                left[j] if j in traced else _EINSUM_SYMBOLS[len(runs) + j]
+                for j in range(len(runs))
+            )
+            out = "".join(left[j] for j in kept) + "".join(right[j] for j in kept)
+            rho = backend.reshape(state, dims + dims)
+            if p is None:
+                rho = backend.einsum(left + right + "->" + out, rho)
+            else:
+                # p is indexed by traceout in the given order, reorder to sorted runs
+                p = backend.reshape(p, [2 for _ in traceout])
+                p = backend.transpose(p, perm=list(np.argsort(traceout)))
+                p = backend.reshape(p, [dims[j] for j in traced])
+                subscripts = "".join(left[j] for j in traced)
+                rho = backend.einsum(
+                    subscripts + "," + left + right + "->" + out, p, rho
+                )
         else:
-            p = backend.reshape(p, [-1])
-            rho = backend.einsum("a,aiaj->ij", p, rho)
+            left = traceout + [i for i in range(freedom) if i not in traceout]
+            right = [i + freedom for i in left]
+            rho = backend.reshape(state, [2 for _ in range(2 * freedom)])
+            rho = backend.transpose(rho, perm=left + right)
+            rho = backend.reshape(
+                rho,
+                [
+                    2 ** len(traceout),
+                    2 ** (freedom - len(traceout)),
+                    2 ** len(traceout),
+                    2 ** (freedom - len(traceout)),
+                ],
+            )
+            if p is None:
+                rho = backend.trace(rho, axis1=0, axis2=2)
+            else:
+                p = backend.reshape(p, [-1])
+                rho = backend.einsum("a,aiaj->ij", p, rho)
         rho = backend.reshape(
             rho, [2 ** (freedom - len(traceout)), 2 ** (freedom - len(traceout))]
         )
@@ -1571,7 +2379,7 @@ def reduced_density_matrix(
         if p is None:
             rho = w @ backend.adjoint(w)
         else:
-            rho = w @ backend.diagflat(p) @ backend.adjoint(w)
+            rho = (w * backend.reshape(p, [1, -1])) @ backend.adjoint(w)
             rho /= backend.trace(rho)
     return rho
 
@@ -1623,8 +2431,9 @@ def renyi_entropy(rho: Union[Tensor, QuOperator], k: int = 2) -> Tensor:
     :return: The :math:`k` th order of Rényi entropy.
     :rtype: Tensor
     """
-    s = 1 / (1 - k) * backend.real(backend.log(trace_product(*[rho for _ in range(k)])))
-    return s
+    if isinstance(rho, QuOperator):
+        return 1 / (1 - k) * backend.real(backend.log(trace_product(*[rho] * k)))
+    return _jitted_quantity(_renyi_entropy_core, static_argnums=1)(rho, k)
 
 
 def renyi_free_energy(
@@ -1672,14 +2481,21 @@ def taylorlnm(x: Tensor, k: int) -> Tensor:
     :return: The :math:`k` th order of Taylor expansion of :math:`ln(x+1)`.
     :rtype: Tensor
     """
-    dtype = x.dtype
-    s = x.shape[-1]
-    y = 1 / k * (-1) ** (k + 1) * backend.eye(s, dtype=dtype)
-    for i in reversed(range(k)):
-        y = y @ x
-        if i > 0:
-            y += 1 / (i) * (-1) ** (i + 1) * backend.eye(s, dtype=dtype)
-    return y
+    if k == 1:
+        return x
+    return _jitted_quantity(_taylorlnm_core, static_argnums=1)(x, k)
+
+
+def _taylorlnm_core(x: Tensor, k: int, eye: Optional[Tensor] = None) -> Tensor:
+    # Horner form, the identity is built once and each step is a fusible matmul-add
+    if eye is None:
+        eye = backend.eye(x.shape[-1], dtype=x.dtype)
+    if k == 1:
+        return x
+    y = 1 / k * (-1) ** (k + 1) * eye
+    for i in reversed(range(1, k)):
+        y = y @ x + 1 / i * (-1) ** (i + 1) * eye
+    return y @ x
 
 
 def truncated_free_energy(
@@ -1699,14 +2515,19 @@ def truncated_free_energy(
     :return: The :math:`k` th order of the truncated free energy.
     :rtype: Tensor
     """
-    dtype = rho.dtype
-    s = rho.shape[-1]
-    tyexpand = rho @ taylorlnm(rho - backend.eye(s, dtype=dtype), k - 1)
-    renyi = -backend.real(backend.trace(tyexpand))
+    renyi = _jitted_quantity(_truncated_renyi_core, static_argnums=1)(rho, k)
     energy = backend.real(trace_product(rho, h))
     return energy - renyi / beta
 
 
+def _truncated_renyi_core(rho: Tensor, k: int) -> Tensor:
+    # a single identity shared by the shift and the Taylor expansion,
+    # a compile time constant on jitted backends
+    eye = backend.eye(rho.shape[-1], dtype=rho.dtype)
+    tyexpand = rho @ _taylorlnm_core(rho - eye, k - 1, eye)
+    return -backend.real(backend.trace(tyexpand))
+
+
 @partial(op2tensor, op_argnums=(0, 1))
 def trace_distance(rho: Tensor, rho0: Tensor, eps: float = 1e-12) -> Tensor:
     """
@@ -1745,7 +2566,10 @@ def fidelity(rho: Tensor, rho0: Tensor) -> Tensor:
     :rtype: Tensor
     """
     rhosqrt = backend.sqrtmh(rho)
-    return backend.real(backend.trace(backend.sqrtmh(rhosqrt @ rho0 @ rhosqrt)) ** 2)
+    # only the trace of the outer square root is needed: the sum of the square roots
+    # of the eigenvalues, without reconstructing the matrix
+    lbd = backend.eigvalsh(rhosqrt @ rho0 @ rhosqrt)
+    return backend.real(backend.sum(backend.sqrt(lbd)) ** 2)
 
 
 @op2tensor
@@ -1760,11 +2584,20 @@ def gibbs_state(h: Tensor, beta: float = 1) -> Tensor:
     :return: The Gibbs state of ``h`` with the given ``beta``.
     :rtype: Tensor
     """
-    rho = backend.expm(-beta * h)
+    rho = _expm_hermitian(h, -beta)
     rho /= backend.trace(rho)
     return rho
 
 
+def _expm_hermitian(h: Tensor, t: float) -> Tensor:
+    """
+    :math:`e^{th}` for Hermitian ``h`` from its eigendecomposition, cheaper than ``expm``.
+    """
+    w, v = backend.eigh(h)
+    ew = backend.cast(backend.exp(t * backend.real(w)), backend.dtype(v))
+    return (v * backend.reshape(ew, [1, -1])) @ backend.adjoint(v)
+
+
 @op2tensor
 def double_state(h: Tensor, beta: float = 1) -> Tensor:
     """
@@ -1777,12 +2610,31 @@ def double_state(h: Tensor, beta: float = 1) -> Tensor:
     :return: The double state of ``h`` with the given ``beta``.
     :rtype: Tensor
     """
-    rho = backend.expm(-beta / 2 * h)
+    rho = _expm_hermitian(h, -beta / 2)
     state = backend.reshape(rho, [-1])
     norm = backend.norm(state)
     return state / norm
 
 
+def _reduced_density_matrix_pair(
+    rho: Tensor, traceout: List[int]
+) -> Tuple[Tensor, Tensor]:
+    """
+    Reduced density matrices of both sides of a bipartition from one transposition
+    of ``rho``: the first traces out ``traceout``, the second keeps only ``traceout``.
+    """
+    n = int(np.log2(backend.sizen(rho)) / 2)
+    kept = [i for i in range(n) if i not in traceout]
+    left = traceout + kept
+    rho = backend.reshape(rho, [2 for _ in range(2 * n)])
+    rho = backend.transpose(rho, perm=left + [i + n for i in left])
+    dims = [2 ** len(traceout), 2 ** len(kept)]
+    rho = backend.reshape(rho, dims + dims)
+    rhoa = backend.einsum("aiaj->ij", rho)
+    rhob = backend.einsum("iaja->ij", rho)
+    return rhoa / backend.trace(rhoa), rhob / backend.trace(rhob)
+
+
 @op2tensor
 def mutual_information(s: Tensor, cut: Union[int, List[int]]) -> Tensor:
     """
@@ -1802,21 +2654,18 @@ def mutual_information(s: Tensor, cut: Union[int, List[int]]) -> Tensor:
 
     if len(s.shape) == 2 and s.shape[0] == s.shape[1]:
         # mixed state
-        n = int(np.log2(backend.sizen(s)) / 2)
-        hab = entropy(s)
-
-        # subsystem a
-        rhoa = reduced_density_matrix(s, traceout)
+        rhoa, rhob = _reduced_density_matrix_pair(s, traceout)
         ha = entropy(rhoa)
-
-        # need subsystem b as well
-        other = tuple(i for i in range(n) if i not in traceout)
-        rhob = reduced_density_matrix(s, other)  # type: ignore
         hb = entropy(rhob)
+        hab = entropy(s)
 
     # pure system
     else:
         hab = 0.0
+        # both subsystems share the spectrum, diagonalize the smaller one
+        n = int(np.log2(backend.sizen(s)))
+        if 2 * len(traceout) < n:
+            traceout = [i for i in range(n) if i not in traceout]
         rhoa = reduced_density_matrix(s, traceout)
         ha = hb = entropy(rhoa)
 
@@ -2083,6 +2932,17 @@ def measurement_counts(
             raise ValueError(
                 "unsupported format %s for analytical measurement" % format
             )
+    elif status is None and format == "count_vector" and backend.name == "numpy":
+        # one multinomial draw gives the count vector directly,
+        # without the O(counts) samples and their unique (a sort)
+        g = random_generator
+        if g is None:
+            g = getattr(backend, "g", None)
+            if g is None:
+                backend.set_random_state()
+                g = getattr(backend, "g", None)
+        p = np.asarray(pi, dtype=np.float64)
+        return g.multinomial(counts, p / np.sum(p))
     else:
         raw_counts = backend.probability_sample(
             counts, pi, status=status, g=random_generator
@@ -2166,13 +3026,25 @@ def spin_by_basis(n: int, m: int, elements: Tuple[int, int] = (1, -1)) -> Tensor
         all bitstring basis.
     :rtype: Tensor
     """
-    s = backend.tile(
-        backend.cast(
-            backend.convert_to_tensor(np.array([[elements[0]], [elements[1]]])), "int32"
-        ),
-        [2**m, int(2 ** (n - m - 1))],
-    )
-    return backend.reshape(s, [-1])
+    return backend.convert_to_tensor(_spin_by_basis_np(n, m, tuple(elements)).copy())
+
+
+@lru_cache(maxsize=128)
+def _spin_by_basis_np(n: int, m: int, elements: Tuple[int, int]) -> Tensor:
+    # the m-th bit (from the left) of each basis index selects the element
+    bit = (np.arange(2**n, dtype=np.int32) >> (n - m - 1)) & 1
+    s = elements[0] + (elements[1] - elements[0]) * bit
+    s.flags.writeable = False  # shared by all callers
+    return s
+
+
+@lru_cache(maxsize=128)
+def _spin_product_np(n: int, index: Tuple[int, ...]) -> Tensor:
+    s = np.ones([2**n], dtype=np.int32)
+    for i in index:
+        s = s * _spin_by_basis_np(n, i, (1, -1))
+    s.flags.writeable = False
+    return s
 
 
 def correlation_from_samples(index: Sequence[int], results: Tensor, n: int) -> Tensor:
@@ -2224,8 +3096,8 @@ def correlation_from_counts(index: Sequence[int], results: Tensor) -> Tensor:
     results = backend.cast(results, rdtypestr)
     results /= backend.sum(results)
     n = int(np.log(results.shape[0]) / np.log(2))
-    for i in index:
-        results = results * backend.cast(spin_by_basis(n, i), results.dtype)
+    spins = _spin_product_np(n, tuple(int(i) for i in index))
+    results = results * backend.cast(backend.convert_to_tensor(spins), results.dtype)
     return backend.sum(results)
 
 
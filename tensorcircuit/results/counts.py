@@ -1,7 +1,7 @@
 """
 dict related functionalities
 """
-from typing import Any, Dict, Sequence, Tuple
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 import numpy as np
 import qiskit
@@ -23,7 +23,7 @@ def sort_count(count: ct) -> ct:
 
 
 def normalized_count(count: ct) -> Dict[str, float]:
-    shots = sum([v for k, v in count.items()])
+    shots = sum(count.values())
     return {k: v / shots for k, v in count.items()}
 
 
@@ -36,7 +36,7 @@ def marginal_count(count: ct, keep_list: Sequence[int]) -> ct:
 def count2vec(count: ct, normalization: bool = True) -> Tensor:
     nqubit = len(list(count.keys())[0])
     probability = [0] * 2**nqubit
-    shots = sum([v for k, v in count.items()])
+    shots = sum(count.values())
     for k, v in count.items():
         if normalization is True:
             v /= shots  # type: ignore
@@ -44,20 +44,19 @@ def count2vec(count: ct, normalization: bool = True) -> Tensor:
     return np.array(probability)
 
 
-def vec2count(vec: Tensor, prune: bool = False) -> ct:
-    from ..quantum import count_vector2dict
-
-    if isinstance(vec, list):
-        vec = np.array(vec)
+def vec2count(vec: Tensor, prune: bool = False, shots: Optional[int] = None) -> ct:
+    vec = np.asarray(vec)
     n = int(np.log(vec.shape[0]) / np.log(2) + 1e-9)
-    c = count_vector2dict(vec, n, key="bin")
+    # optional scaling by shots is fused in, so that no scaled copy of vec is made
+    scale = 1 if shots is None else shots
     if prune is True:
-        nc = c.copy()
-        for k, v in c.items():
-            if np.abs(v) < 1e-8:
-                del nc[k]
-        return nc
-    return c
+        index = np.flatnonzero(np.abs(vec) * scale >= 1e-8)
+    else:
+        index = np.arange(vec.shape[0])
+    values = vec[index]
+    if shots is not None:
+        values = values * shots
+    return {np.binary_repr(i, n): v for i, v in zip(index, values.tolist())}
 
 
 def kl_divergence(c1: ct, c2: ct) -> float:
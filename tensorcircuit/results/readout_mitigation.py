@@ -3,7 +3,11 @@ readout error mitigation functionalities
 """
 # Part of the code in this file is from mthree: https://github.com/Qiskit-Partners/mthree
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, Callable, List, Sequence, Optional, Union
+import threading
 import warnings
 from time import perf_counter
 
@@ -11,7 +15,7 @@ import psutil
 import numpy as np
 import scipy.linalg as la
 import scipy.sparse.linalg as spla
-from scipy.optimize import minimize
+from scipy.optimize import lsq_linear
 
 try:
     from mthree.matrix import _reduced_cal_matrix
@@ -25,6 +29,11 @@ try:
 except ImportError:
     mthree_installed = False
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 from .counts import count2vec, vec2count, ct, marginal_count
 from ..circuit import Circuit
 from ..utils import is_sequence
@@ -33,8 +42,64 @@ from ..utils import is_sequence
 Tensor = Any
 
 
+if njit is not None:
+
+    @njit(parallel=True, cache=True)  # type: ignore
+    def _kron_local_numba(mats, out):  # type: ignore
+        n = mats.shape[0]
+        for i in prange(out.shape[0]):  # pylint: disable=not-an-iterable
+            for j in range(out.shape[1]):
+                r = 1.0
+                for k in range(n):
+                    r *= mats[k, (i >> (n - 1 - k)) & 1, (j >> (n - 1 - k)) & 1]
+                out[i, j] = r
+
+
+_NUMBA_MIN_QUBITS = 10
+# number of M3 operators (one per measured support) kept between corrections
+_MATVEC_CACHE_SIZE = 8
+
+
+def _count2bits(count: ct, n: int) -> Any:
+    """
+    Bit matrix and values of a count dict, without parsing bitstrings one by one.
+
+    :param count: count dict with bitstrings of length ``n`` as keys
+    :type count: ct
+    :param n: number of bits
+    :type n: int
+    :return: ``(bits, values)``, uint8 array of shape ``(len(count), n)`` and float array
+    :rtype: Tuple[Tensor, Tensor]
+    """
+    bits = np.frombuffer("".join(count.keys()).encode(), dtype=np.uint8) - ord("0")
+    bits = np.reshape(bits, [len(count), n])
+    values = np.fromiter(count.values(), dtype=float, count=len(count))
+    return bits, values
+
+
+def _project_simplex(v: Tensor) -> Tensor:
+    """
+    Euclidean projection of ``v`` onto the probability simplex (sort based).
+
+    :param v: 1D vector
+    :type v: Tensor
+    :return: the closest nonnegative vector summing to one
+    :rtype: Tensor
+    """
+    u = np.sort(v)[::-1]
+    css = np.cumsum(u) - 1
+    rho = np.nonzero(u * np.arange(1, len(u) + 1) > css)[0][-1]
+    theta = css[rho] / (rho + 1)
+    return np.maximum(v - theta, 0)
+
+
 class ReadoutMit:
-    def __init__(self, execute: Callable[..., List[ct]], iter_threshold: int = 4096):
+    def __init__(
+        self,
+        execute: Callable[..., List[ct]],
+        iter_threshold: int = 4096,
+        dtype: Any = "float32",
+    ):
         """
         The Class for readout error mitigation
 
@@ -42,16 +107,27 @@ class ReadoutMit:
         :type execute: Callable[..., List[ct]]
         :param iter_threshold: iteration threshold, defaults to 4096
         :type iter_threshold: int, optional
+        :param dtype: real dtype of the calibration matrices and the inverse mitigation,
+            defaults to "float32", which is far below the shot noise of the calibration
+        :type dtype: Any, optional
         """
 
         self.cal_qubits = None  #  qubit list for calibration
+        self._cal_qubits_set = frozenset()  # type: ignore
         self.use_qubits = None  # qubit list for mitigation
 
         self.local = None
         self.single_qubit_cals = None
+        self.single_qubit_inv = None
         self.global_cals = None
+        self._matrix_cache = {}  # type: ignore
+        self._newrange_lut = None
+        self._global_lu = {}  # type: ignore
+        self._matvec_cache = OrderedDict()  # type: ignore
+        self._matvec_lock = threading.Lock()
 
         self.iter_threshold = iter_threshold
+        self.dtype = np.dtype(dtype)
 
         self.execute_fun = execute
 
@@ -64,12 +140,12 @@ class ReadoutMit:
         :return: omitation related value
         :rtype: int
         """
-        name = "{:0" + str(len(self.cal_qubits)) + "b}"  # type: ignore
-        lisbs = [int(x) for x in name.format(i)]
-
-        vomit = 0
-        for k in list(filter(lambda x: x not in self.use_qubits, self.cal_qubits)):  # type: ignore
-            vomit += lisbs[self.cal_qubits.index(k)]  # type: ignore
+        n = len(self.cal_qubits)  # type: ignore
+        # bit arithmetic, so that ``i`` can also be an integer array
+        vomit = 0 * i
+        for k, q in enumerate(self.cal_qubits):  # type: ignore
+            if q not in self.use_qubits:  # type: ignore
+                vomit = vomit + ((i >> (n - 1 - k)) & 1)
         return vomit
 
     def newrange(self, m: int) -> int:
@@ -81,17 +157,19 @@ class ReadoutMit:
         :return: new index
         :rtype: int
         """
-        sorted_index = sorted(
-            range(len(self.use_qubits)), key=lambda k: self.use_qubits[k]  # type: ignore
-        )
-        name = "{:0" + str(len(self.use_qubits)) + "b}"  # type: ignore
-        lisbs = [int(x) for x in name.format(m)]
-        lisbs2 = [lisbs[i] for i in sorted_index]
-
-        indexstr = ""
-        for i in lisbs2:
-            indexstr += str(i)
-        return int(indexstr, 2)
+        key = tuple(self.use_qubits)  # type: ignore
+        if self._newrange_lut is None or self._newrange_lut[0] != key:
+            # the bit permutation as a lookup table over all indices, built once
+            sorted_index = sorted(
+                range(len(self.use_qubits)), key=lambda k: self.use_qubits[k]  # type: ignore
+            )
+            n = len(self.use_qubits)  # type: ignore
+            index = np.arange(2**n)
+            lut = np.zeros_like(index)
+            for j, i in enumerate(sorted_index):
+                lut |= ((index >> (n - 1 - i)) & 1) << (n - 1 - j)
+            self._newrange_lut = (key, lut)
+        return self._newrange_lut[1][m]  # type: ignore
 
     def get_matrix(self, qubits: Optional[Sequence[Any]] = None) -> Tensor:
         """
@@ -105,40 +183,85 @@ class ReadoutMit:
 
         if qubits is None:
             qubits = self.use_qubits
-
+        # the global matrix also depends on ``use_qubits`` via ``ubs`` and ``newrange``
+        key = (tuple(qubits), tuple(self.use_qubits or []))  # type: ignore
+        if key not in self._matrix_cache:
+            calmatrix = self._calmatrix(qubits)  # type: ignore
+            calmatrix.setflags(write=False)
+            self._matrix_cache[key] = calmatrix
+        self.calmatrix = self._matrix_cache[key]
+        return self.calmatrix
+
+    def _calmatrix(self, qubits: Sequence[Any]) -> Tensor:
         if self.local is False:
 
-            lbs = [marginal_count(i, qubits) for i in self.global_cal]
-            calmatrix = np.zeros((2 ** len(qubits), 2 ** len(qubits)))
-
-            m = 0
-            for i in range(len(lbs)):
-                vv = self.ubs(i)
-                if vv == 0:
-                    for s in lbs[i]:
-                        calmatrix[int(s, 2)][self.newrange(m)] = (
-                            lbs[i][s] / self.cal_shots
-                        )
-                    m += 1
-            self.calmatrix = calmatrix
+            calmatrix = np.zeros((2 ** len(qubits), 2 ** len(qubits)), dtype=self.dtype)
+            index = np.arange(len(self.global_cal))
+            if list(self.use_qubits) == list(self.cal_qubits):  # type: ignore
+                # nothing omitted and already sorted: calibration i is column i
+                cols = index
+            else:
+                # only calibration circuits with all unused qubits in 0 contribute
+                index = index[self.ubs(index) == 0]
+                cols = self.newrange(np.arange(len(index)))
+            # the raw results already are the marginal if qubits are the full register
+            width = len(next(iter(self.global_cal[0])))
+            trivial = list(qubits) == list(range(width))
+            powers = 1 << np.arange(len(qubits) - 1, -1, -1)
+            for i, col in zip(index, cols):
+                lbs = self.global_cal[i]
+                if not trivial:
+                    lbs = marginal_count(lbs, qubits)
+                bits, values = _count2bits(lbs, len(qubits))
+                calmatrix[bits @ powers, col] = values / self.cal_shots
             return calmatrix
 
         # self.local = True
-        calmatrix = self.single_qubit_cals[qubits[0]]  # type: ignore
-        for i in range(1, len(qubits)):  # type: ignore
-            calmatrix = np.kron(calmatrix, self.single_qubit_cals[qubits[i]])  # type: ignore
-        self.calmatrix = calmatrix  # type: ignore
-        return calmatrix
+        n = len(qubits)  # type: ignore
+        if njit is not None and n >= _NUMBA_MIN_QUBITS:
+            mats = np.stack([self.single_qubit_cals[q] for q in qubits])  # type: ignore
+            calmatrix = np.empty([2**n, 2**n], dtype=self.dtype)
+            _kron_local_numba(mats.astype(self.dtype), calmatrix)
+            return calmatrix
+        # kronecker product of all single qubit matrices as one outer product
+        operands = []
+        for i, q in enumerate(qubits):  # type: ignore
+            operands += [self.single_qubit_cals[q], [i, n + i]]  # type: ignore
+        calmatrix = np.einsum(*operands, list(range(2 * n)))
+        return np.reshape(calmatrix, [2**n, 2**n]).astype(self.dtype, copy=False)
+
+    def _apply_local(
+        self, p: Tensor, inverse: bool = False, transpose: bool = False
+    ) -> Tensor:
+        """
+        Apply the local calibration matrix (or its inverse) on ``p`` without forming
+        the ``2^n x 2^n`` matrix: each single qubit matrix acts on its own axis.
+
+        :param p: probability vector of the used qubits
+        :type p: Tensor
+        :param inverse: whether to apply the inverse calibration matrix, defaults to False
+        :type inverse: bool, optional
+        :param transpose: whether to apply the transposed matrix, defaults to False
+        :type transpose: bool, optional
+        :return: the transformed probability vector
+        :rtype: Tensor
+        """
+        n = len(self.use_qubits)  # type: ignore
+        p = np.reshape(p, [2 for _ in range(n)])
+        mats = self.single_qubit_inv if inverse else self.single_qubit_cals
+        for k, q in enumerate(self.use_qubits):  # type: ignore
+            a = mats[q]  # type: ignore
+            p = np.moveaxis(np.tensordot(a, p, axes=[[int(not transpose)], [k]]), 0, k)
+        return np.reshape(p, [-1])
 
     def _form_cals(self, qubits):  # type: ignore
 
-        qubits = np.asarray(qubits, dtype=int)
-        cals = np.zeros(4 * qubits.shape[0], dtype=float)
-
         # Reverse index qubits for easier indexing later
-        for kk, qubit in enumerate(qubits[::-1]):
-            cals[4 * kk : 4 * kk + 4] = self.single_qubit_cals[qubit].ravel()  # type: ignore
-        return cals
+        if isinstance(self.single_qubit_cals, np.ndarray):
+            cals = self.single_qubit_cals[np.asarray(qubits, dtype=int)[::-1]]
+        else:
+            cals = np.stack([self.single_qubit_cals[q] for q in qubits[::-1]])  # type: ignore
+        return np.reshape(cals, [-1]).astype(float)
 
     def local_miti_readout_circ(self) -> List[Circuit]:
         """
@@ -164,14 +287,14 @@ class ReadoutMit:
         :return: circuit list
         :rtype: List[Circuit]
         """
+        n = len(self.cal_qubits)  # type: ignore
+        # bit table of all basis states, the first calibration qubit is the highest bit
+        bits = (np.arange(2**n)[:, None] >> np.arange(n - 1, -1, -1)) & 1
         miticirc = []
-        for i in range(2 ** len(self.cal_qubits)):  # type: ignore
-            name = "{:0" + str(len(self.cal_qubits)) + "b}"  # type: ignore
-            lisbs = [int(x) for x in name.format(i)]
+        for row in bits:
             c = Circuit(max(self.cal_qubits) + 1)  # type: ignore
-            for k in range(len(self.cal_qubits)):  # type: ignore
-                if lisbs[k] == 1:
-                    c.X(self.cal_qubits[k])  # type: ignore
+            for k in np.flatnonzero(row):
+                c.X(self.cal_qubits[k])  # type: ignore
             miticirc.append(c)
         return miticirc
 
@@ -192,7 +315,11 @@ class ReadoutMit:
             qubits = list(range(qubits))  # type: ignore
         qubits.sort()  # type: ignore
         self.cal_qubits = qubits  # type: ignore
+        self._cal_qubits_set = frozenset(qubits)  # type: ignore
         self.cal_shots = shots
+        self._matrix_cache = {}
+        self._global_lu = {}
+        self._matvec_cache = OrderedDict()
 
         if method == "local":
             self.local = True  # type: ignore
@@ -200,25 +327,21 @@ class ReadoutMit:
             lbsall = self.execute_fun(miticirc, self.cal_shots)
             lbs = [marginal_count(i, self.cal_qubits) for i in lbsall]  # type: ignore
 
-            self.single_qubit_cals = [None] * (max(self.cal_qubits) + 1)  # type: ignore
-            for i in range(len(self.cal_qubits)):  # type: ignore
-                error00 = 0
-                for s in lbs[0]:
-                    if s[i] == "0":
-                        error00 = error00 + lbs[0][s] / self.cal_shots  # type: ignore
-
-                error10 = 0
-                for s in lbs[1]:
-                    if s[i] == "0":
-                        error10 = error10 + lbs[1][s] / self.cal_shots  # type: ignore
-
-                readout_single = np.array(
-                    [
-                        [error00, error10],
-                        [1 - error00, 1 - error10],
-                    ]
-                )
-                self.single_qubit_cals[self.cal_qubits[i]] = readout_single  # type: ignore
+            # probability of reading 0 on each qubit, for all qubits at once
+            zero_probs = []
+            for lb in lbs:
+                bits, values = _count2bits(lb, len(self.cal_qubits))  # type: ignore
+                zero_probs.append((1 - bits).T @ values / self.cal_shots)
+            # [[error00, error10], [1 - error00, 1 - error10]] for each qubit
+            error = np.stack(zero_probs, axis=-1)
+            readout = np.stack([error, 1 - error], axis=1)
+            # one contiguous (N, 2, 2) array indexed by qubit, nan for uncalibrated qubits
+            self.single_qubit_cals = np.full(  # type: ignore
+                [max(self.cal_qubits) + 1, 2, 2], np.nan, dtype=self.dtype  # type: ignore
+            )
+            self.single_qubit_cals[self.cal_qubits] = readout  # type: ignore
+            self.single_qubit_inv = np.full_like(self.single_qubit_cals, np.nan)  # type: ignore
+            self.single_qubit_inv[self.cal_qubits] = np.linalg.inv(readout)  # type: ignore
 
         elif method == "global":
             self.local = False  # type: ignore
@@ -230,7 +353,10 @@ class ReadoutMit:
             raise ValueError("Unrecognized `miti_method`: %s" % method)
 
     def mitigate_probability(
-        self, probability_noise: Tensor, method: str = "inverse"
+        self,
+        probability_noise: Tensor,
+        method: str = "inverse",
+        distance: Optional[int] = None,
     ) -> Tensor:
         """
         Get the mitigated probability.
@@ -239,29 +365,73 @@ class ReadoutMit:
         :type probability_noise: Tensor
         :param method: mitigation methods, defaults to "inverse", it can also be "square"
         :type method: str, optional
+        :param distance: Hamming distance for the reduced calibration matrix on the
+            observed bitstrings (local calibration and "inverse" method only),
+            defaults to None (the full calibration matrix)
+        :type distance: int, optional
         :return: mitigated probability
         :rtype: Tensor
         """
-        calmatrix = self.get_matrix()
+        if distance is not None and self.local and method == "inverse":
+            if mthree_installed:
+                return self._reduced_inverse(probability_noise, distance)
+            warnings.warn(
+                "mthree is not installed, fall back to the full calibration matrix"
+            )
+        # local calibration matrix is applied qubit by qubit and never formed
         if method == "inverse":
-            X = np.linalg.inv(calmatrix)
-            Y = probability_noise
-            probability_cali = X @ Y
+            probability_noise = np.asarray(probability_noise, dtype=self.dtype)
+            if self.local:
+                probability_cali = self._apply_local(probability_noise, inverse=True)
+            else:
+                key = tuple(self.use_qubits)  # type: ignore
+                if key not in self._global_lu:
+                    self._global_lu[key] = la.lu_factor(
+                        self.get_matrix(), check_finite=False
+                    )
+                probability_cali = la.lu_solve(
+                    self._global_lu[key], probability_noise, check_finite=False
+                )
         else:  # method="square"
-
-            def fun(x: Any) -> Any:
-                return sum((probability_noise - calmatrix @ x) ** 2)
-
-            x0 = np.random.rand(len(probability_noise))
-            cons = {"type": "eq", "fun": lambda x: 1 - sum(x)}
-            bnds = tuple((0, 1) for x in x0)
-            res = minimize(
-                fun, x0, method="SLSQP", constraints=cons, bounds=bnds, tol=1e-6
+            if self.local:
+                size = len(probability_noise)
+                calmatrix = spla.LinearOperator(
+                    (size, size),
+                    matvec=self._apply_local,
+                    rmatvec=partial(self._apply_local, transpose=True),
+                )
+            else:
+                calmatrix = self.get_matrix()
+            # bounded least squares, then the sum-to-one constraint by projection
+            res = lsq_linear(
+                calmatrix,
+                probability_noise,
+                bounds=(0, 1),
+                lsq_solver="lsmr",
+                tol=1e-6,
             )
-            probability_cali = res.x
+            probability_cali = _project_simplex(res.x)
+        return probability_cali
+
+    def _reduced_inverse(self, probability_noise: Tensor, distance: int) -> Tensor:
+        """
+        Solve the calibration matrix restricted to the observed bitstrings within
+        Hamming ``distance`` of each other, as in the mthree direct solver.
+        """
+        n = len(self.use_qubits)  # type: ignore
+        counts = vec2count(probability_noise, prune=True)
+        # mthree reads bitstrings from the right, ours start with ``use_qubits[0]``
+        cals = self._form_cals(self.use_qubits[::-1])  # type: ignore
+        A, sorted_counts, _ = _reduced_cal_matrix(counts, cals, n, distance)
+        LU = la.lu_factor(A, check_finite=False)
+        x = la.lu_solve(LU, counts_to_vector(sorted_counts), check_finite=False)
+        probability_cali = np.zeros([len(probability_noise)])
+        probability_cali[[int(k, 2) for k in sorted_counts]] = x
         return probability_cali
 
-    def apply_readout_mitigation(self, raw_count: ct, method: str = "inverse") -> ct:
+    def apply_readout_mitigation(
+        self, raw_count: ct, method: str = "inverse", distance: Optional[int] = None
+    ) -> ct:
         """
         Main readout mitigation program for method="inverse" or "square"
 
@@ -269,14 +439,18 @@ class ReadoutMit:
         :type raw_count: ct
         :param method: mitigation method, defaults to "inverse"
         :type method: str, optional
+        :param distance: Hamming distance for the reduced calibration matrix,
+            defaults to None
+        :type distance: int, optional
         :return: mitigated count
         :rtype: ct
         """
-        probability = count2vec(raw_count)
-        shots = sum([v for k, v in raw_count.items()])
-        probability = self.mitigate_probability(probability, method=method)
-        probability = probability * shots
-        return vec2count(probability)
+        shots = sum(raw_count.values())
+        probability = count2vec(raw_count, normalization=False) / shots
+        probability = self.mitigate_probability(
+            probability, method=method, distance=distance
+        )
+        return vec2count(probability, prune=True, shots=shots)
 
     def apply_correction(
         self,
@@ -292,7 +466,7 @@ class ReadoutMit:
         """
         Main readout mitigation program for all methods.
 
-        :param counts: raw count
+        :param counts: raw count, or a list of raw counts mitigated one by one
         :type counts: ct
         :param qubits: used qubit list
         :type qubits: Sequence[Any]
@@ -314,19 +488,26 @@ class ReadoutMit:
         if not is_sequence(qubits):
             qubits = list(range(qubits))  # type: ignore
         self.use_qubits = qubits  # type: ignore
-        if not set(self.use_qubits).issubset(set(self.cal_qubits)):  # type: ignore
+        if not self._cal_qubits_set.issuperset(self.use_qubits):  # type: ignore
             raise ValueError(
                 "The qubit list used in calculation must included in  the calibration qubit list."
             )
 
-        counts = marginal_count(counts, self.use_qubits)  # type: ignore
+        if isinstance(counts, list):
+            counts = [marginal_count(c, self.use_qubits) for c in counts]  # type: ignore
+        else:
+            counts = marginal_count(counts, self.use_qubits)  # type: ignore
 
         # methods for small system, "global" calibration only fit for those methods.
-        if method == "inverse":
-            mitcounts = self.apply_readout_mitigation(counts, method="inverse")
-            return mitcounts
-        elif method == "square":
-            mitcounts = self.apply_readout_mitigation(counts, method="square")
+        if method in ["inverse", "square"]:
+            if isinstance(counts, list):
+                return [  # type: ignore
+                    self.apply_readout_mitigation(c, method=method, distance=distance)
+                    for c in counts
+                ]
+            mitcounts = self.apply_readout_mitigation(
+                counts, method=method, distance=distance
+            )
             return mitcounts
         if mthree_installed is False:
             warnings.warn(
@@ -354,12 +535,19 @@ class ReadoutMit:
         if len(qubits) != len(counts):
             raise M3Error("Length of counts does not match length of qubits.")
 
-        quasi_out = []
-        for idx, cnts in enumerate(counts):
-
-            quasi_out.append(
+        # counts on the same support share one M3 operator and are solved in order
+        # within one task, each warm starting GMRES from the previous solution,
+        # so the result does not depend on earlier corrections or thread scheduling
+        groups = {}  # type: ignore
+        for idx in range(len(counts)):
+            support = (tuple(qubits[idx]), frozenset(dict(counts[idx])))
+            groups.setdefault(support, []).append(idx)
+
+        def correct(idxs: List[int]) -> List[Any]:
+            x0s = {}  # type: ignore
+            return [
                 self._apply_correction(
-                    cnts,
+                    counts[idx],
                     qubits=qubits[idx],
                     distance=distance,
                     method=method,
@@ -367,8 +555,22 @@ class ReadoutMit:
                     tol=tol,
                     return_mitigation_overhead=return_mitigation_overhead,
                     details=details,
+                    x0s=x0s,
                 )
-            )
+                for idx in idxs
+            ]
+
+        # groups are independent and spend their time in LAPACK / sparse
+        # routines that release the GIL, so a batch runs in a thread pool
+        if len(groups) == 1:
+            outs = [correct(list(range(len(counts))))]
+        else:
+            with ThreadPoolExecutor() as executor:
+                outs = list(executor.map(correct, groups.values()))
+        quasi_out = [None] * len(counts)
+        for idxs, out in zip(groups.values(), outs):
+            for idx, quasi in zip(idxs, out):
+                quasi_out[idx] = quasi
 
         if not given_list:
             return quasi_out[0]  # type: ignore
@@ -385,6 +587,7 @@ class ReadoutMit:
         tol=1e-5,
         return_mitigation_overhead=False,
         details=False,
+        x0s=None,
     ):
 
         # This is needed because counts is a Counts object in Qiskit not a dict.
@@ -411,7 +614,12 @@ class ReadoutMit:
             self._grab_additional_cals(qubits, method=self.cal_method)  # type: ignore
 
         # Check if one or more new qubits need to be calibrated.
-        missing_qubits = [qq for qq in qubits if self.single_qubit_cals[qq] is None]  # type: ignore
+        missing_qubits = [
+            qq
+            for qq in qubits
+            if self.single_qubit_cals[qq] is None  # type: ignore
+            or np.isnan(self.single_qubit_cals[qq]).any()  # type: ignore
+        ]
         if any(missing_qubits):
             warnings.warn(
                 "Computing missing calibrations for qubits: {}".format(missing_qubits)
@@ -460,6 +668,7 @@ class ReadoutMit:
                     1,
                     callback,
                     return_mitigation_overhead,
+                    x0s,
                 )
                 dur = perf_counter() - st
                 mit_counts.shots = shots
@@ -479,6 +688,7 @@ class ReadoutMit:
                 0,
                 None,
                 return_mitigation_overhead,
+                x0s,
             )
             mit_counts.shots = shots
             if gamma is not None:
@@ -536,32 +746,60 @@ class ReadoutMit:
         details=0,
         callback=None,
         return_mitigation_overhead=False,
+        x0s=None,
     ):
 
-        cals = self._form_cals(qubits)
-        M = M3MatVec(dict(counts), cals, distance)
-        L = spla.LinearOperator(
-            (M.num_elems, M.num_elems), matvec=M.matvec, rmatvec=M.rmatvec
-        )
-        diags = M.get_diagonal()
-
-        def precond_matvec(x):  # type: ignore
-            out = x / diags
-            return out
-
-        P = spla.LinearOperator((M.num_elems, M.num_elems), precond_matvec)
-        vec = counts_to_vector(M.sorted_counts)
+        counts = dict(counts)
+        # the operators only depend on the measured bitstrings, not on their counts,
+        # so they are reused for the same support, the least recently used is evicted
+        key = (tuple(qubits), distance, frozenset(counts))
+        with self._matvec_lock:
+            ops = self._matvec_cache.get(key)
+            if ops is not None:
+                self._matvec_cache.move_to_end(key)
+        if ops is None:
+            cals = self._form_cals(qubits)
+            M = M3MatVec(counts, cals, distance)
+            L = spla.LinearOperator(
+                (M.num_elems, M.num_elems), matvec=M.matvec, rmatvec=M.rmatvec
+            )
+            inv_diags = np.reciprocal(M.get_diagonal())
+
+            def precond_matvec(x):  # type: ignore
+                return x * inv_diags
+
+            P = spla.LinearOperator((M.num_elems, M.num_elems), precond_matvec)
+            with self._matvec_lock:
+                ops = self._matvec_cache.setdefault(key, (M, L, P))
+                self._matvec_cache.move_to_end(key)
+                if len(self._matvec_cache) > _MATVEC_CACHE_SIZE:
+                    self._matvec_cache.popitem(last=False)
+        M, L, P = ops
+        # warm start from the last solution on the same support in this call
+        x0 = None if x0s is None else x0s.get(key)
+        sorted_counts = {k: counts[k] for k in M.sorted_counts}
+        vec = counts_to_vector(sorted_counts)
         out, error = spla.gmres(
-            L, vec, tol=tol, atol=tol, maxiter=max_iter, M=P, callback=callback
+            L,
+            vec,
+            x0=x0,
+            tol=tol,
+            atol=tol,
+            restart=20,
+            maxiter=max_iter,
+            M=P,
+            callback=callback,
         )
         if error:
             raise M3Error("GMRES did not converge: {}".format(error))
+        if x0s is not None:
+            x0s[key] = out
 
         gamma = None
         if return_mitigation_overhead:
             gamma = ainv_onenorm_est_iter(M, tol=tol, max_iter=max_iter)
 
-        quasi = vector_to_quasiprobs(out, M.sorted_counts)
+        quasi = vector_to_quasiprobs(out, sorted_counts)
         if details:
             return quasi, M.get_col_norms(), gamma
         return quasi, gamma
@@ -204,9 +204,12 @@ def _full_rank_simplify(nodes: List[Any]) -> List[Any]:
 
 def _light_cone_cancel(nodes: List[Any]) -> Tuple[List[Any], bool]:
     is_changed = False
+    # cancelled pairs are dropped in one go after the sweep, a cancellation
+    # only exposes earlier gates, which are still ahead in the same sweep
+    removed = set()
     for ind in range(len(nodes) // 2, 0, -1):
         n = nodes[ind]
-        if n.is_dagger is True:
+        if id(n) in removed or n.is_dagger is True:
             continue
         noe = len(n.shape)
         if noe % 2 != 0:
@@ -235,7 +238,6 @@ def _light_cone_cancel(nodes: List[Any]) -> Tuple[List[Any], bool]:
                 n1, n2 = n2, n1  # make sure n1 is n dagger is False
 
             # contract
-            njs = [i for i, n in enumerate(nodes) if id(n) in [id(n1), id(n2)]]
             # new_node = tn.contract_between(e.node1, e.node2)
             # contract(e) is not enough for multi edges between two tensors
             for i in range(noe // 2):
@@ -254,10 +256,10 @@ def _light_cone_cancel(nodes: List[Any]) -> Tuple[List[Any], bool]:
                     i2, i4 = i4, i2
                 e.disconnect()
                 m3[i3] ^ m4[i4]
-            nodes = _multi_remove(nodes, njs)
-
+            removed.update([id(n1), id(n2)])
             is_changed = True
-            break  # switch to the next node
+    if removed:
+        nodes = [n for n in nodes if id(n) not in removed]
     return nodes, is_changed
 
 
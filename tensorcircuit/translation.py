@@ -2,7 +2,7 @@
 Circuit object translation in different packages
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 from copy import deepcopy
 import logging
 import numpy as np
@@ -43,15 +43,13 @@ def perm_matrix(n: int) -> Tensor:
     :return: The permutation matrix P
     :rtype: Tensor
     """
+    # P is the bit reversal permutation, only its 2**n nonzeros are written
+    i = np.arange(2**n)
+    revs_i = np.zeros_like(i)
+    for j in range(n):
+        revs_i |= ((i >> j) & 1) << (n - j - 1)
     p_mat = np.zeros([2**n, 2**n])
-    for i in range(2**n):
-        bit = i
-        revs_i = 0
-        for j in range(n):
-            if bit & 0b1:
-                revs_i += 1 << (n - j - 1)
-            bit = bit >> 1
-        p_mat[i, revs_i] = 1
+    p_mat[i, revs_i] = 1
     return p_mat
 
 
@@ -59,7 +57,7 @@ def _get_float(parameters: Any, key: str, default: int = 0) -> float:
     return np.real(backend.numpy(gates.array_to_tensor(parameters.get(key, default)))).item()  # type: ignore
 
 
-def qir2qiskit(qir: List[Dict[str, Any]], n: int) -> Any:
+def qir2qiskit(qir: Sequence[Dict[str, Any]], n: int) -> Any:
     r"""
     Generate a qiskit quantum circuit using the quantum intermediate
     representation (qir) in tensorcircuit.
@@ -75,7 +73,7 @@ def qir2qiskit(qir: List[Dict[str, Any]], n: int) -> Any:
      (Instruction(name='x', num_qubits=1, num_clbits=0, params=[]), [Qubit(QuantumRegister(2, 'q'), 1)], [])]
 
     :param qir: The quantum intermediate representation of a circuit.
-    :type qir: List[Dict[str, Any]]
+    :type qir: Sequence[Dict[str, Any]]
     :param n: # of qubits
     :type n: int
     :return: qiskit QuantumCircuit object
@@ -334,13 +332,13 @@ def json_to_tensor(a: Any) -> Any:
 
 
 def qir2json(
-    qir: List[Dict[str, Any]], simplified: bool = False
+    qir: Sequence[Dict[str, Any]], simplified: bool = False
 ) -> List[Dict[str, Any]]:
     """
     transform qir to json compatible list of dict where array is replaced by real and imaginary list
 
     :param qir: _description_
-    :type qir: List[Dict[str, Any]]
+    :type qir: Sequence[Dict[str, Any]]
     :param simplified: If False, keep all info for each gate, defaults to be False.
         If True, suitable for IO since less information is required
     :type simplified: bool
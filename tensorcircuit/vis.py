@@ -4,7 +4,7 @@ Visualization on circuits
 import os
 import subprocess
 from uuid import uuid4
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -32,7 +32,7 @@ def gate_name_trans(gate_name: str) -> Tuple[int, str]:
 
 
 def qir2tex(
-    qir: List[Dict[str, Any]],
+    qir: Sequence[Dict[str, Any]],
     n: int,
     init: Optional[List[str]] = None,
     measure: Optional[List[str]] = None,
@@ -52,7 +52,7 @@ def qir2tex(
     '\\begin{quantikz}\n\ ... \n\\end{quantikz}'
 
     :param qir: The quantum intermediate representation of a circuit in tensorcircuit.
-    :type qir: List[Dict[str, Any]]
+    :type qir: Sequence[Dict[str, Any]]
     :param n: # of qubits
     :type n: int
     :param init: Initial state, default is an all zero state '000...000'.
@@ -9,6 +9,27 @@ sys.path.insert(0, modulepath)
 import tensorcircuit as tc
 
 
+_backend_fixtures = {"npb", "tfb", "jaxb", "torchb"}
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of the same group on one xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # group backend-parametrized tests by backend, so that with
+    # ``pytest -n auto --dist=loadgroup`` each backend is initialized on one worker
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is None or item.get_closest_marker("xdist_group") is not None:
+            continue
+        name = getattr(callspec.params.get("backend"), "name", None)
+        if name in _backend_fixtures:
+            item.add_marker(pytest.mark.xdist_group(name="backend-" + name))
+
+
 @pytest.fixture(scope="function")
 def npb():
     tc.set_backend("numpy")
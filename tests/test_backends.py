@@ -829,6 +829,25 @@ def test_function_level_set_contractor(backend):
     print(tc.contractor)
 
 
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_linegraph_contractor(backend):
+    def f():
+        c = tc.Circuit(5)
+        for i in range(5):
+            c.h(i)
+        for _ in range(2):
+            for i in range(4):
+                c.cnot(i, i + 1)
+            for i in range(5):
+                c.rx(i, theta=0.3 * i)
+        return c.expectation_ps(z=[0, 2])
+
+    r0 = f()
+    with tc.runtime_contractor("linegraph"):
+        r1 = f()
+    np.testing.assert_allclose(r0, r1, atol=1e-5)
+
+
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
 def test_with_level_set(backend):
     with tc.runtime_backend("jax"):
@@ -2,7 +2,9 @@
 
 import sys
 import os
-from functools import partial
+import json
+from functools import lru_cache, partial
+from types import SimpleNamespace
 import numpy as np
 import opt_einsum as oem
 import pytest
@@ -17,26 +19,71 @@ sys.path.insert(0, modulepath)
 import tensorcircuit as tc
 
 
+@lru_cache(maxsize=256)
+def _cached_path(method, inputs, output, size_items):
+    return getattr(oem.paths, method)(
+        [set(i) for i in inputs], set(output), dict(size_items)
+    )
+
+
+def _cached_optimizer(method):
+    def optimizer(inputs, output, size_dict, memory_limit=None):
+        # the same network traced again (new key, new jit or vmap trace, another backend)
+        # skips path search
+        return _cached_path(
+            method,
+            tuple(frozenset(i) for i in inputs),
+            frozenset(output),
+            tuple(sorted(size_dict.items())),
+        )
+
+    return optimizer
+
+
+cached_contractor = tc.set_function_contractor(
+    "custom", optimizer=_cached_optimizer("greedy"), preprocessing=True
+)
+# higher quality path for the larger networks, searched once per session
+cached_hq_contractor = tc.set_function_contractor(
+    "custom", optimizer=_cached_optimizer("auto_hq"), preprocessing=True
+)
+
+
+@lru_cache(maxsize=None)
+def _cached_mc_x_10(backend_name, dtype):
+    # the MPO tensors are backend and dtype specific, so build once per pair;
+    # callers take a .copy() before wiring it into a circuit
+    return tc.gates.multicontrol_gate(tc.gates._x_matrix, ctrl=[1, 0])
+
+
+def mc_x_10():
+    return _cached_mc_x_10(tc.backend.name, tc.cons.dtypestr).copy()
+
+
+_PAULI_STACK = np.stack([g.tensor for g in tc.gates.pauli_gates])
+_ARANGE16 = np.arange(16, dtype=np.complex64).reshape(2, 2, 2, 2)
+_ARANGE4 = np.arange(4, dtype=np.complex64).reshape(2, 2)
+_XX = tc.gates._xx_matrix.astype(np.complex64)
+_KRON_XY = np.kron(tc.gates._x_matrix, tc.gates._y_matrix)
+_INPUTS_8 = np.random.default_rng(0).standard_normal(8)
+_INPUTS_8 /= np.linalg.norm(_INPUTS_8)
+# X on the target iff the controls read 10: swaps basis states 100 and 101
+_MC_X_10_MATRIX = np.eye(8)[[0, 1, 2, 3, 5, 4, 6, 7]]
+# shared across tests, so they must never be written to
+for _const in [_ARANGE16, _ARANGE4, _XX, _KRON_XY, _INPUTS_8, _MC_X_10_MATRIX]:
+    _const.setflags(write=False)
+
+
 def test_wavefunction():
     qc = tc.Circuit(2)
-    qc.unitary(
-        0,
-        1,
-        unitary=tc.gates.Gate(np.arange(16).reshape(2, 2, 2, 2).astype(np.complex64)),
-    )
+    qc.unitary(0, 1, unitary=tc.gates.Gate(_ARANGE16))
     assert np.real(qc.wavefunction()[2]) == 8
     qc = tc.Circuit(2)
-    qc.unitary(
-        1,
-        0,
-        unitary=tc.gates.Gate(np.arange(16).reshape(2, 2, 2, 2).astype(np.complex64)),
-    )
+    qc.unitary(1, 0, unitary=tc.gates.Gate(_ARANGE16))
     qc.wavefunction()
     assert np.real(qc.wavefunction()[2]) == 4
     qc = tc.Circuit(2)
-    qc.unitary(
-        0, unitary=tc.gates.Gate(np.arange(4).reshape(2, 2).astype(np.complex64))
-    )
+    qc.unitary(0, unitary=tc.gates.Gate(_ARANGE4))
     qc.wavefunction()
     assert np.real(qc.wavefunction()[2]) == 2
 
@@ -86,12 +133,19 @@ def test_jittable_measure(backend):
     def f(param, key, n=6, nlayers=3):
         if key is not None:
             tc.backend.set_random_state(key)
+        # the zz terms of a layer commute, so each layer is one diagonal unitary
+        # exp(-i sum_i theta_i z_i z_{i+1}) on all n qubits instead of n - 1 gates
+        bits = (np.arange(2**n)[None, :] >> np.arange(n - 1, -1, -1)[:, None]) & 1
+        z = 1 - 2 * bits
+        zz = tc.backend.cast(z[:-1] * z[1:], "complex64")
+        eye = tc.backend.eye(2**n, dtype="complex64")
         c = tc.Circuit(n)
         for i in range(n):
             c.H(i)
         for j in range(nlayers):
-            for i in range(n - 1):
-                c.exp1(i, i + 1, theta=param[2 * j, i], hamiltonian=tc.gates._zz_matrix)
+            theta = tc.backend.reshape(param[2 * j, : n - 1], [-1, 1])
+            phase = tc.backend.exp(-1.0j * tc.backend.sum(theta * zz, axis=0))
+            c.any(*range(n), unitary=eye * phase)
             for i in range(n):
                 c.rx(i, theta=param[2 * j + 1, i])
         return c.measure_jit(0, 1, 2, with_prob=True)
@@ -114,6 +168,16 @@ def test_jittable_measure(backend):
 
 @pytest.mark.parametrize("backend", [lf("tfb"), lf("jaxb")])
 def test_jittable_depolarizing(backend):
+    # the same Kraus operators are captured by every trace instead of rebuilt inside
+    paulis = [
+        tc.gates._x_matrix,
+        tc.gates._y_matrix,
+        tc.gates._z_matrix,
+        tc.gates._i_matrix,
+    ]
+    kraus = tc.channels.depolarizingchannel(0.2, 0.2, 0.2)
+
+    @cached_contractor
     @tc.backend.jit
     def f1(key):
         n = 5
@@ -125,23 +189,14 @@ def test_jittable_depolarizing(backend):
         for i in range(n):
             c.cnot(i, (i + 1) % n)
         for i in range(n):
-            c.unitary_kraus(
-                [
-                    tc.gates._x_matrix,
-                    tc.gates._y_matrix,
-                    tc.gates._z_matrix,
-                    tc.gates._i_matrix,
-                ],
-                i,
-                prob=[0.2, 0.2, 0.2, 0.4],
-            )
+            c.unitary_kraus(paulis, i, prob=[0.2, 0.2, 0.2, 0.4])
         for i in range(n):
             c.cz(i, (i + 1) % n)
         return c.wavefunction()
 
-    @tc.backend.jit
-    def f2(key):
-        n = 5
+    def depolarized_layer(key, noise, n=5):
+        # H layer, cnot ring, one noise channel per qubit and an X layer,
+        # shared by f2 - f5 which only differ in how the channel is applied
         if key is not None:
             tc.backend.set_random_state(key)
         c = tc.Circuit(n)
@@ -150,86 +205,52 @@ def test_jittable_depolarizing(backend):
         for i in range(n):
             c.cnot(i, (i + 1) % n)
         for i in range(n):
-            c.unitary_kraus(
-                tc.channels.depolarizingchannel(0.2, 0.2, 0.2),
-                i,
-            )
+            noise(c, i)
         for i in range(n):
             c.X(i)
         return c.wavefunction()
 
+    @cached_contractor
+    @tc.backend.jit
+    def f2(key):
+        return depolarized_layer(key, lambda c, i: c.unitary_kraus(kraus, i))
+
+    @cached_contractor
     @tc.backend.jit
     def f3(key):
-        n = 5
-        if key is not None:
-            tc.backend.set_random_state(key)
-        c = tc.Circuit(n)
-        for i in range(n):
-            c.H(i)
-        for i in range(n):
-            c.cnot(i, (i + 1) % n)
-        for i in range(n):
-            c.depolarizing(i, px=0.2, py=0.2, pz=0.2)
-        for i in range(n):
-            c.X(i)
-        return c.wavefunction()
+        return depolarized_layer(
+            key, lambda c, i: c.depolarizing(i, px=0.2, py=0.2, pz=0.2)
+        )
 
+    @cached_contractor
     @tc.backend.jit
     def f4(key):
-        n = 5
-        if key is not None:
-            tc.backend.set_random_state(key)
-        c = tc.Circuit(n)
-        for i in range(n):
-            c.H(i)
-        for i in range(n):
-            c.cnot(i, (i + 1) % n)
-        for i in range(n):
-            c.depolarizing2(i, px=0.2, py=0.2, pz=0.2)
-        for i in range(n):
-            c.X(i)
-        return c.wavefunction()
+        return depolarized_layer(
+            key, lambda c, i: c.depolarizing2(i, px=0.2, py=0.2, pz=0.2)
+        )
 
+    @cached_contractor
     @tc.backend.jit
     def f5(key):
-        n = 5
-        if key is not None:
-            tc.backend.set_random_state(key)
-        c = tc.Circuit(n)
-        for i in range(n):
-            c.H(i)
-        for i in range(n):
-            c.cnot(i, (i + 1) % n)
-        for i in range(n):
-            c.unitary_kraus2(
-                tc.channels.depolarizingchannel(0.2, 0.2, 0.2),
-                i,
-            )
-        for i in range(n):
-            c.X(i)
-        return c.wavefunction()
+        return depolarized_layer(key, lambda c, i: c.unitary_kraus2(kraus, i))
 
     for f in [f1, f2, f3, f4, f5]:
+        # norm traced into the same graph, only a scalar comes back to host
+        fnorm = tc.backend.jit(lambda key, f=f: tc.backend.norm(f(key)))
         if tc.backend.name == "tensorflow":
             import tensorflow as tf
 
-            np.testing.assert_allclose(tc.backend.norm(f(None)), 1.0, atol=1e-4)
-            np.testing.assert_allclose(
-                tc.backend.norm(f(tf.random.Generator.from_seed(23))), 1.0, atol=1e-4
-            )
-            np.testing.assert_allclose(
-                tc.backend.norm(f(tf.random.Generator.from_seed(24))), 1.0, atol=1e-4
-            )
-
+            keys = [
+                None,
+                tf.random.Generator.from_seed(23),
+                tf.random.Generator.from_seed(24),
+            ]
         elif tc.backend.name == "jax":
             import jax
 
-            np.testing.assert_allclose(
-                tc.backend.norm(f(jax.random.PRNGKey(23))), 1.0, atol=1e-4
-            )
-            np.testing.assert_allclose(
-                tc.backend.norm(f(jax.random.PRNGKey(24))), 1.0, atol=1e-4
-            )
+            keys = [jax.random.PRNGKey(23), jax.random.PRNGKey(24)]
+        for key in keys:
+            np.testing.assert_allclose(fnorm(key), 1.0, atol=1e-4)
 
 
 def test_expectation():
@@ -243,20 +264,14 @@ def test_exp1(backend):
     @partial(tc.backend.jit, jit_compile=True)
     def sf():
         c = tc.Circuit(2)
-        xx = np.array(
-            [[0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0], [1, 0, 0, 0]], dtype=np.complex64
-        )
-        c.exp1(0, 1, unitary=xx, theta=tc.num_to_tensor(0.2))
+        c.exp1(0, 1, unitary=_XX, theta=tc.num_to_tensor(0.2))
         s = c.state()
         return s
 
     @tc.backend.jit
     def s1f():
         c = tc.Circuit(2)
-        xx = np.array(
-            [[0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0], [1, 0, 0, 0]], dtype=np.complex64
-        )
-        c.exp(0, 1, unitary=xx, theta=tc.num_to_tensor(0.2))
+        c.exp(0, 1, unitary=_XX, theta=tc.num_to_tensor(0.2))
         s1 = c.state()
         return s1
 
@@ -316,32 +331,26 @@ def test_single_qubit():
     np.testing.assert_allclose(w, np.array([1, 1]) / np.sqrt(2), atol=1e-4)
 
 
-def test_expectation_between_two_states():
-    zp = np.array([1.0, 0.0])
-    zd = np.array([0.0, 1.0])
-    assert tc.expectation((tc.gates.y(), [0]), ket=zp, bra=zd) == 1j
-
+@pytest.mark.parametrize("theta, with_bra", [(0.8, True), (0.8 + 0.7j, False)])
+def test_expectation_normalization(theta, with_bra):
+    # complex theta leaves the state unnormalized
     c = tc.Circuit(3)
     c.H(0)
-    c.ry(1, theta=tc.num_to_tensor(0.8))
+    c.ry(1, theta=tc.num_to_tensor(theta))
     c.cnot(1, 2)
 
     state = c.wavefunction()
     x1z2 = [(tc.gates.x(), [0]), (tc.gates.z(), [1])]
-    e1 = c.expectation(*x1z2)
-    e2 = tc.expectation(*x1z2, ket=state, bra=state, normalization=True)
-    np.testing.assert_allclose(e2, e1)
+    e1 = c.expectation(*x1z2) / tc.backend.norm(state) ** 2
+    bra = state if with_bra else None
+    e2 = tc.expectation(*x1z2, ket=state, bra=bra, normalization=True)
+    np.testing.assert_allclose(e2, e1, atol=1e-6)
 
-    c = tc.Circuit(3)
-    c.H(0)
-    c.ry(1, theta=tc.num_to_tensor(0.8 + 0.7j))
-    c.cnot(1, 2)
 
-    state = c.wavefunction()
-    x1z2 = [(tc.gates.x(), [0]), (tc.gates.z(), [1])]
-    e1 = c.expectation(*x1z2) / tc.backend.norm(state) ** 2
-    e2 = tc.expectation(*x1z2, ket=state, normalization=True)
-    np.testing.assert_allclose(e2, e1)
+def test_expectation_between_two_states():
+    zp = np.array([1.0, 0.0])
+    zd = np.array([0.0, 1.0])
+    assert tc.expectation((tc.gates.y(), [0]), ket=zp, bra=zd) == 1j
 
     c = tc.Circuit(2)
     c.X(1)
@@ -397,8 +406,7 @@ def test_unitary():
     c = tc.Circuit(2, inputs=np.eye(4))
     c.X(0)
     c.Y(1)
-    answer = np.kron(tc.gates.x().tensor, tc.gates.y().tensor)
-    np.testing.assert_allclose(c.wavefunction().reshape([4, 4]), answer, atol=1e-4)
+    np.testing.assert_allclose(c.wavefunction().reshape([4, 4]), _KRON_XY, atol=1e-4)
 
 
 def test_expectation_ps():
@@ -413,23 +421,23 @@ def test_expectation_ps():
     np.testing.assert_allclose(r, 1, atol=1e-5)
 
 
-def test_probability():
-    for c_cls in [tc.Circuit, tc.DMCircuit]:
-        c = c_cls(2)
-        c.h(0)
-        c.h(1)
-        np.testing.assert_allclose(
-            c.probability(), np.array([1, 1, 1, 1]) / 4, atol=1e-5
-        )
+@pytest.mark.parametrize("c_cls", [tc.Circuit, tc.DMCircuit])
+def test_probability(c_cls):
+    c = c_cls(2)
+    c.h(0)
+    c.h(1)
+    np.testing.assert_allclose(c.probability(), np.full([4], 0.25), atol=1e-5)
 
 
 @pytest.mark.parametrize("backend", [lf("tfb"), lf("jaxb")])
 def test_dqas_type_circuit(backend):
     eye = tc.gates.i().tensor
-    x = tc.gates.x().tensor
-    y = tc.gates.y().tensor
-    z = tc.gates.z().tensor
+    # x, y, z stacked, so that each layer is one contraction over the three choices
+    xyz = tc.backend.stack(
+        [tc.gates.x().tensor, tc.gates.y().tensor, tc.gates.z().tensor]
+    )
 
+    @cached_contractor
     def f(params, structures):
         paramsc = tc.backend.cast(params, dtype="complex64")
         structuresc = tc.backend.softmax(structures, axis=-1)
@@ -441,23 +449,13 @@ def test_dqas_type_circuit(backend):
             for i in range(4):
                 c.cz(i, i + 1)
             for i in range(5):
+                # sum_k s_k (cos(p_k) I + sin(p_k) P_k)
+                s = structuresc[i, j]
+                p = paramsc[i, j]
                 c.any(
                     i,
-                    unitary=structuresc[i, j, 0]
-                    * (
-                        tc.backend.cos(paramsc[i, j, 0]) * eye
-                        + tc.backend.sin(paramsc[i, j, 0]) * x
-                    )
-                    + structuresc[i, j, 1]
-                    * (
-                        tc.backend.cos(paramsc[i, j, 1]) * eye
-                        + tc.backend.sin(paramsc[i, j, 1]) * y
-                    )
-                    + structuresc[i, j, 2]
-                    * (
-                        tc.backend.cos(paramsc[i, j, 2]) * eye
-                        + tc.backend.sin(paramsc[i, j, 2]) * z
-                    ),
+                    unitary=tc.backend.sum(s * tc.backend.cos(p)) * eye
+                    + tc.backend.einsum("k,kab->ab", s * tc.backend.sin(p), xyz),
                 )
         return tc.backend.real(c.expectation([tc.gates.z(), (2,)]))
 
@@ -494,22 +492,14 @@ def test_mixed_measurement_circuit(backend):
                 c.cnot(i, (i + 1) % n)
             for i in range(n):
                 c.rz(i, theta=params[j, i])
-        obs = []
-        for i in range(n):
-            obs.append(
-                [
-                    tc.gates.Gate(
-                        sum(
-                            [
-                                structuresc[i, k] * g.tensor
-                                for k, g in enumerate(tc.gates.pauli_gates)
-                            ]
-                        )
-                    ),
-                    (i,),
-                ]
-            )
-        loss = c.expectation(*obs, reuse=False)
+        # all single qubit observables in one contraction
+        us = tc.backend.einsum(
+            "ik,kab->iab", structuresc, tc.array_to_tensor(_PAULI_STACK)
+        )
+        obs = [[tc.gates.Gate(us[i]), (i,)] for i in range(n)]
+        # the product observable is sandwiched around the contracted state
+        # rather than around two copies of the whole circuit network
+        loss = c.expectation(*obs)
         return tc.backend.real(loss)
 
     # measure X0 to X3
@@ -711,6 +701,29 @@ def test_toqir():
     np.testing.assert_allclose(z3, 0.202728, atol=1e-5)
 
 
+def test_qir_store():
+    c = tc.Circuit(2)
+    c.H(0)
+    c.rx(1, theta=0.3)
+    c.cnot(0, 1)
+    qir = c.to_qir()
+    assert len(qir) == 3
+    assert qir.names == ["h", "rx", "cnot"]
+    assert qir[0]["gatef"].n == "h"
+    assert "parameters" not in qir[0]
+    assert qir[1]["parameters"] == {"theta": 0.3}
+    assert qir[-1]["index"] == (0, 1)
+    assert [d["name"] for d in reversed(qir)] == ["cnot", "rx", "h"]
+    assert [d["name"] for d in qir[1:]] == ["rx", "cnot"]
+    qir2 = list(qir) + qir
+    assert len(qir2) == 6
+    c.apply_general_gate(tc.gates.x(), 1, name="x")
+    assert "gatef" not in qir[-1]
+    assert qir[-1]["mpo"] is False
+    assert qir.max_index == 1
+    assert tc.Circuit.from_qir(qir2)._nqubits == 2
+
+
 def test_vis_tex():
     c = tc.Circuit(3)
     for i in range(3):
@@ -731,17 +744,28 @@ def test_debug_contract():
     n = 10
     d = 4
     try:
-        import cotengra  # pylint: disable=unused-import
+        import cotengra as ctg
 
     except ImportError:
         pytest.skip("cotengra is not installed")
+    try:
+        import kahypar  # pylint: disable=unused-import
+
+        methods = ["greedy", "kahypar"]
+    except ImportError:
+        methods = ["greedy"]
 
+    # custom_stateful builds a fresh optimizer from opt_conf for every contraction
     @tc.set_function_contractor(
         "custom_stateful",
-        optimizer=oem.RandomGreedy,
-        max_time=10,
-        max_repeats=64,
-        minimize="size",
+        optimizer=ctg.HyperOptimizer,
+        opt_conf={
+            "methods": methods,
+            "max_time": 10,
+            "max_repeats": 64,
+            "minimize": "flops",
+            "progbar": False,
+        },
         debug_level=2,
         contraction_info=True,
     )
@@ -767,11 +791,17 @@ def test_teleportation(backend):
         c.conditional_gate(r, [tc.gates.i(), tc.gates.x()], 1)
         return r, c.expectation([tc.gates.z(), [1]])
 
-    keys = []
-    for _ in range(6):
-        key, subkey = tc.backend.random_split(key)
-        keys.append(subkey)
-    rs = [f(k) for k in keys]
+    if tc.backend.name == "jax":
+        import jax
+
+        # all subkeys in one split and one batched trace instead of six dispatches
+        rs = zip(*tc.backend.vmap(f)(jax.random.split(key, 6)))
+    else:
+        keys = []
+        for _ in range(6):
+            key, subkey = tc.backend.random_split(key)
+            keys.append(subkey)
+        rs = [f(k) for k in keys]
     for r, e in rs:
         if tc.backend.numpy(r) > 0.5:
             np.testing.assert_allclose(e, -1, atol=1e-5)
@@ -795,22 +825,16 @@ def test_append_circuit(backend):
     c.prepend(c1)
     np.testing.assert_allclose(c.expectation_ps(z=[1]), -1.0)
 
+    c = tc.Circuit(2)
+    c.x(0)
+    c.append(c)
+    assert c.gate_count() == 2
+    np.testing.assert_allclose(c.expectation_ps(z=[0]), 1.0)
+
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
 def test_apply_mpo_gate(backend):
-    gate = tc.gates.multicontrol_gate(tc.gates._x_matrix, ctrl=[1, 0])
-    ans = np.array(
-        [
-            [1.0, 0, 0, 0, 0, 0, 0, 0],
-            [0, 1.0, 0, 0, 0, 0, 0, 0],
-            [0, 0, 1.0, 0, 0, 0, 0, 0],
-            [0, 0, 0, 1.0, 0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 1.0, 0, 0],
-            [0, 0, 0, 0, 1.0, 0, 0, 0],
-            [0, 0, 0, 0, 0, 0, 1.0, 0],
-            [0, 0, 0, 0, 0, 0, 0, 1.0],
-        ]
-    )
+    gate = mc_x_10()
     c = tc.Circuit(3)
     c.X(0)
     c.mpo(0, 1, 2, mpo=gate.copy())
@@ -819,23 +843,23 @@ def test_apply_mpo_gate(backend):
     c.X(1)
     c.mpo(0, 1, 2, mpo=gate.copy())
     np.testing.assert_allclose(c.expectation([tc.gates.z(), [2]]), 1, atol=1e-5)
-    np.testing.assert_allclose(gate.eval_matrix(), ans, atol=1e-5)
+    np.testing.assert_allclose(gate.eval_matrix(), _MC_X_10_MATRIX, atol=1e-5)
 
 
-def test_apply_multicontrol_gate():
-    c = tc.Circuit(3)
-    c.X(2)
-    c.multicontrol(0, 2, 1, ctrl=[0, 1], unitary=tc.gates._x_matrix)
-    np.testing.assert_allclose(c.expectation([tc.gates.z(), [1]]), -1, atol=1e-5)
-    c = tc.Circuit(3)
-    c.X(0)
-    c.multicontrol(0, 2, 1, ctrl=[0, 1], unitary=tc.gates._x_matrix)
-    np.testing.assert_allclose(c.expectation([tc.gates.z(), [1]]), 1, atol=1e-5)
-    c = tc.Circuit(4)
-    c.X(0)
-    c.X(2)
-    c.multicontrol(0, 1, 2, 3, ctrl=[1, 0], unitary=tc.gates.swap())
-    np.testing.assert_allclose(c.expectation([tc.gates.z(), [3]]), -1, atol=1e-5)
+@pytest.mark.parametrize(
+    "nq, flips, index, ctrl, unitary, zq, expected",
+    [
+        (3, [2], [0, 2, 1], [0, 1], tc.gates._x_matrix, 1, -1),
+        (3, [0], [0, 2, 1], [0, 1], tc.gates._x_matrix, 1, 1),
+        (4, [0, 2], [0, 1, 2, 3], [1, 0], tc.gates._swap_matrix, 3, -1),
+    ],
+)
+def test_apply_multicontrol_gate(nq, flips, index, ctrl, unitary, zq, expected):
+    c = tc.Circuit(nq)
+    for i in flips:
+        c.X(i)
+    c.multicontrol(*index, ctrl=ctrl, unitary=unitary)
+    np.testing.assert_allclose(c.expectation([tc.gates.z(), [zq]]), expected, atol=1e-5)
 
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
@@ -849,23 +873,76 @@ def test_circuit_quoperator(backend):
     c.H(1)
     c.multicontrol(0, 2, 1, ctrl=[1, 0], unitary=tc.gates.z())
     qo = c.quoperator()
-    np.testing.assert_allclose(qo.eval_matrix(), c.matrix(), atol=1e-5)
+    np.testing.assert_allclose(
+        cached_hq_contractor(qo.eval_matrix)(),
+        cached_hq_contractor(c.matrix)(),
+        atol=1e-5,
+    )
 
 
-@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
-def test_qir2qiskit(backend):
+@lru_cache(maxsize=None)
+def _jax_key(seed):
+    return tc.backend.get_random_state(seed)
+
+
+@pytest.fixture
+def rng_key(backend):
+    # jax keys are immutable, so one per session is shared across tests;
+    # tf and numpy generators are stateful and each test gets a fresh one
+    if tc.backend.name == "jax":
+        return _jax_key(42)
+    return tc.backend.get_random_state(42)
+
+
+@pytest.fixture(scope="module")
+def qiskit_env():
     try:
+        from qiskit import QuantumCircuit
         import qiskit.quantum_info as qi
-        from tensorcircuit.translation import perm_matrix
+        from qiskit.circuit.library.standard_gates import MCXGate, SwapGate
     except ImportError:
         pytest.skip("qiskit is not installed")
+    return SimpleNamespace(
+        QuantumCircuit=QuantumCircuit,
+        qi=qi,
+        MCXGate=MCXGate,
+        SwapGate=SwapGate,
+        zz=tc.gates._zz_matrix,
+    )
+
+
+@lru_cache(maxsize=8)
+def _reversed_qubit_axes(n):
+    return tuple(range(n - 1, -1, -1)) + tuple(range(2 * n - 1, n - 1, -1))
+
+
+def to_qiskit_order(u, n):
+    # same as perm_matrix(n) @ u @ perm_matrix(n), as an axis transpose
+    # instead of two dense 2^n x 2^n matmuls
+    u = np.reshape(u, [2] * (2 * n))
+    return np.reshape(np.transpose(u, _reversed_qubit_axes(n)), [2**n, 2**n])
+
 
+def test_perm_matrix():
+    from tensorcircuit.translation import perm_matrix
+
+    n = 5
+    p_mat = perm_matrix(n)
+    np.testing.assert_allclose(p_mat @ p_mat, np.eye(2**n))
+    u = np.random.uniform(size=[2**n, 2**n])
+    np.testing.assert_allclose(p_mat @ u @ p_mat, to_qiskit_order(u, n))
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_qir2qiskit(qiskit_env, backend):
+    qi, zz = qiskit_env.qi, qiskit_env.zz
+    # same angles under every backend parametrization
+    np.random.seed(0)
     n = 6
-    c = tc.Circuit(n, inputs=tc.array_to_tensor(np.eye(2**n)))
+    c = tc.Circuit(n, inputs=tc.backend.eye(2**n))
 
     for i in range(n):
         c.H(i)
-    zz = np.array([[1, 0, 0, 0], [0, -1, 0, 0], [0, 0, -1, 0], [0, 0, 0, 1]])
     for i in range(n):
         c.exp(
             i,
@@ -928,10 +1005,7 @@ def test_qir2qiskit(backend):
     c.orz(5, 3, theta=tc.array_to_tensor(np.random.uniform()))
 
     c.any(1, 3, unitary=tc.array_to_tensor(np.reshape(zz, [2, 2, 2, 2])))
-    gate = tc.gates.multicontrol_gate(
-        tc.array_to_tensor(tc.gates._x_matrix), ctrl=[1, 0]
-    )
-    c.mpo(0, 1, 2, mpo=gate.copy())
+    c.mpo(0, 1, 2, mpo=mc_x_10())
     c.multicontrol(
         0,
         2,
@@ -942,31 +1016,25 @@ def test_qir2qiskit(backend):
         unitary=tc.array_to_tensor(tc.gates._zz_matrix),
         name="zz",
     )
-    tc_unitary = c.wavefunction()
+    tc_unitary = cached_hq_contractor(c.wavefunction)()
     tc_unitary = np.reshape(tc_unitary, [2**n, 2**n])
 
     qisc = c.to_qiskit()
     qis_unitary = qi.Operator(qisc)
     qis_unitary = np.reshape(qis_unitary, [2**n, 2**n])
 
-    p_mat = perm_matrix(n)
-    np.testing.assert_allclose(p_mat @ tc_unitary @ p_mat, qis_unitary, atol=1e-5)
+    np.testing.assert_allclose(to_qiskit_order(tc_unitary, n), qis_unitary, atol=1e-5)
 
 
-def test_qiskit2tc():
-    try:
-        from qiskit import QuantumCircuit
-        import qiskit.quantum_info as qi
-        from qiskit.circuit.library.standard_gates import MCXGate, SwapGate
-        from tensorcircuit.translation import perm_matrix
-    except ImportError:
-        pytest.skip("qiskit is not installed")
+def test_qiskit2tc(qiskit_env):
+    qi = qiskit_env.qi
+    MCXGate, SwapGate = qiskit_env.MCXGate, qiskit_env.SwapGate
+    np.random.seed(0)
     n = 6
-    qisc = QuantumCircuit(n)
+    qisc = qiskit_env.QuantumCircuit(n)
     for i in range(n):
         qisc.h(i)
-    zz = np.array([[1, 0, 0, 0], [0, -1, 0, 0], [0, 0, -1, 0], [0, 0, 0, 1]])
-    exp_op = qi.Operator(zz)
+    exp_op = qi.Operator(qiskit_env.zz)
     for i in range(n):
         qisc.hamiltonian(exp_op, time=np.random.uniform(), qubits=[i, (i + 1) % n])
     qisc.fredkin(1, 2, 3)
@@ -1005,38 +1073,51 @@ def test_qiskit2tc():
     CCCRX = SwapGate().control(2, ctrl_state="01")
     qisc.append(CCCRX, [0, 1, 2, 3])
 
-    c = tc.Circuit.from_qiskit(qisc, n, np.eye(2**n))
+    c = tc.Circuit.from_qiskit(qisc, n, tc.backend.eye(2**n))
     tc_unitary = c.wavefunction()
     tc_unitary = np.reshape(tc_unitary, [2**n, 2**n])
     qis_unitary = qi.Operator(qisc)
     qis_unitary = np.reshape(qis_unitary, [2**n, 2**n])
-    p_mat = perm_matrix(n)
-    np.testing.assert_allclose(p_mat @ tc_unitary @ p_mat, qis_unitary, atol=1e-5)
+    np.testing.assert_allclose(to_qiskit_order(tc_unitary, n), qis_unitary, atol=1e-5)
 
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
-def test_batch_sample(backend):
-    c = tc.Circuit(3)
-    c.H(0)
-    c.cnot(0, 1)
-    print(c.sample())
-    print(c.sample(batch=8))
-    print(c.sample(random_generator=tc.backend.get_random_state(42)))
-    print(c.sample(allow_state=True))
-    print(c.sample(batch=8, allow_state=True))
-    print(
-        c.sample(
-            batch=8, allow_state=True, random_generator=tc.backend.get_random_state(42)
-        )
-    )
-    print(
-        c.sample(
-            batch=8,
-            allow_state=True,
-            status=np.random.uniform(size=[8]),
-            format="sample_bin",
+def test_batch_sample(backend, rng_key):
+    n = 3
+
+    def all_samples(key, status):
+        c = tc.Circuit(n)
+        c.H(0)
+        c.cnot(0, 1)
+        return (
+            c.sample(),
+            c.sample(batch=8),
+            c.sample(random_generator=key),
+            c.sample(allow_state=True),
+            c.sample(batch=8, allow_state=True),
+            c.sample(batch=8, allow_state=True, random_generator=key),
+            c.sample(batch=8, allow_state=True, status=status, format="sample_bin"),
         )
+
+    if tc.backend.name == "jax":
+        # all sampling modes traced into one graph instead of one dispatch each,
+        # tf cannot trace the list of (sample, prob) pairs of the format=None path
+        all_samples = tc.backend.jit(all_samples)
+    rs = all_samples(
+        rng_key, tc.array_to_tensor(np.random.uniform(size=[8]), dtype="float32")
     )
+    single = [rs[0], rs[2], rs[3]]
+    batched = [rs[1], rs[4], rs[5]]
+    for bs, prob in single:
+        assert tuple(bs.shape) == (n,)
+        assert 0 <= float(prob) <= 1 + 1e-5
+    for r in batched:
+        assert len(r) == 8
+        for bs, _ in r:
+            assert tuple(bs.shape) == (n,)
+            # only |000> and |110> are populated
+            assert bs[0] == bs[1] and bs[2] == 0
+    assert tuple(rs[6].shape) == (8, n)
 
 
 def test_expectation_y_bug():
@@ -1076,8 +1157,7 @@ def test_lightcone_expectation():
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
 def test_circuit_inverse(backend):
-    inputs = np.random.uniform(size=[8])
-    inputs /= np.linalg.norm(inputs)
+    inputs = _INPUTS_8
     c = tc.Circuit(3, inputs=inputs)
     c.H(1)
     c.rx(0, theta=0.5)
@@ -1090,7 +1170,7 @@ def test_circuit_inverse(backend):
 
 @pytest.mark.parametrize("backend", [lf("tfb"), lf("jaxb")])
 def test_jittable_amplitude(backend):
-    # @tc.backend.jit
+    @tc.backend.jit
     def amp(s):
         c = tc.Circuit(3)
         c.H(0)
@@ -1098,12 +1178,10 @@ def test_jittable_amplitude(backend):
         c.swap(1, 2)
         return c.amplitude(s)
 
-    np.testing.assert_allclose(
-        amp(tc.array_to_tensor([0, 1, 1], dtype="float32")), 0, atol=1e-5
-    )
-    np.testing.assert_allclose(
-        amp(tc.array_to_tensor([0, 0, 0], dtype="float32")), 1 / np.sqrt(2), atol=1e-5
-    )
+    # both bitstrings share shape and dtype, so the second call reuses the trace
+    s = tc.array_to_tensor(np.array([[0, 1, 1], [0, 0, 0]]), dtype="float32")
+    np.testing.assert_allclose(amp(s[0]), 0, atol=1e-5)
+    np.testing.assert_allclose(amp(s[1]), 1 / np.sqrt(2), atol=1e-5)
 
 
 def test_draw_cond_measure():
@@ -1129,7 +1207,7 @@ def test_minus_index():
 def test_sexpps(backend):
     c = tc.Circuit(1, inputs=1 / np.sqrt(2) * np.array([1.0, 1.0j]))
     y = c.sample_expectation_ps(y=[0])
-    ye = c.expectation_ps(y=[0])
+    ye = c.expectation_ps(y=[0], enable_lightcone=True)
     np.testing.assert_allclose(y, 1.0, atol=1e-5)
     np.testing.assert_allclose(ye, 1.0, atol=1e-5)
 
@@ -1144,41 +1222,44 @@ def test_sexpps(backend):
     c.s(1)
     c.td(2)
     y = c.sample_expectation_ps(x=[1], y=[0], z=[2, 3])
-    ye = c.expectation_ps(x=[1], y=[0], z=[2, 3])
+    ye = c.expectation_ps(x=[1], y=[0], z=[2, 3], enable_lightcone=True)
     np.testing.assert_allclose(ye, y, atol=1e-5)
     y2 = c.sample_expectation_ps(x=[1], y=[0], z=[2, 3], shots=81920)
     assert np.abs(y2 - y) < 0.01
 
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
-def test_sample_format(backend):
+def test_sample_format(backend, rng_key):
     c = tc.Circuit(2)
     c.H(0)
     c.cnot(0, 1)
-    key = tc.backend.get_random_state(42)
+    key = rng_key
     for allow_state in [False, True]:
-        print("allow_state: ", allow_state)
         for batch in [None, 1, 3]:
-            print("  batch: ", batch)
-            for format_ in [
-                None,
-                "sample_int",
-                "sample_bin",
-                "count_vector",
-                "count_tuple",
-                "count_dict_bin",
-                "count_dict_int",
-            ]:
-                print("    format: ", format_)
-                print(
-                    "      ",
-                    c.sample(
-                        batch=batch,
-                        allow_state=allow_state,
-                        format_=format_,
-                        random_generator=key,
-                    ),
-                )
+            shots = 1 if batch is None else batch
+            r = c.sample(batch=batch, allow_state=allow_state, random_generator=key)
+            if batch is None:
+                assert tuple(r[0].shape) == (2,)
+            else:
+                assert len(r) == batch
+            # draw the shots once, the other formats are only post-processing
+            # of the same integer samples
+            ch = c.sample(
+                batch=batch,
+                allow_state=allow_state,
+                format_="sample_int",
+                random_generator=key,
+            )
+            assert tuple(ch.shape) == (shots,)
+            sb = tc.quantum.sample2all(ch, 2, format="sample_bin", jittable=True)
+            assert tuple(sb.shape) == (shots, 2)
+            cv = tc.quantum.sample2all(ch, 2, format="count_vector", jittable=True)
+            assert tuple(cv.shape) == (4,)
+            assert int(tc.backend.sum(cv)) == shots
+            tc.quantum.sample2all(ch, 2, format="count_tuple", jittable=True)
+            for format_ in ["count_dict_bin", "count_dict_int"]:
+                d = tc.quantum.sample2all(ch, 2, format=format_, jittable=True)
+                assert sum(d.values()) == shots
 
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
@@ -1191,7 +1272,7 @@ def test_channel_auto_register(backend, highp):
 
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
-def test_circuit_to_json(backend):
+def test_circuit_to_json(backend, tmp_path):
     c = tc.Circuit(3)
     c.h(0)
     c.CNOT(1, 2)
@@ -1201,12 +1282,76 @@ def test_circuit_to_json(backend):
     c.toffoli(0, 2, 1)
     c.ccnot(0, 1, 2)
     c.multicontrol(1, 2, 0, ctrl=[0, 1], unitary=tc.gates._x_matrix)
+    # reference state contracted once for both round trips
+    state = c.state()
     s = c.to_json()
     c2 = tc.Circuit.from_json(s)
     print(c2.draw())
+    np.testing.assert_allclose(state, c2.state(), atol=1e-5)
+    file = str(tmp_path / "circuit.json")
+    assert c.to_json(file=file, simplified=True) == c.to_json(simplified=True)
+    c3 = tc.Circuit.from_json_file(file)
+    np.testing.assert_allclose(state, c3.state(), atol=1e-5)
+
+
+def test_from_qsim_file(tmp_path):
+    qsim = "3\n0 h 0\n0 h 1\n1 cz 0 1\n2 fs 1 2 0.5 0.3\n\n3 rx 2 0.7\n4 t 1\n"
+    file = str(tmp_path / "circuit.qsim")
+    with open(file, "w") as f:
+        f.write(qsim)
+    c = tc.Circuit.from_qsim_file(file)
+    assert c._nqubits == 3
+    assert c.gate_summary() == {
+        "h": 2,
+        "cz": 1,
+        "iswap": 1,
+        "cphase": 1,
+        "rx": 1,
+        "phase": 1,
+    }
+    c2 = tc.Circuit(3)
+    c2.h(0)
+    c2.h(1)
+    c2.cz(0, 1)
+    c2.iswap(1, 2, theta=-0.5)
+    c2.cphase(1, 2, theta=-0.3)
+    c2.rx(2, theta=0.7)
+    c2.phase(1, theta=np.pi / 4)
     np.testing.assert_allclose(c.state(), c2.state(), atol=1e-5)
 
 
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_circuit_to_json_soa(backend):
+    c = tc.Circuit(3)
+    c.h(0)
+    c.CNOT(1, 2)
+    c.rxx(0, 2, theta=0.3)
+    c.crx(0, 1, theta=-0.8)
+    c.r(1, theta=tc.backend.ones([]), alpha=0.2)
+    c.any(0, 2, unitary=tc.backend.eye(4), name="custom")
+    c.multicontrol(1, 2, 0, ctrl=[0, 1], unitary=tc.gates._x_matrix)
+    s = c.to_json_soa()
+    c2 = tc.Circuit.from_json_soa(s)
+    assert c2.to_qir().names == c.to_qir().names
+    np.testing.assert_allclose(c.state(), c2.state(), atol=1e-5)
+
+
+def test_circuit_to_json_soa_unsupported():
+    c = tc.Circuit(2)
+    c.rx(0, theta=0.2)
+    with pytest.raises(ValueError, match="rx"):
+        c.inverse().to_json_soa()
+    c.apply_general_gate(tc.gates.Gate(np.eye(4).reshape([2, 2, 2, 2])), 0, 1)
+    with pytest.raises(ValueError):
+        c.to_json_soa()
+    c = tc.Circuit(2)
+    c.rx(0, theta=0.2)
+    d = json.loads(c.to_json_soa())
+    d["gatefs"] = ["rxd"]
+    with pytest.raises(ValueError, match="rxd"):
+        tc.Circuit.from_json_soa(d)
+
+
 def test_gate_count():
     c = tc.Circuit(3)
     c.h(0)
@@ -1220,11 +1365,11 @@ def test_gate_count():
     assert c.gate_count(["h"]) == 2
     assert c.gate_count(["ccnot"]) == 3
     assert c.gate_count(["rx", "multicontrol"]) == 2
-    print(c.gate_summary())
-    # {'h': 2, 'rx': 1, 'multicontrol': 1, 'toffoli': 3}
+    assert c.gate_count(["h", "h"]) == 2
+    assert c.gate_summary() == {"h": 2, "rx": 1, "multicontrol": 1, "toffoli": 3}
 
 
-def test_to_openqasm():
+def test_to_openqasm(tmp_path):
     c = tc.Circuit(3)
     c.H(0)
     c.rz(2, theta=0.2)
@@ -1233,10 +1378,17 @@ def test_to_openqasm():
     c.ccx(1, 2, 0)
     c.u(2, theta=0.5, lbd=1.3)
     print(c.to_openqasm(formatted=True))
+    # reference state contracted once for both round trips
+    state = c.state()
     s = c.to_openqasm()
     c1 = tc.Circuit.from_openqasm(s)
     print(c1.draw())
-    np.testing.assert_allclose(c.state(), c1.state())
-    c.to_openqasm(filename="test.qasm")
-    c2 = tc.Circuit.from_openqasm_file("test.qasm")
-    np.testing.assert_allclose(c.state(), c2.state())
+    np.testing.assert_allclose(state, c1.state())
+    file = str(tmp_path / "test.qasm")
+    c.to_openqasm(filename=file)
+    c2 = tc.Circuit.from_openqasm_file(file)
+    np.testing.assert_allclose(state, c2.state())
+    c.x(1)
+    c3 = tc.Circuit.from_openqasm(c.to_openqasm())
+    np.testing.assert_allclose(c.state(), c3.state())
+    assert c3.gate_count() == c.gate_count()
@@ -2,7 +2,7 @@
 
 import os
 import sys
-from functools import partial
+from functools import lru_cache, partial
 import pytest
 from pytest_lazyfixture import lazy_fixture as lf
 from scipy import optimize
@@ -25,11 +25,9 @@ import numpy as np
 import tensorcircuit as tc
 
 
-@pytest.mark.skipif(is_torch is False, reason="torch not installed")
-@pytest.mark.parametrize("backend", [lf("tfb"), lf("jaxb")])
-def test_torch_interface(backend):
-    n = 4
-
+@lru_cache(maxsize=None)
+def _torch_circuit_fns(backend_name, n=4):
+    # traced once per backend, whichever test or rerun asks for them first
     def f(param):
         c = tc.Circuit(n)
         c = tc.templates.blocks.example_block(c, param)
@@ -39,7 +37,8 @@ def test_torch_interface(backend):
                 [
                     1,
                 ],
-            ]
+            ],
+            enable_lightcone=True,
         )
         return tc.backend.real(loss)
 
@@ -47,19 +46,10 @@ def test_torch_interface(backend):
 
     f_jit_torch = tc.interfaces.torch_interface(f_jit, enable_dlpack=True)
 
-    param = torch.ones([4, n], requires_grad=True)
-    l = f_jit_torch(param)
-    l = l**2
-    l.backward()
-
-    pg = param.grad
-    np.testing.assert_allclose(pg.shape, [4, n])
-    np.testing.assert_allclose(pg[0, 1], -2.146e-3, atol=1e-5)
-
     def f2(paramzz, paramx):
-        c = tc.Circuit(n)
-        for i in range(n):
-            c.H(i)
+        # the H layer on |0...0> is the uniform state, one input node
+        # instead of n product nodes and n H gates
+        c = tc.Circuit(n, inputs=tc.array_to_tensor(np.full([2**n], 2 ** (-n / 2))))
         for j in range(2):
             for i in range(n - 1):
                 c.exp1(i, i + 1, unitary=tc.gates._zz_matrix, theta=paramzz[j, i])
@@ -71,7 +61,8 @@ def test_torch_interface(backend):
                 [
                     1,
                 ],
-            ]
+            ],
+            enable_lightcone=True,
         )
         loss2 = c.expectation(
             [
@@ -79,11 +70,34 @@ def test_torch_interface(backend):
                 [
                     2,
                 ],
-            ]
+            ],
+            enable_lightcone=True,
         )
         return tc.backend.real(loss1), tc.backend.real(loss2)
 
     f2_torch = tc.interfaces.torch_interface(f2, jit=True, enable_dlpack=True)
+    return f_jit_torch, f2_torch
+
+
+@pytest.fixture
+def torch_circuit_fns(backend):
+    return _torch_circuit_fns(tc.backend.name)
+
+
+@pytest.mark.skipif(is_torch is False, reason="torch not installed")
+@pytest.mark.parametrize("backend", [lf("tfb"), lf("jaxb")])
+def test_torch_interface(backend, torch_circuit_fns):
+    n = 4
+    f_jit_torch, f2_torch = torch_circuit_fns
+
+    param = torch.ones([4, n], requires_grad=True)
+    l = f_jit_torch(param)
+    l = l**2
+    l.backward()
+
+    pg = param.grad
+    np.testing.assert_allclose(pg.shape, [4, n])
+    np.testing.assert_allclose(pg[0, 1], -2.146e-3, atol=1e-5)
 
     paramzz = torch.ones([2, n], requires_grad=True)
     paramx = torch.ones([2, n], requires_grad=True)
@@ -278,12 +292,25 @@ def test_args_transformation(backend):
         ans, target_backend="jax", dtype="float32"
     )
     print(ans1[1]["a"].dtype)
-    ans1 = tc.interfaces.numpy_args_to_backend(
-        ans,
+    dtype = ("complex64", {"a": "float32", "b": ["complex64"]})
+    ans1 = tc.interfaces.numpy_args_to_backend(ans, target_backend="jax", dtype=dtype)
+    print(ans1[1]["a"].dtype)
+    # the same conversion straight from the mixed backend pytree
+    ans2 = tc.interfaces.general_args_to_backend(
+        (
+            tc.backend.ones([2]),
+            {
+                "a": tc.get_backend("tensorflow").ones([]),
+                "b": [tc.get_backend("numpy").zeros([2, 1])],
+            },
+        ),
         target_backend="jax",
-        dtype=("complex64", {"a": "float32", "b": ["complex64"]}),
+        dtype=dtype,
+        enable_dlpack=False,
     )
-    print(ans1[1]["a"].dtype)
+    for a1, a2 in zip(jax.tree_util.tree_leaves(ans1), jax.tree_util.tree_leaves(ans2)):
+        assert a1.dtype == a2.dtype
+        np.testing.assert_allclose(a1, a2)
 
 
 @pytest.mark.parametrize("backend", [lf("tfb"), lf("jaxb"), lf("torchb")])
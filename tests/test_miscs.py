@@ -15,6 +15,7 @@ sys.path.insert(0, modulepath)
 import tensorcircuit as tc
 from tensorcircuit import experimental
 from tensorcircuit.quantum import PauliString2COO, PauliStringSum2COO
+from tensorcircuit.quantum import PauliStringSum2COO_tf
 from tensorcircuit.applications.vqes import construct_matrix_v2
 
 i, x, y, z = [t.tensor for t in tc.gates.pauli_gates]
@@ -49,6 +50,39 @@ def test_pss2coo(tfb):
     np.testing.assert_allclose(tc.backend.to_dense(r1), a, atol=1e-5)
 
 
+def test_pss2coo_numba(monkeypatch):
+    pytest.importorskip("numba")
+    ls = np.random.randint(0, 4, size=[20, 6])
+    w = np.random.normal(size=[20])
+    r1 = tc.quantum.PauliStringSum2COO_numpy(ls, w)
+    monkeypatch.setattr(tc.quantum, "_NUMBA_MIN_SIZE", 0)
+    r2 = tc.quantum.PauliStringSum2COO_numpy(ls, w)
+    assert r1.dtype == r2.dtype == np.complex64
+    np.testing.assert_allclose(r1.todense(), r2.todense(), atol=1e-5)
+
+
+def test_pss2coo_zero_weight():
+    ls = np.random.randint(0, 4, size=[6, 4])
+    w = np.array([0.5, 0.0, 1.0, 0.0, -2.0, 0.0])
+    r1 = tc.quantum.PauliStringSum2COO_numpy(ls, w)
+    r2 = tc.quantum.PauliStringSum2COO_numpy(ls[w != 0], w[w != 0])
+    assert r1.dtype == np.complex64
+    np.testing.assert_allclose(r1.todense(), r2.todense(), atol=1e-5)
+    r = tc.quantum.PauliStringSum2COO_numpy(ls, np.zeros([6]))
+    assert r.shape == (16, 16) and r.nnz == 0
+
+
+def test_pss2coo_tf(tfb):
+    l = [t[0] for t in check_pairs[:4]]
+    a = sum([t[1] for t in check_pairs[:4]])
+    r1 = PauliStringSum2COO_tf(tf.constant(l, dtype=tf.int64))
+    np.testing.assert_allclose(tf.sparse.to_dense(r1), a, atol=1e-5)
+    l = [t[0] for t in check_pairs[4:]]
+    r1 = PauliStringSum2COO_tf(tf.constant(l, dtype=tf.int64), weight=[0.5, 1])
+    a = check_pairs[4][1] * 0.5 + check_pairs[5][1] * 1.0
+    np.testing.assert_allclose(tf.sparse.to_dense(r1), a, atol=1e-5)
+
+
 def test_sparse(benchmark, tfb):
     def sparse(h):
         return PauliStringSum2COO(h)
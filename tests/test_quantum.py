@@ -1,6 +1,7 @@
 # pylint: disable=invalid-name
 
-from functools import partial
+from functools import partial, reduce
+from operator import matmul
 import os
 import sys
 
@@ -85,6 +86,18 @@ def test_checks(backend):
     with pytest.raises(ValueError):
         _ = qu.QuVector([node1[0], node1[1], node2[1]])
 
+    qu.set_check_network(False)
+    try:
+        _ = qu.QuVector([node1[0]])
+    finally:
+        qu.set_check_network(True)
+
+    with pytest.raises(ValueError):
+        qu.check_spaces([node1[0], node2[1]], [node2[1]])
+    node3 = tn.Node(np.random.rand(2, 3))
+    with pytest.raises(ValueError, match="subsystems 1"):
+        qu.check_spaces([node1[0], node2[1]], [node3[0], node3[1]])
+
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
 def test_from_tensor(backend):
@@ -114,6 +127,21 @@ def test_from_tensor(backend):
     assert not op.is_adjoint_vector()
     assert op.eval() == 1.0
 
+    op = qu.QuOperator.from_tensor_lazy(psi_tensor, [0], [1])
+    assert not op.is_scalar()
+    assert not op.is_vector()
+    assert op.in_space == (2,) and op.out_space == (2,)
+    op2 = op.copy()
+    assert op._out_edges is None and op2._out_edges is None
+    np.testing.assert_almost_equal(op.eval(), psi_tensor, decimal=decimal)
+    np.testing.assert_almost_equal(
+        (op2 @ qu.QuOperator.from_tensor_lazy(psi_tensor)).eval(),
+        psi_tensor @ psi_tensor,
+        decimal=decimal,
+    )
+    with pytest.raises(ValueError):
+        qu.QuOperator.from_tensor_lazy(psi_tensor, [0], [])
+
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
 def test_identity(backend):
@@ -128,6 +156,7 @@ def test_identity(backend):
     tensor = np.random.rand(2, 2)
     psi = qu.QuVector.from_tensor(tensor)
     E = qu.identity((2, 2), dtype=np.float64)
+    assert len((E @ psi).nodes) == len((psi.adjoint() @ E).nodes) == 1
     np.testing.assert_allclose((E @ psi).eval(), psi.eval(), atol=atol)
 
     np.testing.assert_allclose(
@@ -148,15 +177,132 @@ def test_tensor_product(backend):
     np.testing.assert_almost_equal(
         psi_psi.norm().eval(), psi.norm().eval() ** 2, decimal=decimal
     )
+    ops = [qu.QuOperator.from_tensor(np.random.rand(2, 2)) for _ in range(3)]
+    np.testing.assert_allclose(
+        qu.QuOperator.tensor_product_many(ops).eval(),
+        (ops[0] | ops[1] | ops[2]).eval(),
+        atol=atol,
+    )
 
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
 def test_matmul(backend):
     mat = np.random.rand(2, 2)
     op = qu.QuOperator.from_tensor(mat, [0], [1])
-    res = (op @ op).eval()
+    op2 = op @ op
+    assert op2.nodes is op2.nodes
+    assert len(op2.nodes) == 2
+    res = op2.eval()
+    assert len(op2.nodes) == 1
     np.testing.assert_allclose(res, mat @ mat, atol=atol)
 
+    qu.set_matmul_copy(False)
+    try:
+        op1 = qu.QuOperator.from_tensor(mat, [0], [1])
+        op2 = qu.QuOperator.from_tensor(mat, [0], [1])
+        op12 = op1 @ op2
+        assert op1.out_edges[0] is op12.out_edges[0]  # no copy
+        res = (op12 @ op12).eval()
+        np.testing.assert_allclose(res, mat @ mat @ mat @ mat, atol=atol)
+        op1 = qu.QuOperator.from_tensor(mat, [0], [1])
+        res = (op1 @ mat).eval()
+        np.testing.assert_allclose(res, mat @ mat, atol=atol)
+    finally:
+        qu.set_matmul_copy(True)
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_path_cache(backend, monkeypatch):
+    qu.QuOperator.clear_path_cache()
+    for _ in range(2):
+        mats = [np.random.rand(4, 4) for _ in range(6)]
+        ops = [qu.QuOperator.from_tensor(m.reshape([2, 2, 2, 2])) for m in mats]
+        res = reduce(matmul, ops).eval_matrix()
+        np.testing.assert_allclose(res, reduce(np.matmul, mats), atol=atol)
+        assert len(qu._PATH_CACHE) == 1
+    qu.QuOperator.clear_path_cache()
+    assert len(qu._PATH_CACHE) == 0
+
+    ops = [qu.QuOperator.from_tensor(m.reshape([2, 2, 2, 2])) for m in mats]
+    res = reduce(matmul, ops).eval(path=[(0, 1)] * 5)
+    np.testing.assert_allclose(
+        tc.backend.reshape(res, [4, 4]), reduce(np.matmul, mats), atol=atol
+    )
+    assert len(qu._PATH_CACHE) == 0
+    with pytest.raises(ValueError):
+        reduce(matmul, ops).eval(path=[(0, 1)] * 4)
+
+    monkeypatch.setattr(qu, "_PATH_CACHE_SIZE", 1)
+    for k in [5, 6]:
+        ops = [qu.QuOperator.from_tensor(m.reshape([2, 2, 2, 2])) for m in mats[:k]]
+        reduce(matmul, ops).eval_matrix()
+        assert len(qu._PATH_CACHE) == 1
+    qu.QuOperator.clear_path_cache()
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_tensordot_pair(backend):
+    a = np.random.rand(2, 3, 4)
+    b = np.random.rand(4, 5, 2)
+    r = qu.tensordot_pair(tc.backend.convert_to_tensor(a), b, [0, 2], [2, 0])
+    np.testing.assert_allclose(r, np.tensordot(a, b, [[0, 2], [2, 0]]), atol=atol)
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_eval_jit(backend):
+    psi_tensor = np.random.rand(2, 2, 2)
+    op_tensor = np.random.rand(2, 2)
+    for _ in range(2):
+        psi = qu.QuVector.from_tensor(psi_tensor)
+        op = qu.QuOperator.from_tensor(op_tensor, [0], [1])
+        op_3 = op.tensor_product(qu.identity((2, 2), dtype=psi_tensor.dtype))
+        res1 = (psi.adjoint() @ op_3 @ psi).eval(jit=True)
+        res2 = (psi.adjoint() @ op_3 @ psi).eval()
+        np.testing.assert_allclose(res1, res2, atol=atol)
+        res3 = (op_3 @ psi).eval(jit=True)
+        np.testing.assert_allclose(
+            res3, np.einsum("ab,bcd->acd", op_tensor, psi_tensor), atol=atol
+        )
+    assert len(qu._JIT_CORE_CACHE) >= 2
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_eval_dtype(backend):
+    psi_tensor = np.random.rand(2, 2, 2)
+    op_tensor = np.random.rand(2, 2)
+    psi = qu.QuVector.from_tensor(psi_tensor)
+    op = qu.QuOperator.from_tensor(op_tensor, [0], [1])
+    op_3 = op.tensor_product(qu.identity((2, 2), dtype=psi_tensor.dtype))
+    res = (op_3 @ psi).eval(dtype="complex64")
+    assert tc.backend.dtype(res) == "complex64"
+    np.testing.assert_allclose(
+        res, np.einsum("ab,bcd->acd", op_tensor, psi_tensor), atol=1e-5
+    )
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_specialize(backend):
+    fs = []
+    for _ in range(2):
+        psi_tensor = np.random.rand(2, 2, 2)
+        op_tensor = np.random.rand(2, 2)
+        psi = qu.QuVector.from_tensor(psi_tensor)
+        op = qu.QuOperator.from_tensor(op_tensor, [0], [1])
+        op_3 = op.tensor_product(qu.identity((2, 2), dtype=psi_tensor.dtype))
+        vec = op_3 @ psi
+        f, nodes = vec.specialize()
+        fs.append(f)
+        assert len(vec.nodes) == 4
+        np.testing.assert_allclose(
+            f(*[n.tensor for n in nodes]),
+            np.einsum("ab,bcd->acd", op_tensor, psi_tensor),
+            atol=atol,
+        )
+        exp = psi.adjoint() @ op_3 @ psi
+        f, nodes = exp.specialize()
+        np.testing.assert_allclose(f(*[n.tensor for n in nodes]), exp.eval(), atol=atol)
+    assert fs[0] is fs[1]
+
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
 def test_mul(backend):
@@ -204,6 +350,11 @@ def test_expectations(backend):
 
     np.testing.assert_almost_equal(res1, res2, decimal=decimal)
 
+    rho_2 = psi.projector().partial_trace([0, 2])
+    np.testing.assert_allclose(
+        psi.reduced_density([0, 2]).eval(), rho_2.eval(), atol=atol
+    )
+
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
 def test_projector(backend):
@@ -220,6 +371,8 @@ def test_projector(backend):
 def test_nonsquare_quop(backend):
     op = qu.QuOperator.from_tensor(np.ones([2, 2, 2, 2, 2]), [0, 1, 2], [3, 4])
     op2 = qu.QuOperator.from_tensor(np.ones([2, 2, 2, 2, 2]), [0, 1], [2, 3, 4])
+    assert op.out_space == (2, 2, 2)
+    assert op.in_space == op2.out_space == (2, 2)
     np.testing.assert_allclose(
         (op @ op2).eval(), 4 * np.ones([2, 2, 2, 2, 2, 2]), atol=atol
     )
@@ -281,6 +434,54 @@ def test_free_energy(backend):
     np.testing.assert_allclose(qu.renyi_free_energy(rho, h, 0.5), -1, atol=atol)
     hq = qu.QuOperator.from_tensor(h)
     np.testing.assert_allclose(qu.free_energy(rho, hq, 0.5), -1, atol=atol)
+    rho = tc.array_to_tensor(np.array([[0.5, 0], [0, 0.5]]))
+    h = tc.array_to_tensor(h)
+    np.testing.assert_allclose(qu.truncated_free_energy(rho, h, 0.5, 2), -1, atol=atol)
+    np.testing.assert_allclose(
+        qu.truncated_free_energy(rho, h, 0.5, 3), -1.25, atol=atol
+    )
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_fidelity(backend):
+    from scipy.linalg import sqrtm
+
+    rho = np.array([[0.7, 0.2 - 0.1j], [0.2 + 0.1j, 0.3]])
+    rho0 = np.array([[0.4, 0.1], [0.1, 0.6]])
+    rhosqrt = sqrtm(rho)
+    f = np.real(np.trace(sqrtm(rhosqrt @ rho0 @ rhosqrt))) ** 2
+    np.testing.assert_allclose(
+        qu.fidelity(tc.array_to_tensor(rho), tc.array_to_tensor(rho0)), f, atol=atol
+    )
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_gibbs_state(backend):
+    from scipy.linalg import expm
+
+    h = np.array([[1.0, 0.5 - 0.2j], [0.5 + 0.2j, -0.3]])
+    rho = expm(-0.7 * h)
+    np.testing.assert_allclose(
+        qu.gibbs_state(tc.array_to_tensor(h), 0.7), rho / np.trace(rho), atol=atol
+    )
+    state = expm(-0.35 * h).reshape([-1])
+    np.testing.assert_allclose(
+        qu.double_state(tc.array_to_tensor(h), 0.7),
+        state / np.linalg.norm(state),
+        atol=atol,
+    )
+
+
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_taylorlnm(backend):
+    x = np.array([[0.1, 0.05], [0.05, -0.2]])
+    for k in [1, 2, 5]:
+        ref = sum(
+            (-1) ** (i + 1) / i * np.linalg.matrix_power(x, i) for i in range(1, k + 1)
+        )
+        np.testing.assert_allclose(
+            qu.taylorlnm(tc.array_to_tensor(x), k), ref, atol=atol
+        )
 
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
@@ -320,6 +521,16 @@ def test_heisenberg_ham(tfb):
     np.testing.assert_allclose(e[0], -11.2111, atol=1e-4)
 
 
+@pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
+def test_generate_local_hamiltonian(backend):
+    x, z = tc.gates._x_matrix, tc.gates._z_matrix
+    for _ in range(2):
+        h = qu.generate_local_hamiltonian(x, z, x)
+        np.testing.assert_allclose(h, np.kron(np.kron(x, z), x), atol=atol)
+    h = qu.generate_local_hamiltonian(tc.backend.convert_to_tensor(z), x)
+    np.testing.assert_allclose(h, np.kron(z, x), atol=atol)
+
+
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
 def test_reduced_density_from_density(backend):
     n = 6
@@ -352,6 +563,15 @@ def test_mutual_information(backend):
     dm1 = tc.quantum.mutual_information(w, cut=[1, 2, 3])
     dm2 = tc.quantum.mutual_information(rho, cut=[1, 2, 3])
     np.testing.assert_allclose(dm1, dm2, atol=1e-5)
+    dm1 = tc.quantum.mutual_information(w, cut=[0])
+    dm2 = tc.quantum.mutual_information(rho, cut=[0])
+    np.testing.assert_allclose(dm1, dm2, atol=1e-5)
+    rho = 0.7 * rho + 0.3 * np.eye(2**n) / 2**n
+    h = tc.quantum.entropy
+    rdm = tc.quantum.reduced_density_matrix
+    dm1 = tc.quantum.mutual_information(rho, cut=[1, 3])
+    dm2 = h(rdm(rho, [1, 3])) + h(rdm(rho, [0, 2, 4])) - h(rho)
+    np.testing.assert_allclose(dm1, dm2, atol=1e-5)
 
 
 @pytest.mark.parametrize("backend", [lf("npb"), lf("tfb"), lf("jaxb")])
@@ -439,6 +659,8 @@ def test_measurement_results(backend):
             w, counts=c, format="count_vector", jittable=True
         )
         assert tc.backend.shape_tuple(r) == (2**n,)
+        if c > 0:
+            np.testing.assert_allclose(tc.backend.sum(r), c)
         print(r)
         r = tc.quantum.measurement_results(w, counts=c, format="count_tuple")
         print(r)
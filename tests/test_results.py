@@ -1,4 +1,6 @@
 import numpy as np
+import pytest
+import scipy.linalg as la
 
 import tensorcircuit as tc
 from tensorcircuit.results import counts
@@ -15,6 +17,7 @@ def test_marginal_count():
 
 def test_count2vec():
     assert counts.vec2count(counts.count2vec(d, normalization=False), prune=True) == d
+    assert counts.vec2count(counts.count2vec(d), prune=True, shots=9) == d
 
 
 def test_kl():
@@ -67,3 +70,126 @@ def test_readout():
 
     assert counts.kl_divergence(idea_count2, mit_count1) < 0.05
     assert counts.kl_divergence(idea_count2, mit_count2) < 0.05
+    assert mit.get_matrix().dtype == np.float32
+    # a list of counts is mitigated one by one
+    for method, mit_count in [("inverse", mit_count1), ("square", mit_count2)]:
+        mit_counts = mit.apply_correction(
+            [raw_count, raw_count], [1, 3, 2], method=method
+        )
+        assert mit_counts == [mit_count, mit_count]
+
+    mit.cals_from_system([0, 1, 2, 3], shots=10000, method="global")
+    mit_count3 = mit.apply_correction(raw_count, [1, 3, 2], method="inverse")
+    assert counts.kl_divergence(idea_count2, mit_count3) < 0.05
+
+
+def _local_mit(nqubits, dtype="float64", shots=10000):
+    """
+    A ``ReadoutMit`` locally calibrated on qubits ``0, ..., nqubits - 1`` by
+    ``cals_from_system``, whose counts flip each qubit with an exact 1% to 8% rate
+    """
+    flips = np.random.randint(shots // 100, shots // 12, size=[nqubits, 2])
+
+    def run(cs, shots):
+        ts = []
+        for c in cs:
+            ideal = format(int(np.argmax(np.abs(c.state()))), "0%sb" % nqubits)
+            count = {ideal: shots}
+            for i, b in enumerate(ideal):
+                f = int(flips[i, int(b)])
+                count[ideal[:i] + str(1 - int(b)) + ideal[i + 1 :]] = f
+                count[ideal] -= f
+            ts.append(count)
+        return ts
+
+    mit = ReadoutMit(execute=run, dtype=dtype)
+    mit.cals_from_system(nqubits, shots=shots, method="local")
+    return mit
+
+
+def test_readout_local_matrix():
+    mit = _local_mit(4)
+    m = mit.get_matrix([2, 0, 3])
+    m0 = np.kron(
+        np.kron(mit.single_qubit_cals[2], mit.single_qubit_cals[0]),
+        mit.single_qubit_cals[3],
+    )
+    np.testing.assert_allclose(m, m0, atol=1e-8)
+
+
+def test_readout_local_apply():
+    mit = _local_mit(4)
+    mit.use_qubits = [2, 0, 3]
+    p = np.random.uniform(size=[8])
+    p /= np.sum(p)
+    m = mit.get_matrix()
+    np.testing.assert_allclose(mit._apply_local(p), m @ p, atol=1e-8)
+    np.testing.assert_allclose(
+        mit.mitigate_probability(p), np.linalg.inv(m) @ p, atol=1e-8
+    )
+    np.testing.assert_allclose(mit._apply_local(p, transpose=True), m.T @ p, atol=1e-8)
+    q = mit.mitigate_probability(p, method="square")
+    np.testing.assert_allclose(np.sum(q), 1.0, atol=1e-8)
+    assert np.all(q >= 0)
+
+
+def test_readout_reduced_inverse():
+    pytest.importorskip("mthree")
+    mit = _local_mit(4)
+    mit.use_qubits = [2, 0, 3]
+    p = np.random.uniform(size=[8])
+    p /= np.sum(p)
+    np.testing.assert_allclose(
+        mit.mitigate_probability(p, distance=3), mit.mitigate_probability(p), atol=1e-8
+    )
+
+    # truncated to the observed bitstrings within Hamming distance 1 of each other
+    mit.use_qubits = [3, 1, 0, 2]
+    obs = np.array([0, 1, 3, 6, 12, 15])
+    p = np.zeros([16])
+    p[obs] = np.random.uniform(size=[len(obs)])
+    p /= np.sum(p)
+    hamming = np.array([[bin(i ^ j).count("1") for j in obs] for i in obs])
+    a = mit.get_matrix()[np.ix_(obs, obs)] * (hamming <= 1)
+    q = np.zeros([16])
+    q[obs] = la.solve(a / np.sum(a, axis=0), p[obs])
+    np.testing.assert_allclose(mit.mitigate_probability(p, distance=1), q, atol=1e-8)
+
+
+def test_readout_local_matrix_numba(monkeypatch):
+    pytest.importorskip("numba")
+    from tensorcircuit.results import readout_mitigation
+
+    mit = _local_mit(5)
+    m0 = mit.get_matrix([4, 1, 3])
+    monkeypatch.setattr(readout_mitigation, "_NUMBA_MIN_QUBITS", 0)
+    mit._matrix_cache = {}
+    np.testing.assert_allclose(mit.get_matrix([4, 1, 3]), m0, atol=1e-8)
+
+
+def test_readout_iterative_cache(monkeypatch):
+    pytest.importorskip("mthree")
+    from tensorcircuit.results import readout_mitigation
+
+    mit = _local_mit(4)
+    monkeypatch.setattr(readout_mitigation, "_MATVEC_CACHE_SIZE", 2)
+    raw = [
+        {"0000": 500, "1111": 480, "0001": 20},
+        {"0000": 300, "1100": 280, "0100": 20, "1000": 30},
+        {"0110": 100, "1001": 90, "0010": 10},
+    ]
+    r0 = mit.apply_correction(raw[0], [0, 1, 2, 3], method="Max3")
+    for count in raw[1:]:
+        mit.apply_correction(count, [0, 1, 2, 3], method="Max3")
+    assert len(mit._matvec_cache) == 2
+    # the same support with different counts gives the same result as a cold start
+    mit.apply_correction(
+        {"0000": 400, "1111": 580, "0001": 20}, [0, 1, 2, 3], method="Max3"
+    )
+    r1 = mit.apply_correction(raw[0], [0, 1, 2, 3], method="Max3")
+    assert r0 == r1
+    # batches with repeated supports are reproducible under the thread pool
+    batch = raw + [{"0000": 400, "1111": 580, "0001": 20}, raw[1]]
+    r2 = mit.apply_correction(batch, [0, 1, 2, 3], method="Max3")
+    r3 = mit.apply_correction(batch, [0, 1, 2, 3], method="Max3")
+    assert r2 == r3